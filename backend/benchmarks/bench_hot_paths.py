@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for hot pure-Python paths, with a committed baseline and a regression gate.
+
+Each benchmark runs one function over a fixed synthetic input batch (same seed,
+same documents every run) and reports the fastest time per call. Times are also
+stored relative to a fixed pure-Python calibration loop measured in the same
+run; `compare` gates on that relative figure by default, so a baseline recorded
+on one machine is still meaningful on another (use --absolute on the same box).
+
+Usage:
+  cd backend && python benchmarks/bench_hot_paths.py run [--only college_helper]
+  python benchmarks/bench_hot_paths.py save           # rewrite benchmarks/baselines/hot_paths.json
+  python benchmarks/bench_hot_paths.py compare [--tolerance 0.25] [--absolute]   # exit 1 on regression
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+from bson import ObjectId
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).resolve().parent / 'baselines' / 'hot_paths.json'
+sys.path.insert(0, str(BACKEND_DIR))
+# server.py reads these at import time; the Motor client does not connect until first use
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'benchmark')
+
+import server  # noqa: E402
+from recommendation_engine import RecommendationEngine  # noqa: E402
+
+STATES = [('Maharashtra', 'Pune'), ('Tamil Nadu', 'Chennai'), ('West Bengal', 'Kolkata'),
+          ('Rajasthan', 'Jaipur'), ('Karnataka', 'Bengaluru'), ('Delhi', 'New Delhi')]
+COURSES = ['Computer Science', 'Electronics', 'Mechanical Engineering', 'Civil Engineering',
+           'Information Technology', 'Data Science', 'Chemical Engineering', 'Biotechnology']
+BATCH = 200  # documents / calls per timed loop
+
+
+def make_import_row(rng: random.Random, i: int) -> Dict[str, Any]:
+    """A sparse bulk-import row, the input _fill_defaults_for_college sees"""
+    state, city = rng.choice(STATES)
+    row: Dict[str, Any] = {'name': f'Synthetic Institute {i}', 'city': city, 'state': state}
+    if rng.random() < 0.5:
+        row['annual_fees'] = rng.randint(80000, 400000)
+        row['courses_offered'] = rng.sample(COURSES, k=rng.randint(2, 5))
+    if rng.random() < 0.3:
+        row['placement_percentage'] = round(rng.uniform(50, 98), 1)
+    return row
+
+
+def make_college(rng: random.Random, i: int) -> Dict[str, Any]:
+    """A stored college document as college_helper and the recommendation engine see it"""
+    doc = server._fill_defaults_for_college({
+        **make_import_row(rng, i),
+        'star_rating': round(rng.uniform(2.5, 5.0), 1),
+        'placement_stats': [
+            {'year': 2023, 'avg_package': 900000, 'median_package': 800000, 'placement_percentage': 88.0},
+            {'year': 2022, 'avg_package': 850000, 'median_package': 760000, 'placement_percentage': 86.0},
+        ],
+        'recruiters': ['Google', 'Microsoft', 'Amazon', 'Infosys'],
+    })
+    doc['_id'] = ObjectId(f'{i:024x}')
+    doc['created_at'] = datetime(2024, 1, 1)
+    doc['version'] = 3
+    # Review aggregate as create_review maintains it; college_helper summarizes review_stats into every card
+    doc['review_version'] = 12
+    doc['reviews_updated_at'] = datetime(2024, 6, 1)
+    doc['review_stats'] = {
+        'count': 12,
+        'overall': {'count': 12, 'sum': 50.5, 'hist': {'3': 2, '4': 6, '5': 4}},
+        'academics': {'count': 12, 'sum': 48.0, 'hist': {'4': 12}},
+    }
+    return doc
+
+
+def make_preferences(rng: random.Random) -> Dict[str, Any]:
+    return {
+        'academicPercentage': 85.0,
+        'preferredCourses': rng.sample(COURSES, k=2),
+        'budgetRange': {'min': 0, 'max': rng.choice([200000, 500000, 1000000])},
+        'preferredStates': [rng.choice(STATES)[0]],
+        'preferredCities': [rng.choice(STATES)[1]],
+        'universityTypes': ['Private'],
+        'minRating': 3.5,
+        'placementPriority': 5,
+        'feesPriority': 3,
+        'rankingPriority': 3,
+        'entranceExams': ['JEE Main'],
+    }
+
+
+def make_history(rng: random.Random, colleges: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    now_ms = time.time() * 1000
+    return [{
+        'collegeId': str(rng.choice(colleges)['_id']),
+        'action': rng.choice(['view', 'view', 'favorite', 'compare']),
+        'duration': rng.randint(5, 400),
+        'timestamp': now_ms - rng.randint(0, 14 * 24 * 3600 * 1000),
+    } for _ in range(20)]
+
+
+SEARCH_PARAMS = [
+    {'q': 'Institute'},
+    {'state': 'Maharashtra', 'max_fees': 300000, 'sort': 'fees_low'},
+    {'city': 'Pune', 'min_rating': 4.0, 'courses': 'Computer Science,Electronics', 'hostel': True, 'wifi': True},
+    {'q': 'Data', 'min_fees': 100000, 'max_fees': 500000, 'min_rating': 3.5, 'max_rating': 5.0,
+     'ranking_from': 1, 'ranking_to': 200, 'accreditation': 'NAAC A++,NBA', 'university_type': 'Private',
+     'min_placement': 80, 'min_avg_package': 600000, 'sort': 'ranking'},
+]
+
+
+def build_benchmarks(seed: int) -> Dict[str, Callable[[], Any]]:
+    """name -> zero-argument callable that processes one BATCH of fixed inputs"""
+    rng = random.Random(seed)
+    rows = [make_import_row(rng, i) for i in range(BATCH)]
+    colleges = [make_college(rng, i) for i in range(BATCH)]
+    helped = [server.college_helper(c) for c in colleges]  # the engine scores helper output
+    prefs = make_preferences(rng)
+    history = make_history(rng, colleges)
+    searches = [SEARCH_PARAMS[i % len(SEARCH_PARAMS)] for i in range(BATCH)]
+    engine = RecommendationEngine()
+
+    def fill_defaults():
+        random.seed(seed)  # the function draws random defaults; keep the draws identical
+        for row in rows:
+            server._fill_defaults_for_college(row)
+
+    return {
+        'college_helper': lambda: [server.college_helper(c) for c in colleges],
+        'fill_defaults_for_college': fill_defaults,
+        'build_search_query': lambda: [server._build_search_query(**p) for p in searches],
+        'calculate_college_score': lambda: [engine._calculate_college_score(c, prefs, history) for c in helped],
+        'get_match_reasons': lambda: [engine._get_match_reasons(c, prefs) for c in helped],
+    }
+
+
+def calibration() -> int:
+    """Fixed interpreter workload (dict/list/str churn) used to normalize timings across machines"""
+    total = 0
+    for i in range(BATCH * 20):
+        d = {'a': i, 'b': str(i), 'c': [i, i + 1]}
+        total += len(d['b']) + d['c'][1]
+    return total
+
+
+def _loops_for(fn: Callable[[], Any], min_time: float) -> int:
+    """Smallest power-of-two loop count whose run lasts at least min_time"""
+    fn()  # warm-up (regex cache, lazy imports)
+    loops = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(loops):
+            fn()
+        if time.perf_counter() - start >= min_time:
+            return loops
+        loops *= 2
+
+
+def _time_run(fn: Callable[[], Any], loops: int) -> float:
+    start = time.perf_counter()
+    for _ in range(loops):
+        fn()
+    return (time.perf_counter() - start) / (loops * BATCH) * 1e9
+
+
+def measure(fn: Callable[[], Any], repeat: int, min_time: float) -> Tuple[float, float, float]:
+    """
+    (ns per call, calibration ns per call, relative) for one benchmark.
+
+    Benchmark and calibration runs alternate so both see the same machine state;
+    ns figures are the fastest run (interference only ever adds time) and the
+    relative figure is the median of the paired ratios.
+    """
+    fn_loops, cal_loops = _loops_for(fn, min_time), _loops_for(calibration, min_time)
+    fn_samples, cal_samples = [], []
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            cal_samples.append(_time_run(calibration, cal_loops))
+            fn_samples.append(_time_run(fn, fn_loops))
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    ratio = statistics.median(f / c for f, c in zip(fn_samples, cal_samples))
+    return min(fn_samples), min(cal_samples), ratio
+
+
+def run_all(args) -> Dict[str, Any]:
+    benchmarks = build_benchmarks(args.seed)
+    if args.only:
+        unknown = set(args.only) - set(benchmarks)
+        if unknown:
+            raise SystemExit(f"Unknown benchmark(s): {', '.join(sorted(unknown))}; choose from {', '.join(benchmarks)}")
+        benchmarks = {name: benchmarks[name] for name in args.only}
+    results = {}
+    calibrations = []
+    for name, fn in benchmarks.items():
+        ns, calibration_ns, relative = measure(fn, args.repeat, args.min_time)
+        calibrations.append(calibration_ns)
+        results[name] = {'ns_per_call': round(ns, 1), 'relative': round(relative, 4)}
+    return {
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}',
+        'seed': args.seed,
+        'calibration_ns': round(min(calibrations), 1),
+        'benchmarks': results,
+    }
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float, absolute: bool) -> Tuple[List[str], List[str]]:
+    """Returns (report lines, regressions)"""
+    key = 'ns_per_call' if absolute else 'relative'
+    lines, regressions = [], []
+    lines.append(f"{'benchmark':<26} {'baseline':>12} {'current':>12} {'change':>8}  ({key})")
+    for name, result in current['benchmarks'].items():
+        before = baseline.get('benchmarks', {}).get(name)
+        if not before:
+            lines.append(f"{name:<26} {'-':>12} {result[key]:>12} {'new':>8}")
+            continue
+        change = result[key] / before[key] - 1 if before[key] else 0.0
+        flag = ''
+        if change > tolerance:
+            flag = '  REGRESSION'
+            regressions.append(f"{name}: {change:+.1%} (tolerance {tolerance:.0%})")
+        lines.append(f"{name:<26} {before[key]:>12} {result[key]:>12} {change:>+8.1%}{flag}")
+    return lines, regressions
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('command', choices=['run', 'save', 'compare'])
+    ap.add_argument('--only', nargs='+', help='Benchmark names to run')
+    ap.add_argument('--repeat', type=int, default=11)
+    ap.add_argument('--min-time', type=float, default=0.02, help='Seconds per timed run')
+    ap.add_argument('--seed', type=int, default=42)
+    ap.add_argument('--baseline', default=str(BASELINE_PATH))
+    ap.add_argument('--tolerance', type=float, default=0.25, help='Allowed slowdown as a fraction (0.25 = 25%%)')
+    ap.add_argument('--absolute', action='store_true', help='Compare raw ns/call instead of calibration-relative time')
+    args = ap.parse_args()
+
+    current = run_all(args)
+    if args.command == 'run':
+        print(json.dumps(current, indent=2))
+        return
+    if args.command == 'save':
+        if args.only and os.path.exists(args.baseline):
+            # Partial save: only overwrite the benchmarks that were run
+            with open(args.baseline, encoding='utf-8') as f:
+                merged = json.load(f)
+            merged['benchmarks'].update(current['benchmarks'])
+            current = {**merged, **{k: v for k, v in current.items() if k != 'benchmarks'}}
+        Path(args.baseline).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            f.write(json.dumps(current, indent=2) + '\n')
+        print(f"Saved baseline to {args.baseline}")
+        return
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    lines, regressions = compare(current, baseline, args.tolerance, args.absolute)
+    print('\n'.join(lines))
+    if regressions:
+        print('\n'.join(f"REGRESSION {r}" for r in regressions), file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
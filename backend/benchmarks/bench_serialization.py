@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Serialization benchmark: validated response_model path vs trusted orjson path.
+
+"before" mirrors what a handler returning CollegeSearchResponse costs:
+college_helper -> CollegeResponse(**...) -> response_model re-validation ->
+JSON-mode dump -> json.dumps. "after" is the fast path used by the handlers:
+college_helper -> FastJSONResponse (orjson).
+
+Usage:
+  cd backend && python benchmarks/bench_serialization.py [--items 20 100] [--repeat 200] [--json]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from bson import ObjectId
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+# server.py reads these at import time; the Motor client does not connect until first use
+os.environ.setdefault('MONGO_URL', 'mongodb://localhost:27017')
+os.environ.setdefault('DB_NAME', 'benchmark')
+
+from pydantic import TypeAdapter  # noqa: E402
+import server  # noqa: E402
+
+
+def make_college(rng: random.Random) -> dict:
+    doc = server._fill_defaults_for_college({
+        'name': f"Synthetic Institute {rng.randint(1, 10**6)}",
+        'city': rng.choice(['Pune', 'Chennai', 'Kolkata', 'Jaipur']),
+        'state': rng.choice(['Maharashtra', 'Tamil Nadu', 'West Bengal', 'Rajasthan']),
+        'placement_stats': [
+            {'year': 2023, 'avg_package': 900000, 'median_package': 800000, 'placement_percentage': 88.0},
+            {'year': 2022, 'avg_package': 850000, 'median_package': 760000, 'placement_percentage': 86.0},
+        ],
+        'recruiters': ['Google', 'Microsoft', 'Amazon', 'Infosys'],
+    })
+    doc['_id'] = ObjectId()
+    doc['created_at'] = datetime.utcnow()
+    return doc
+
+
+def before(docs: list) -> bytes:
+    models = [server.CollegeResponse(**server.college_helper(d)) for d in docs]
+    resp = server.CollegeSearchResponse(colleges=models, total=len(docs), page=1, limit=len(docs), total_pages=1)
+    adapter = TypeAdapter(server.CollegeSearchResponse)
+    value = adapter.validate_python(resp.model_dump())
+    content = adapter.dump_python(value, mode='json')
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, separators=(',', ':')).encode('utf-8')
+
+
+def after(docs: list) -> bytes:
+    payload = {
+        'colleges': [server.college_helper(d) for d in docs],
+        'total': len(docs), 'page': 1, 'limit': len(docs), 'total_pages': 1,
+    }
+    return server.FastJSONResponse(payload).body
+
+
+def time_per_item(fn, docs: list, repeat: int) -> float:
+    fn(docs)  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn(docs)
+    return (time.perf_counter() - start) / (repeat * len(docs)) * 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser()
+    ap.add_argument('--items', type=int, nargs='+', default=[20, 100])
+    ap.add_argument('--repeat', type=int, default=200)
+    ap.add_argument('--seed', type=int, default=42)
+    ap.add_argument('--json', action='store_true', help='Print results as JSON')
+    args = ap.parse_args()
+
+    rng = random.Random(args.seed)
+    results = []
+    for n in args.items:
+        docs = [make_college(rng) for _ in range(n)]
+        b = time_per_item(before, docs, args.repeat)
+        a = time_per_item(after, docs, args.repeat)
+        results.append({'items': n, 'before_us_per_item': round(b, 2), 'after_us_per_item': round(a, 2), 'speedup': round(b / a, 2)})
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    print(f"{'items':>6} {'before µs/item':>15} {'after µs/item':>14} {'speedup':>8}")
+    for r in results:
+        print(f"{r['items']:>6} {r['before_us_per_item']:>15} {r['after_us_per_item']:>14} {r['speedup']:>7}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,341 @@
+#!/usr/bin/env python3
+"""
+HTTP load test: replays a weighted mix of app traffic against a running server.
+
+Each virtual user loops over requests drawn from the route mix (keyword search,
+filtered search with deep pages, college detail, favorites, compare,
+recommendations, cutoff queries). Users start linearly over --ramp-up seconds;
+samples that complete during ramp-up and --warmup are not counted. The report
+is JSON with throughput, status counts and p50/p95/p99 latency per route.
+
+With --baseline, p95 per route is compared against a previous report and the
+exit status is 1 when any route is slower by more than --tolerance.
+
+Usage:
+  cd backend && python benchmarks/load_test.py --base-url http://localhost:8000 \\
+      --concurrency 50 --ramp-up 10 --duration 60 --out load-report.json
+  python benchmarks/load_test.py --mix search_keyword=5,college_detail=5 --requests 2000
+  python benchmarks/load_test.py --baseline load-report.json --tolerance 0.2
+"""
+import argparse
+import asyncio
+import json
+import math
+import random
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import httpx
+
+# route -> relative weight; names double as report keys
+DEFAULT_MIX = {
+    "search_keyword": 20,
+    "search_filtered": 15,
+    "search_deep_page": 5,
+    "college_detail": 25,
+    "favorites_add": 4,
+    "favorites_list": 6,
+    "compare": 5,
+    "recommendations_quick": 5,
+    "recommendations": 1,
+    "cutoffs_list": 8,
+    "cutoffs_predict": 6,
+}
+SORTS = ["relevance", "ranking", "fees_low", "fees_high", "rating_high"]
+FALLBACK_EXAMS = ["JEE Main"]
+FALLBACK_COURSES = ["Computer Science", "Electronics", "Mechanical Engineering"]
+
+# (method, path, query params, json body)
+RequestSpec = Tuple[str, str, Optional[Dict[str, Any]], Optional[Any]]
+
+
+class TrafficModel:
+    """Builds requests from catalog data sampled from the server before the run."""
+
+    def __init__(self, colleges: List[Dict[str, Any]], cutoff_options: Dict[str, Any], users: int, seed: int):
+        if not colleges:
+            raise SystemExit("No colleges returned by the server; seed data first (POST /api/init-data)")
+        self.rng = random.Random(seed)
+        self.ids = [c["id"] for c in colleges]
+        self.names = [c.get("name", "") for c in colleges]
+        self.cities = sorted({c["city"] for c in colleges if c.get("city")})
+        self.states = sorted({c["state"] for c in colleges if c.get("state")})
+        self.courses = sorted({course for c in colleges for course in c.get("courses_offered") or []}) or FALLBACK_COURSES
+        self.exams = cutoff_options.get("exams") or FALLBACK_EXAMS
+        self.categories = cutoff_options.get("categories") or ["GEN"]
+        self.users = [f"load-user-{i}" for i in range(users)]
+        # Popular colleges get most of the detail/compare traffic
+        self.weights = [1.0 / (i + 1) for i in range(len(self.ids))]
+
+    def college(self) -> str:
+        return self.rng.choices(self.ids, weights=self.weights)[0]
+
+    def search_keyword(self) -> RequestSpec:
+        words = [w for w in self.rng.choice(self.names).split() if len(w) > 3] or self.cities or ["college"]
+        return "GET", "/api/colleges/search", {"q": self.rng.choice(words)}, None
+
+    def _filters(self) -> Dict[str, Any]:
+        params: Dict[str, Any] = {"sort": self.rng.choice(SORTS), "limit": 20}
+        if self.states and self.rng.random() < 0.6:
+            params["state"] = self.rng.choice(self.states)
+        if self.rng.random() < 0.5:
+            params["max_fees"] = self.rng.choice([100000, 200000, 500000, 1000000])
+        if self.rng.random() < 0.4:
+            params["min_rating"] = self.rng.choice([3.0, 3.5, 4.0])
+        if self.rng.random() < 0.3:
+            params["courses"] = self.rng.choice(self.courses)
+        if self.rng.random() < 0.2:
+            params["hostel"] = "true"
+        return params
+
+    def search_filtered(self) -> RequestSpec:
+        return "GET", "/api/colleges/search", {**self._filters(), "page": self.rng.randint(1, 3)}, None
+
+    def search_deep_page(self) -> RequestSpec:
+        return "GET", "/api/colleges/search", {**self._filters(), "page": self.rng.randint(10, 200)}, None
+
+    def college_detail(self) -> RequestSpec:
+        return "GET", f"/api/colleges/{self.college()}", None, None
+
+    def favorites_add(self) -> RequestSpec:
+        return "POST", "/api/favorites", None, {"user_id": self.rng.choice(self.users), "college_id": self.college()}
+
+    def favorites_list(self) -> RequestSpec:
+        return "GET", f"/api/favorites/{self.rng.choice(self.users)}", None, None
+
+    def compare(self) -> RequestSpec:
+        ids = list({self.college() for _ in range(self.rng.randint(2, 4))})
+        while len(ids) < 2:
+            ids.append(self.rng.choice(self.ids))
+        return "POST", "/api/compare/colleges", None, ids
+
+    def recommendations_quick(self) -> RequestSpec:
+        params = {"preferred_courses": self.rng.sample(self.courses, k=min(2, len(self.courses))),
+                  "budget_max": self.rng.choice([200000, 500000, 1000000])}
+        if self.states and self.rng.random() < 0.5:
+            params["preferred_state"] = self.rng.choice(self.states)
+        return "POST", "/api/recommendations/quick", params, None
+
+    def recommendations(self) -> RequestSpec:
+        # Same shape as the preferences-setup screen sends
+        body = {
+            "user_id": self.rng.choice(self.users),
+            "preferences": {
+                "preferredCourses": self.rng.sample(self.courses, k=min(2, len(self.courses))),
+                "budgetRange": {"min": 0, "max": self.rng.choice([300000, 800000, 1500000])},
+                "preferredStates": [self.rng.choice(self.states)] if self.states else [],
+                "universityTypes": [],
+                "minRating": self.rng.choice([0, 3, 4]),
+                "placementPriority": self.rng.randint(1, 5),
+                "feesPriority": self.rng.randint(1, 5),
+                "rankingPriority": self.rng.randint(1, 5),
+                "entranceExams": [self.rng.choice(self.exams)],
+            },
+            "browsing_history": [{"collegeId": self.college(), "action": "view", "duration": self.rng.randint(5, 120)}
+                                 for _ in range(self.rng.randint(0, 5))],
+            "limit": 10,
+        }
+        return "POST", "/api/recommendations", None, body
+
+    def cutoffs_list(self) -> RequestSpec:
+        params: Dict[str, Any] = {"college_id": self.college()}
+        if self.rng.random() < 0.5:
+            params["exam"] = self.rng.choice(self.exams)
+        if self.rng.random() < 0.5:
+            params["category"] = self.rng.choice(self.categories)
+        return "GET", "/api/cutoffs", params, None
+
+    def cutoffs_predict(self) -> RequestSpec:
+        params = {"rank": int(self.rng.lognormvariate(9, 1.2)) + 1, "exam": self.rng.choice(self.exams)}
+        if self.rng.random() < 0.5:
+            params["category"] = self.rng.choice(self.categories)
+        return "GET", "/api/cutoffs/predict", params, None
+
+
+class Stats:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = {}
+        self.statuses: Dict[str, Dict[str, int]] = {}
+        self.bytes: Dict[str, int] = {}
+
+    def record(self, route: str, seconds: float, status: str, size: int) -> None:
+        self.latencies.setdefault(route, []).append(seconds)
+        counts = self.statuses.setdefault(route, {})
+        counts[status] = counts.get(status, 0) + 1
+        self.bytes[route] = self.bytes.get(route, 0) + size
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def summarize(latencies: List[float], statuses: Dict[str, int], size: int, seconds: float) -> Dict[str, Any]:
+    values = sorted(latencies)
+    count = len(values)
+    errors = sum(n for status, n in statuses.items() if not status.startswith(("2", "3")))
+    ms = lambda v: round(v * 1000, 2)  # noqa: E731
+    return {
+        "requests": count,
+        "errors": errors,
+        "rps": round(count / seconds, 1) if seconds > 0 else 0.0,
+        "status": dict(sorted(statuses.items())),
+        "mean_ms": ms(sum(values) / count) if count else 0.0,
+        "p50_ms": ms(percentile(values, 50)),
+        "p95_ms": ms(percentile(values, 95)),
+        "p99_ms": ms(percentile(values, 99)),
+        "max_ms": ms(values[-1]) if values else 0.0,
+        "avg_bytes": round(size / count) if count else 0,
+    }
+
+
+async def discover(client: httpx.AsyncClient, sample: int) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """Sample real college ids/attributes and cutoff facets to parameterize requests"""
+    colleges: List[Dict[str, Any]] = []
+    page = 1
+    while len(colleges) < sample:
+        resp = await client.get("/api/colleges/search", params={"sort": "ranking", "limit": 100, "page": page})
+        resp.raise_for_status()
+        batch = resp.json().get("colleges", [])
+        colleges.extend(batch)
+        if len(batch) < 100:
+            break
+        page += 1
+    options: Dict[str, Any] = {}
+    resp = await client.get("/api/cutoffs/options")
+    if resp.status_code == 200:
+        options = resp.json()
+    return colleges[:sample], options
+
+
+async def run(args, mix: Dict[str, float]) -> Dict[str, Any]:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, timeout=args.timeout, limits=limits) as client:
+        colleges, options = await discover(client, args.sample_colleges)
+        model = TrafficModel(colleges, options, args.users, args.seed)
+        routes = list(mix)
+        weights = [mix[r] for r in routes]
+        builders: Dict[str, Callable[[], RequestSpec]] = {r: getattr(model, r) for r in routes}
+
+        stats = Stats()
+        started = time.monotonic()
+        measure_from = started + args.ramp_up + args.warmup
+        deadline = measure_from + args.duration if args.duration else None
+        remaining = [args.requests] if args.requests else None
+
+        def more() -> bool:
+            if remaining is not None:
+                if remaining[0] <= 0:
+                    return False
+                remaining[0] -= 1
+            return deadline is None or time.monotonic() < deadline
+
+        async def user(index: int) -> None:
+            await asyncio.sleep(args.ramp_up * index / max(args.concurrency, 1))
+            rng = random.Random(args.seed * 1000 + index)
+            while more():
+                route = rng.choices(routes, weights=weights)[0]
+                method, path, params, body = builders[route]()
+                t0 = time.perf_counter()
+                try:
+                    resp = await client.request(method, path, params=params, json=body)
+                    status, size = str(resp.status_code), len(resp.content)
+                except httpx.HTTPError as e:
+                    status, size = type(e).__name__, 0
+                elapsed = time.perf_counter() - t0
+                if time.monotonic() >= measure_from or remaining is not None:
+                    stats.record(route, elapsed, status, size)
+                if args.think_time:
+                    await asyncio.sleep(rng.expovariate(1.0 / args.think_time))
+
+        await asyncio.gather(*(user(i) for i in range(args.concurrency)))
+        measured = time.monotonic() - (started if remaining is not None else measure_from)
+
+    all_latencies = [v for values in stats.latencies.values() for v in values]
+    all_statuses: Dict[str, int] = {}
+    for counts in stats.statuses.values():
+        for status, n in counts.items():
+            all_statuses[status] = all_statuses.get(status, 0) + n
+    return {
+        "config": {
+            "base_url": args.base_url, "concurrency": args.concurrency, "ramp_up": args.ramp_up,
+            "warmup": args.warmup, "duration": args.duration, "requests": args.requests,
+            "think_time": args.think_time, "seed": args.seed, "mix": mix, "sampled_colleges": len(colleges),
+        },
+        "seconds": round(measured, 2),
+        "total": summarize(all_latencies, all_statuses, sum(stats.bytes.values()), measured),
+        "routes": {
+            route: summarize(stats.latencies[route], stats.statuses[route], stats.bytes[route], measured)
+            for route in sorted(stats.latencies)
+        },
+    }
+
+
+def compare_to_baseline(report: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> List[str]:
+    """Routes whose p95 grew by more than `tolerance` (fraction) over the baseline"""
+    regressions = []
+    for route, current in report["routes"].items():
+        before = baseline.get("routes", {}).get(route)
+        if not before or not before.get("p95_ms"):
+            continue
+        limit = before["p95_ms"] * (1 + tolerance)
+        if current["p95_ms"] > limit:
+            regressions.append(f"{route}: p95 {current['p95_ms']}ms > {before['p95_ms']}ms baseline (+{tolerance:.0%})")
+    return regressions
+
+
+def parse_mix(text: Optional[str]) -> Dict[str, float]:
+    if not text:
+        return dict(DEFAULT_MIX)
+    mix: Dict[str, float] = {}
+    for part in text.split(","):
+        name, _, weight = part.partition("=")
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise SystemExit(f"Unknown route {name!r}; choose from {', '.join(DEFAULT_MIX)}")
+        mix[name] = float(weight or 1)
+    return mix
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--base-url', default='http://localhost:8000')
+    ap.add_argument('--concurrency', type=int, default=20, help='Virtual users (concurrent connections)')
+    ap.add_argument('--ramp-up', type=float, default=5.0, help='Seconds over which users start')
+    ap.add_argument('--warmup', type=float, default=0.0, help='Extra seconds after ramp-up before recording')
+    ap.add_argument('--duration', type=float, default=30.0, help='Measured seconds (ignored with --requests)')
+    ap.add_argument('--requests', type=int, default=0, help='Stop after this many requests instead of --duration')
+    ap.add_argument('--think-time', type=float, default=0.0, help='Mean pause between a user\'s requests (seconds)')
+    ap.add_argument('--mix', help=f'route=weight,... (default: {",".join(f"{k}={v}" for k, v in DEFAULT_MIX.items())})')
+    ap.add_argument('--users', type=int, default=1000, help='Distinct user ids for favorites/recommendations')
+    ap.add_argument('--sample-colleges', type=int, default=500, help='Colleges fetched up front to build requests')
+    ap.add_argument('--timeout', type=float, default=30.0)
+    ap.add_argument('--seed', type=int, default=7)
+    ap.add_argument('--out', help='Also write the JSON report to this file')
+    ap.add_argument('--baseline', help='Previous report; exit 1 when a route\'s p95 regresses beyond --tolerance')
+    ap.add_argument('--tolerance', type=float, default=0.2)
+    args = ap.parse_args()
+    if args.requests:
+        args.duration = 0
+
+    report = asyncio.run(run(args, parse_mix(args.mix)))
+    text = json.dumps(report, indent=2)
+    print(text)
+    if args.out:
+        with open(args.out, 'w', encoding='utf-8') as f:
+            f.write(text + '\n')
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            regressions = compare_to_baseline(report, json.load(f), args.tolerance)
+        for line in regressions:
+            print(f"REGRESSION {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,128 @@
+import numpy as np
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple, Hashable
+
+# (key, label, higher_is_better)
+COMPARISON_METRICS = [
+    ('ranking', 'Ranking', False),
+    ('annual_fees', 'Annual Fees', False),
+    ('average_package', 'Avg Package', True),
+    ('highest_package', 'Highest Package', True),
+    ('placement_percentage', 'Placement %', True),
+    ('star_rating', 'Rating', True),
+]
+
+
+def _to_list(arr: np.ndarray) -> List[Optional[float]]:
+    """Convert a float array to a JSON-friendly list (NaN -> None)"""
+    return [None if np.isnan(v) else float(v) for v in arr]
+
+
+def build_comparison_matrix(colleges: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build a normalized comparison matrix for a set of colleges.
+
+    All metrics are computed in one vectorized pass over a (metrics x colleges)
+    array. Normalized values are in [0, 1] with 1.0 always meaning "best in row",
+    regardless of whether the metric is better high (packages) or low (fees).
+    """
+    college_ids = [c.get('id') for c in colleges]
+    if not colleges:
+        return {'college_ids': [], 'metrics': [], 'overall': []}
+
+    values = np.array(
+        [[c.get(key) if c.get(key) is not None else np.nan for c in colleges] for key, _, _ in COMPARISON_METRICS],
+        dtype=float,
+    )
+    higher = np.array([hib for _, _, hib in COMPARISON_METRICS])
+    present = ~np.isnan(values)
+    has_any = present.any(axis=1)
+
+    # Fill missing values so reductions stay warning-free; they are masked again below
+    filled_low = np.where(present, values, np.inf)
+    filled_high = np.where(present, values, -np.inf)
+    row_min = np.where(has_any, filled_low.min(axis=1), np.nan)
+    row_max = np.where(has_any, filled_high.max(axis=1), np.nan)
+    span = row_max - row_min
+
+    with np.errstate(invalid='ignore', divide='ignore'):
+        scaled = (values - row_min[:, None]) / span[:, None]
+    # Rows where every college has the same value are a tie on 1.0
+    scaled = np.where((span == 0)[:, None] & present, 1.0, scaled)
+    normalized = np.where(higher[:, None], scaled, 1.0 - scaled)
+    normalized = np.where(present, normalized, np.nan)
+
+    best_value = np.where(higher, row_max, row_min)
+    is_best = present & (values == best_value[:, None])
+    delta = np.where(present, values - best_value[:, None], np.nan)
+
+    with np.errstate(invalid='ignore'):
+        counts = present.sum(axis=0)
+        overall = np.where(counts > 0, np.nansum(normalized, axis=0) / np.maximum(counts, 1), np.nan)
+
+    metrics = []
+    for i, (key, label, hib) in enumerate(COMPARISON_METRICS):
+        metrics.append({
+            'key': key,
+            'label': label,
+            'higher_is_better': hib,
+            'values': _to_list(values[i]),
+            'normalized': _to_list(np.round(normalized[i], 4)),
+            'best': [bool(b) for b in is_best[i]],
+            'best_value': None if np.isnan(best_value[i]) else float(best_value[i]),
+            'delta_from_best': _to_list(delta[i]),
+        })
+
+    return {
+        'college_ids': college_ids,
+        'metrics': metrics,
+        'overall': _to_list(np.round(overall, 4)),
+    }
+
+
+def select_comparison_columns(matrix: Dict[str, Any], positions: List[int], college_ids: List[str]) -> Dict[str, Any]:
+    """
+    Reorder (or subset) the college columns of a matrix, relabelling them with `college_ids`.
+
+    Row-wide figures (best_value) stay as computed over the full set, so a cached
+    matrix keyed by the sorted id set can be served in any request order.
+    """
+    def pick(column: List[Any]) -> List[Any]:
+        return [column[i] for i in positions]
+
+    return {
+        'college_ids': list(college_ids),
+        'metrics': [
+            {**m, 'values': pick(m['values']), 'normalized': pick(m['normalized']),
+             'best': pick(m['best']), 'delta_from_best': pick(m['delta_from_best'])}
+            for m in matrix['metrics']
+        ],
+        'overall': pick(matrix['overall']),
+    }
+
+
+class ComparisonCache:
+    """Small in-process LRU cache for comparison payloads"""
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._items: 'OrderedDict[Hashable, Dict[str, Any]]' = OrderedDict()
+
+    @staticmethod
+    def make_key(college_ids: List[str], catalog_version: int, reviews_version: int = 0) -> Tuple[Tuple[str, ...], int, int]:
+        return (tuple(sorted(set(college_ids))), catalog_version, reviews_version)
+
+    def get(self, key: Hashable) -> Optional[Dict[str, Any]]:
+        item = self._items.get(key)
+        if item is not None:
+            self._items.move_to_end(key)
+        return item
+
+    def set(self, key: Hashable, value: Dict[str, Any]) -> None:
+        self._items[key] = value
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self) -> None:
+        self._items.clear()
@@ -0,0 +1,268 @@
+import heapq
+import math
+from bisect import bisect_left, bisect_right
+from itertools import islice
+from typing import List, Dict, Any, Iterator, Optional, Set, Tuple
+
+# (exam, category, branch, year)
+RankKey = Tuple[str, Optional[str], str, int]
+# (exam, category, year): the keys one prediction looks at
+GroupKey = Tuple[str, Optional[str], int]
+
+
+class CutoffRankIndex:
+    """
+    In-memory sorted closing-rank arrays per (exam, category, branch, year).
+
+    "Which colleges can I get with rank R?" becomes a binary search: every entry
+    at or after bisect_left(ranks, R) has a closing rank >= R, i.e. admitted
+    candidates were ranked at least as low as R. Each array holds one entry per
+    college, its most lenient round, so the qualifying tails of the arrays
+    merge straight into the result order and a prediction stops at `limit`.
+    """
+
+    def __init__(self):
+        self.version: Optional[int] = None  # cutoffs catalog version the arrays reflect
+        self.colleges_version: Optional[int] = None  # colleges catalog version college_ids reflects
+        self.college_ids: Optional[Set[str]] = None  # rows of other colleges are left out (None: keep all)
+        self._ranks: Dict[RankKey, List[int]] = {}
+        self._entries: Dict[RankKey, List[Tuple[str, Optional[int]]]] = {}  # (college_id, round)
+        self._best: Dict[RankKey, Dict[str, int]] = {}  # college_id -> closing rank held in the arrays
+        self._groups: Dict[GroupKey, Set[RankKey]] = {}
+        self._categories: Dict[Tuple[str, int], Set[Optional[str]]] = {}  # (exam, year) -> categories
+
+    @staticmethod
+    def key_for(row: Dict[str, Any]) -> Optional[RankKey]:
+        if row.get('closing_rank') is None or not row.get('exam') or not row.get('branch') or row.get('year') is None:
+            return None
+        return (row['exam'], row.get('category'), row['branch'], int(row['year']))
+
+    def _register(self, key: RankKey) -> None:
+        exam, category, _, year = key
+        self._groups.setdefault((exam, category, year), set()).add(key)
+        self._categories.setdefault((exam, year), set()).add(category)
+
+    def load(
+        self, rows: List[Dict[str, Any]], version: int,
+        college_ids: Optional[Set[str]] = None, colleges_version: Optional[int] = None,
+    ) -> None:
+        """Rebuild every array from scratch"""
+        self.college_ids = college_ids
+        grouped: Dict[RankKey, Dict[str, Tuple[int, Optional[int]]]] = {}
+        for row in rows:
+            key = self.key_for(row)
+            college_id = str(row.get('college_id'))
+            if key is None or (college_ids is not None and college_id not in college_ids):
+                continue
+            by_college = grouped.setdefault(key, {})
+            rank = int(row['closing_rank'])
+            if college_id not in by_college or rank > by_college[college_id][0]:
+                by_college[college_id] = (rank, row.get('round'))
+        self._ranks, self._entries, self._best, self._groups, self._categories = {}, {}, {}, {}, {}
+        for key, by_college in grouped.items():
+            items = sorted(by_college.items(), key=lambda item: item[1][0])
+            self._ranks[key] = [rank for _, (rank, _) in items]
+            self._entries[key] = [(cid, rnd) for cid, (_, rnd) in items]
+            self._best[key] = {cid: rank for cid, (rank, _) in items}
+            self._register(key)
+        self.version = version
+        self.colleges_version = colleges_version
+
+    def add(self, row: Dict[str, Any]) -> None:
+        key = self.key_for(row)
+        college_id = str(row.get('college_id'))
+        if key is None or (self.college_ids is not None and college_id not in self.college_ids):
+            return
+        rank = int(row['closing_rank'])
+        ranks = self._ranks.setdefault(key, [])
+        entries = self._entries.setdefault(key, [])
+        best = self._best.setdefault(key, {})
+        previous = best.get(college_id)
+        if previous is not None:
+            if previous >= rank:
+                return  # a more lenient round is already indexed
+            pos = bisect_left(ranks, previous)
+            while entries[pos][0] != college_id:
+                pos += 1
+            del ranks[pos], entries[pos]
+        pos = bisect_right(ranks, rank)
+        ranks.insert(pos, rank)
+        entries.insert(pos, (college_id, row.get('round')))
+        best[college_id] = rank
+        self._register(key)
+
+    def apply(self, rows: List[Dict[str, Any]], from_version: int, to_version: int) -> bool:
+        """
+        Incrementally add freshly inserted rows. Only valid when the arrays were in
+        sync right before this write; otherwise another writer got in between and
+        the index is left stale so the next read rebuilds it.
+        """
+        if self.version != from_version:
+            return False
+        for row in rows:
+            self.add(row)
+        self.version = to_version
+        return True
+
+    def latest_year(self, exam: str, category: Optional[str] = None) -> Optional[int]:
+        """Latest year with cutoffs for the exam (and category, when given)"""
+        years = [year for (e, year), categories in self._categories.items()
+                 if e == exam and (category is None or category in categories)]
+        return max(years) if years else None
+
+    def _tail(self, key: RankKey, order: int, start: int) -> Iterator[Tuple[int, int, int]]:
+        ranks = self._ranks[key]
+        for i in range(start, len(ranks)):
+            yield ranks[i], order, i
+
+    def predict(
+        self,
+        rank: int,
+        exam: str,
+        category: Optional[str] = None,
+        branch: Optional[str] = None,
+        year: Optional[int] = None,
+        limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Colleges/branches whose closing rank is >= `rank`, most selective first.
+        Rounds collapse to the most lenient one; category None means any category.
+        Cost is one binary search per matching array plus `limit` merge steps.
+        """
+        if year is None:
+            year = self.latest_year(exam, category)
+        if year is None:
+            return {'year': None, 'total': 0, 'results': []}
+
+        categories = [category] if category is not None else self._categories.get((exam, year), ())
+        keys = sorted(
+            (key for cat in categories for key in self._groups.get((exam, cat, year), ()) if branch is None or key[2] == branch),
+            key=lambda key: (key[1] or '', key[2]),
+        )
+        total = 0
+        tails = []
+        for order, key in enumerate(keys):
+            start = bisect_left(self._ranks[key], rank)
+            total += len(self._ranks[key]) - start
+            tails.append(self._tail(key, order, start))
+
+        results = []
+        for closing_rank, order, i in islice(heapq.merge(*tails), limit):
+            key = keys[order]
+            college_id, rnd = self._entries[key][i]
+            results.append({
+                'college_id': college_id, 'category': key[1], 'branch': key[2],
+                'closing_rank': closing_rank, 'round': rnd, 'margin': closing_rank - rank,
+            })
+        return {'year': year, 'total': total, 'results': results}
+
+
+def trend_key(row: Dict[str, Any]) -> Tuple[str, str, Optional[str], str]:
+    """(college_id, exam, category, branch) identifying one trend series"""
+    return (str(row.get('college_id')), row.get('exam'), row.get('category'), row.get('branch'))
+
+
+def merge_trend_series(series: List[Dict[str, Any]], rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Fold new cutoff rows into a (year, round) series; a newer row for the same point replaces the old one"""
+    points = {(p['year'], p.get('round')): p for p in series}
+    for row in rows:
+        if row.get('closing_rank') is None or row.get('year') is None:
+            continue
+        point = {'year': int(row['year']), 'round': row.get('round'), 'closing_rank': int(row['closing_rank'])}
+        points[(point['year'], point['round'])] = point
+    return sorted(points.values(), key=lambda p: (p['year'], p['round'] if p['round'] is not None else 0))
+
+
+def summarize_trend(series: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Year-over-year view of a closing-rank series.
+
+    Each year is represented by its last round. A negative delta means the
+    closing rank dropped, i.e. admission got harder. Volatility is the
+    coefficient of variation of the yearly closing ranks.
+    """
+    final_by_year: Dict[int, Dict[str, Any]] = {}
+    for point in series:  # series is sorted, so the last round of a year wins
+        final_by_year[point['year']] = point
+
+    yearly = []
+    previous = None
+    for year in sorted(final_by_year):
+        rank = final_by_year[year]['closing_rank']
+        entry = {'year': year, 'round': final_by_year[year].get('round'), 'closing_rank': rank, 'delta': None, 'delta_pct': None}
+        if previous is not None:
+            entry['delta'] = rank - previous
+            entry['delta_pct'] = round((rank - previous) / previous * 100, 2) if previous else None
+        yearly.append(entry)
+        previous = rank
+
+    ranks = [y['closing_rank'] for y in yearly]
+    volatility = None
+    if len(ranks) >= 2:
+        mean = sum(ranks) / len(ranks)
+        variance = sum((r - mean) ** 2 for r in ranks) / len(ranks)
+        volatility = round(variance ** 0.5 / mean, 4) if mean else None
+
+    direction = 'stable'
+    if len(yearly) >= 2 and yearly[-1]['delta']:
+        direction = 'harder' if yearly[-1]['delta'] < 0 else 'easier'
+
+    return {
+        'yearly': yearly,
+        'latest_closing_rank': ranks[-1] if ranks else None,
+        'volatility': volatility,
+        'direction': direction,
+    }
+
+
+def competitiveness_score(closing_rank: int, intake: int) -> float:
+    """
+    0-100 score, higher is more competitive.
+
+    Driven mainly by selectivity (a lower closing rank), with a smaller scarcity
+    term so that, at the same closing rank, fewer seats rank higher. Logs keep
+    the scale usable across ranks from 1 to 10^6.
+    """
+    return round(100.0 / (1.0 + math.log10(max(closing_rank, 1)) + 0.25 * math.log10(max(intake, 1))), 2)
+
+
+def join_competitiveness(seats: List[Dict[str, Any]], cutoffs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Join seat intake to final-round closing rank per (college, year, branch, category, exam).
+
+    Seat rows without a category are treated as total intake and used when no
+    category-specific seat row exists.
+    """
+    intake: Dict[Tuple[str, int, str, Optional[str]], int] = {}
+    for seat in seats:
+        if seat.get('intake'):
+            intake[(str(seat['college_id']), int(seat['year']), seat['branch'], seat.get('category'))] = int(seat['intake'])
+
+    final: Dict[Tuple[str, int, str, Optional[str], str], Dict[str, Any]] = {}
+    for row in cutoffs:
+        if row.get('closing_rank') is None or row.get('year') is None:
+            continue
+        key = (str(row['college_id']), int(row['year']), row.get('branch'), row.get('category'), row.get('exam'))
+        current = final.get(key)
+        if current is None or (row.get('round') or 0) >= (current.get('round') or 0):
+            final[key] = row
+
+    joined = []
+    for (college_id, year, branch, category, exam), row in final.items():
+        seats_for_key = intake.get((college_id, year, branch, category)) or intake.get((college_id, year, branch, None))
+        if not seats_for_key:
+            continue
+        closing_rank = int(row['closing_rank'])
+        joined.append({
+            'college_id': college_id,
+            'year': year,
+            'branch': branch,
+            'category': category,
+            'exam': exam,
+            'round': row.get('round'),
+            'intake': seats_for_key,
+            'closing_rank': closing_rank,
+            'rank_per_seat': round(closing_rank / seats_for_key, 2),
+            'score': competitiveness_score(closing_rank, seats_for_key),
+        })
+    return joined
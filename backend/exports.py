@@ -0,0 +1,240 @@
+import csv
+import io
+import zlib
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List
+
+import orjson
+
+# Column name -> logical type used by the typed formats (ndjson, parquet, arrow)
+CUTOFF_EXPORT_TYPES: Dict[str, str] = {
+    "id": "string",
+    "college_id": "string",
+    "year": "int32",
+    "round": "int32",
+    "exam": "string",
+    "category": "string",
+    "branch": "string",
+    "closing_rank": "int64",
+    "closing_percentile": "float64",
+    "created_at": "timestamp",
+}
+SEAT_EXPORT_TYPES: Dict[str, str] = {
+    "id": "string",
+    "college_id": "string",
+    "year": "int32",
+    "branch": "string",
+    "category": "string",
+    "intake": "int32",
+    "created_at": "timestamp",
+}
+CUTOFF_EXPORT_COLUMNS = list(CUTOFF_EXPORT_TYPES)
+SEAT_EXPORT_COLUMNS = list(SEAT_EXPORT_TYPES)
+
+# format -> (media type, file extension)
+EXPORT_FORMATS: Dict[str, tuple] = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+    "arrow": ("application/vnd.apache.arrow.stream", "arrows"),
+}
+# Formats that are already compressed internally and should not be gzipped again
+COMPRESSED_FORMATS = {"parquet", "arrow"}
+
+# Rows per yielded chunk; also used as the Mongo cursor batch size
+EXPORT_BATCH_SIZE = 1000
+# Rows per Parquet row group / Arrow record batch
+ROW_GROUP_SIZE = 65536
+
+
+def export_row(doc: Dict[str, Any], columns: List[str]) -> List[Any]:
+    """Flatten a Mongo document into an export row (missing values become empty cells)"""
+    row: List[Any] = []
+    for col in columns:
+        if col == "id":
+            row.append(doc.get("id") or str(doc.get("_id", "")))
+        else:
+            value = doc.get(col)
+            row.append("" if value is None else value)
+    return row
+
+
+def _drain(buffer: io.StringIO) -> bytes:
+    data = buffer.getvalue()
+    buffer.seek(0)
+    buffer.truncate(0)
+    return data.encode("utf-8")
+
+
+async def stream_csv(cursor, columns: List[str], batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """
+    Write CSV incrementally from an async Mongo cursor.
+
+    The header is yielded before the first document is fetched, then one chunk per
+    `batch_size` rows, so memory stays bounded by a single batch.
+    """
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    yield _drain(buffer)
+
+    pending = 0
+    async for doc in cursor:
+        writer.writerow(export_row(doc, columns))
+        pending += 1
+        if pending >= batch_size:
+            yield _drain(buffer)
+            pending = 0
+    if pending:
+        yield _drain(buffer)
+
+
+async def gzip_stream(chunks: AsyncIterator[bytes], level: int = 6) -> AsyncIterator[bytes]:
+    """Gzip-encode a byte stream on the fly, sync-flushing after every chunk so data keeps flowing"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits=31 -> gzip container
+    async for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _coerce(value: Any, kind: str) -> Any:
+    """Coerce a stored value to its export type; unparseable values become null"""
+    if value is None or value == "":
+        return None
+    try:
+        if kind in ("int32", "int64"):
+            return int(value)
+        if kind == "float64":
+            return float(value)
+    except (TypeError, ValueError):
+        return None
+    if kind == "timestamp":
+        return value if isinstance(value, datetime) else None
+    return str(value)
+
+
+def typed_row(doc: Dict[str, Any], column_types: Dict[str, str]) -> Dict[str, Any]:
+    row: Dict[str, Any] = {}
+    for name, kind in column_types.items():
+        if name == "id":
+            row[name] = doc.get("id") or str(doc.get("_id", ""))
+        else:
+            row[name] = _coerce(doc.get(name), kind)
+    return row
+
+
+async def stream_ndjson(cursor, column_types: Dict[str, str], batch_size: int = EXPORT_BATCH_SIZE) -> AsyncIterator[bytes]:
+    """One typed JSON object per line, yielded in batches"""
+    lines: List[bytes] = []
+    async for doc in cursor:
+        lines.append(orjson.dumps(typed_row(doc, column_types)))
+        if len(lines) >= batch_size:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+
+class _ChunkSink:
+    """Write-only file object that hands buffered bytes back to the stream between row groups"""
+
+    def __init__(self):
+        self._chunks: List[bytes] = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def _arrow_schema(column_types: Dict[str, str]):
+    import pyarrow as pa
+
+    arrow_types = {
+        "string": pa.string(),
+        "int32": pa.int32(),
+        "int64": pa.int64(),
+        "float64": pa.float64(),
+        "timestamp": pa.timestamp("ms"),
+    }
+    return pa.schema([(name, arrow_types[kind]) for name, kind in column_types.items()])
+
+
+async def stream_columnar(
+    cursor,
+    column_types: Dict[str, str],
+    fmt: str,
+    row_group_size: int = ROW_GROUP_SIZE,
+) -> AsyncIterator[bytes]:
+    """
+    Write Parquet or an Arrow IPC stream straight from the cursor.
+
+    Rows are accumulated column-wise into typed arrays and written one row group
+    (record batch) at a time; bytes produced by each group are yielded right away.
+    """
+    import pyarrow as pa
+
+    schema = _arrow_schema(column_types)
+    sink = _ChunkSink()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        writer = pq.ParquetWriter(sink, schema, compression="zstd")
+    else:
+        writer = pa.ipc.new_stream(sink, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+
+    columns: Dict[str, List[Any]] = {name: [] for name in column_types}
+    pending = 0
+
+    def write_group():
+        writer.write_table(pa.Table.from_pydict(columns, schema=schema))
+        for values in columns.values():
+            values.clear()
+
+    try:
+        head = sink.drain()
+        if head:
+            yield head
+        async for doc in cursor:
+            for name, value in typed_row(doc, column_types).items():
+                columns[name].append(value)
+            pending += 1
+            if pending >= row_group_size:
+                write_group()
+                pending = 0
+                yield sink.drain()
+        if pending:
+            write_group()
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def stream_export(cursor, fmt: str, column_types: Dict[str, str]) -> AsyncIterator[bytes]:
+    """Pick the streaming writer for an export format"""
+    if fmt == "csv":
+        return stream_csv(cursor, list(column_types))
+    if fmt == "ndjson":
+        return stream_ndjson(cursor, column_types)
+    return stream_columnar(cursor, column_types, fmt)
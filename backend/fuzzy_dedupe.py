@@ -0,0 +1,167 @@
+import hashlib
+import re
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+# Old/alternate city names folded together, in both blocking keys and name tokens
+CITY_ALIASES = {
+    'bombay': 'mumbai',
+    'madras': 'chennai',
+    'calcutta': 'kolkata',
+    'bangalore': 'bengaluru',
+    'mysore': 'mysuru',
+    'mangalore': 'mangaluru',
+    'poona': 'pune',
+    'baroda': 'vadodara',
+    'trivandrum': 'thiruvananthapuram',
+    'cochin': 'kochi',
+    'gurgaon': 'gurugram',
+    'benares': 'varanasi',
+    'banaras': 'varanasi',
+    'delhi': 'new delhi',
+}
+# Abbreviations expanded before tokenizing, so "IIT Bombay" and the full name share tokens
+NAME_EXPANSIONS = {
+    'iit': 'indian institute of technology',
+    'iiit': 'indian institute of information technology',
+    'nit': 'national institute of technology',
+    'iim': 'indian institute of management',
+    'iisc': 'indian institute of science',
+    'bits': 'birla institute of technology and science',
+    'univ': 'university',
+    'inst': 'institute',
+    'engg': 'engineering',
+    'tech': 'technology',
+    'coll': 'college',
+    'govt': 'government',
+    'mgmt': 'management',
+}
+NAME_STOPWORDS = frozenset({'of', 'the', 'and', 'for', 'in', 'at', 'a', 'an'})
+# Words most college names share; they say little about which college it is (a fixed stand-in
+# for inverse document frequency), so "Information" alone tells IIIT from IIT
+GENERIC_NAME_TOKENS = frozenset({
+    'indian', 'national', 'institute', 'institution', 'technology', 'technological', 'university',
+    'college', 'engineering', 'science', 'sciences', 'management', 'school', 'academy', 'government',
+    'state', 'central', 'research', 'studies', 'education', 'polytechnic', 'deemed', 'campus',
+})
+GENERIC_TOKEN_WEIGHT = 0.2
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Similarity needed to call two names the same college (weighted token Jaccard)
+FUZZY_THRESHOLD = 0.7
+# 16 bands x 4 rows: pairs above ~0.5 Jaccard become candidates with high probability
+NUM_PERM = 64
+NUM_BANDS = 16
+_PRIME = 4294967291  # largest prime below 2**32; a * x + b stays below 2**64
+
+
+def _words(text: Any) -> List[str]:
+    return _WORD_RE.findall(str(text or '').lower().replace('&', ' and '))
+
+
+def normalize_city(city: Any) -> str:
+    joined = ' '.join(_words(city))
+    return CITY_ALIASES.get(joined, joined)
+
+
+def blocking_key(state: Any, city: Any) -> str:
+    """Only colleges in the same state and (alias-normalized) city are compared"""
+    return f"{' '.join(_words(state))}|{normalize_city(city)}"
+
+
+def name_tokens(name: Any) -> Set[str]:
+    tokens: Set[str] = set()
+    for word in _words(name):
+        word = CITY_ALIASES.get(word, word)
+        for token in NAME_EXPANSIONS.get(word, word).split():
+            if token not in NAME_STOPWORDS:
+                tokens.add(token)
+    return tokens
+
+
+def jaccard(a: Iterable[str], b: Iterable[str]) -> float:
+    a, b = set(a), set(b)
+    if not a or not b:
+        return 0.0
+    return len(a & b) / len(a | b)
+
+
+def token_weight(token: str, common: Set[str] = frozenset()) -> float:
+    return GENERIC_TOKEN_WEIGHT if token in GENERIC_NAME_TOKENS or token in common else 1.0
+
+
+def weighted_jaccard(a: Iterable[str], b: Iterable[str], common: Set[str] = frozenset()) -> float:
+    """
+    Jaccard with generic tokens (and `common` ones, e.g. the shared city) down-weighted, so two
+    names differing in one distinctive word score low even when their boilerplate matches
+    """
+    a, b = set(a), set(b)
+    if not a or not b:
+        return 0.0
+    union = sum(token_weight(t, common) for t in a | b)
+    return sum(token_weight(t, common) for t in a & b) / union
+
+
+class MinHasher:
+    """MinHash signatures over token sets using NUM_PERM universal hash functions (vectorized)."""
+
+    def __init__(self, num_perm: int = NUM_PERM, seed: int = 7):
+        rng = np.random.RandomState(seed)
+        self.a = rng.randint(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self.b = rng.randint(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+    @staticmethod
+    def _token_hashes(tokens: Iterable[str]) -> np.ndarray:
+        return np.array(
+            [int.from_bytes(hashlib.blake2b(t.encode('utf-8'), digest_size=4).digest(), 'little') % _PRIME for t in tokens],
+            dtype=np.uint64,
+        )
+
+    def signature(self, tokens: Set[str]) -> np.ndarray:
+        if not tokens:
+            return np.full(len(self.a), _PRIME, dtype=np.uint64)
+        x = self._token_hashes(sorted(tokens))
+        return ((self.a[:, None] * x[None, :] + self.b[:, None]) % _PRIME).min(axis=1)
+
+
+def band_keys(block: str, signature: np.ndarray, bands: int = NUM_BANDS) -> List[str]:
+    """LSH bucket keys; two colleges are candidates when they share any key (same block, same band)"""
+    rows = len(signature) // bands
+    keys = []
+    for i in range(bands):
+        digest = hashlib.blake2b(signature[i * rows:(i + 1) * rows].tobytes(), digest_size=8).hexdigest()
+        keys.append(f'{block}#{i}#{digest}')
+    return keys
+
+
+_hasher = MinHasher()
+
+
+def college_signature(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Persisted per college: blocking key, name tokens and LSH band keys"""
+    block = blocking_key(doc.get('state'), doc.get('city'))
+    tokens = name_tokens(doc.get('name'))
+    return {
+        'block': block,
+        'tokens': sorted(tokens),
+        'band_keys': band_keys(block, _hasher.signature(tokens)) if tokens else [],
+    }
+
+
+def city_tokens(city: Any) -> Set[str]:
+    """Name tokens the city contributes; every candidate in a block shares them"""
+    return set(normalize_city(city).split())
+
+
+def best_match(
+    tokens: Iterable[str], candidates: Iterable[Tuple[Any, Iterable[str]]], threshold: float = FUZZY_THRESHOLD,
+    common: Set[str] = frozenset(),
+) -> Optional[Tuple[Any, float]]:
+    """Most similar (ref, tokens) candidate at or above the threshold, by weighted Jaccard"""
+    best: Optional[Tuple[Any, float]] = None
+    for ref, other in candidates:
+        score = weighted_jaccard(tokens, other, common)
+        if score >= threshold and (best is None or score > best[1]):
+            best = (ref, score)
+    return best
@@ -0,0 +1,235 @@
+import asyncio
+import logging
+from collections import Counter, OrderedDict
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from bson import ObjectId
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+logger = logging.getLogger(__name__)
+
+
+def review_match(review_id: str) -> Dict[str, Any]:
+    """Reviews are addressed by custom id, falling back to ObjectId"""
+    if ObjectId.is_valid(review_id):
+        return {"$or": [{"id": review_id}, {"_id": ObjectId(review_id)}]}
+    return {"id": review_id}
+
+
+# Flush ids remembered per review; a stalled flush older than this could be applied twice
+FLUSH_HISTORY = 16
+
+
+def _tag_flush(update: Any, flush_id: str) -> Any:
+    """Record flush_id on the review in the same write as its increment (update document or pipeline; ids are hex, never "$...")"""
+    if isinstance(update, list):
+        return update + [{"$set": {"helpful_flushes": {"$slice": [
+            {"$concatArrays": [{"$ifNull": ["$helpful_flushes", []]}, [flush_id]]}, -FLUSH_HISTORY,
+        ]}}}]
+    return {**update, "$push": {"helpful_flushes": {"$each": [flush_id], "$slice": -FLUSH_HISTORY}}}
+
+
+class HelpfulVoteBuffer:
+    """
+    Coalesces helpful taps in memory and flushes them as unordered bulk writes.
+
+    A tap from a known user inserts a (review_id, user_id) unique marker right
+    away, so a repeat vote is rejected by the index on any process and after
+    any flush; the increment itself is still deferred. Each flush issues one
+    $inc per distinct review, however many taps it got. Anonymous taps are
+    buffered in memory and counted without dedupe.
+
+    Markers and counts are kept consistent without transactions: a new marker
+    carries `state: "new"`, a flush claims the new markers by setting `state`
+    to its flush id, applies the increments guarded by that id (a review
+    remembers the ids it has applied), then clears `state`. A flush that dies
+    midway leaves claimed markers that the next flush re-applies, which is a
+    no-op for reviews that already took the increment.
+    """
+
+    def __init__(
+        self,
+        reviews,
+        votes,
+        flush_interval: float = 2.0,
+        max_pending: int = 5000,
+        known_size: int = 10000,
+        on_flush: Optional[Callable[[List[str]], Awaitable[Any]]] = None,
+        increment_update: Callable[[int], Any] = lambda n: {"$inc": {"helpful_count": n}},
+    ):
+        self.reviews = reviews
+        self.votes = votes
+        self.on_flush = on_flush  # called once per flush with the ids of the reviews it changed
+        self.increment_update = increment_update  # update document/pipeline applying n votes
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._anonymous: Counter = Counter()
+        self._new_markers = 0  # markers inserted here since the last flush
+        self._known: 'OrderedDict[str, bool]' = OrderedDict()  # review ids confirmed to exist
+        self._known_size = known_size
+        self._lock = asyncio.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._flush_task: Optional[asyncio.Task] = None  # early flush when the buffer fills up
+
+    async def ensure_indexes(self) -> None:
+        await self.votes.create_index([("review_id", 1), ("user_id", 1)], unique=True)
+        # Only markers not yet counted carry `state`
+        await self.votes.create_index([("state", 1)], partialFilterExpression={"state": {"$exists": True}})
+
+    async def review_exists(self, review_id: str) -> bool:
+        if review_id in self._known:
+            self._known.move_to_end(review_id)
+            return True
+        if not await self.reviews.count_documents(review_match(review_id), limit=1):
+            return False
+        self._known[review_id] = True
+        while len(self._known) > self._known_size:
+            self._known.popitem(last=False)
+        return True
+
+    async def record(self, review_id: str, user_id: Optional[str] = None) -> bool:
+        """Record one tap for the next flush; returns False when the user already voted for this review"""
+        if user_id:
+            try:
+                await self.votes.insert_one(
+                    {"review_id": review_id, "user_id": user_id, "created_at": datetime.utcnow(), "state": "new"}
+                )
+            except DuplicateKeyError:
+                return False
+            self._new_markers += 1
+        else:
+            self._anonymous[review_id] += 1
+        if self._new_markers + len(self._anonymous) >= self.max_pending and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+            self._flush_task.add_done_callback(self._log_flush_failure)
+        return True
+
+    @staticmethod
+    def _log_flush_failure(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(f"Helpful vote flush failed, will retry: {task.exception()}")
+
+    @property
+    def pending(self) -> int:
+        """Taps held only in memory (user votes are already stored as markers)"""
+        return sum(self._anonymous.values())
+
+    async def flush(self) -> int:
+        """Apply new votes and finish interrupted flushes; returns the number of votes that changed a review"""
+        async with self._lock:
+            anonymous, self._anonymous = self._anonymous, Counter()
+            self._new_markers = 0
+
+            flush_id = str(ObjectId())
+            try:
+                await self.votes.update_many({"state": "new"}, {"$set": {"state": flush_id}})
+                claimed = await self._claimed_counts()
+            except Exception:
+                self._requeue(anonymous)
+                raise
+            for rid, n in anonymous.items():
+                claimed[(rid, flush_id)] += n
+            if not claimed:
+                return 0
+
+            fresh = [(rid, n) for (rid, fid), n in claimed.items() if fid == flush_id]
+            fresh_done, changed = await self._apply_fresh(fresh, flush_id)
+            # Claims left by an interrupted flush, one write each: the guard skips reviews that already took them
+            done: List[Tuple[Tuple[str, str], int]] = [((rid, flush_id), n) for rid, n in fresh_done]
+            failed = len(fresh) - len(fresh_done)
+            for (rid, fid), n in claimed.items():
+                if fid == flush_id:
+                    continue
+                try:
+                    result = await self.reviews.update_one(
+                        {**review_match(rid), "helpful_flushes": {"$ne": fid}}, _tag_flush(self.increment_update(n), fid)
+                    )
+                except Exception:
+                    failed += 1
+                    continue
+                done.append(((rid, fid), n))
+                if result.modified_count:
+                    changed[rid] += n
+            # Claimed markers of failed groups stay claimed and are re-applied next flush; anonymous taps have no marker
+            done_fresh = {rid for rid, _ in fresh_done}
+            self._requeue(Counter({rid: n for rid, n in anonymous.items() if rid not in done_fresh}))
+            for fid in {fid for (_, fid), _ in done}:
+                rids = [rid for (rid, f), _ in done if f == fid]
+                await self.votes.update_many({"state": fid, "review_id": {"$in": rids}}, {"$unset": {"state": ""}})
+            if failed:
+                raise RuntimeError(f"{failed} of {len(claimed)} helpful vote increments failed")
+            if changed and self.on_flush:
+                await self.on_flush(list(changed))
+            return sum(changed.values())
+
+    async def _apply_fresh(self, fresh: List[Tuple[str, int]], flush_id: str) -> Tuple[List[Tuple[str, int]], Counter]:
+        """One unordered bulk write for this flush's groups; returns (groups written, votes per review it modified)"""
+        if not fresh:
+            return [], Counter()
+        ops = [
+            UpdateOne({**review_match(rid), "helpful_flushes": {"$ne": flush_id}}, _tag_flush(self.increment_update(n), flush_id))
+            for rid, n in fresh
+        ]
+        failed: Set[int] = set()
+        try:
+            modified = (await self.reviews.bulk_write(ops, ordered=False)).modified_count
+        except BulkWriteError as e:
+            failed = {err["index"] for err in e.details.get("writeErrors", [])}
+            modified = e.details.get("nModified", 0)
+        except Exception:
+            return [], Counter()
+        written = [group for i, group in enumerate(fresh) if i not in failed]
+        if modified == len(written):
+            return written, Counter(dict(written))
+        # Some matched nothing (review deleted): count only the reviews now tagged with this flush
+        tagged: Set[str] = set()
+        async for doc in self.reviews.find({"helpful_flushes": flush_id}, {"id": 1}):
+            tagged.update({str(doc["_id"]), doc.get("id")})
+        return written, Counter({rid: n for rid, n in written if rid in tagged})
+
+    async def _claimed_counts(self) -> Counter:
+        """(review_id, flush id) -> markers claimed by this or an interrupted flush and not yet counted"""
+        counts: Counter = Counter()
+        pipeline = [
+            {"$match": {"state": {"$exists": True, "$ne": "new"}}},
+            {"$group": {"_id": {"review_id": "$review_id", "state": "$state"}, "n": {"$sum": 1}}},
+        ]
+        async for row in self.votes.aggregate(pipeline):
+            counts[(row["_id"]["review_id"], row["_id"]["state"])] = row["n"]
+        return counts
+
+    def _requeue(self, counts: Counter) -> None:
+        self._anonymous.update(counts)
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.warning(f"Helpful vote flush failed, will retry: {e}")
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop the periodic task, let an early flush finish, and flush whatever is still buffered"""
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task:
+            await asyncio.wait([self._flush_task])  # its failure is logged by the done callback
+            self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            logger.error(f"Final helpful vote flush failed, {self.pending} votes lost: {e}")
@@ -0,0 +1,257 @@
+import asyncio
+import logging
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Handler: async (params, job) -> result dict
+JobHandler = Callable[[Dict[str, Any], "Job"], Awaitable[Optional[Dict[str, Any]]]]
+
+ACTIVE_STATUSES = ("queued", "running")
+
+
+class Job:
+    """
+    Handle given to a running handler. Handlers mutate `progress` in place (using
+    "rows" as the unit of work); the runner persists it periodically.
+    """
+
+    def __init__(self, job_id: str, kind: str, params: Dict[str, Any]):
+        self.id = job_id
+        self.kind = kind
+        self.params = params
+        self.progress: Dict[str, Any] = {"rows": 0}
+        self.started = time.monotonic()
+        self.lease_lost = False
+
+    @property
+    def rows_per_second(self) -> float:
+        return round(self.progress.get("rows", 0) / max(time.monotonic() - self.started, 1e-9), 1)
+
+
+class JobRunner:
+    """
+    Runs registered background jobs with bounded concurrency; job state lives in Mongo.
+
+    Several processes may share the collection. A job only runs after this
+    process claims it: one find_one_and_update moves it from "queued" to
+    "running" with this runner as `owner` and a `lease_expires_at` that the
+    progress heartbeat keeps extending. A runner that loses its lease stops
+    the job, and every later write is conditioned on ownership.
+
+    recover() runs at startup and then periodically. It schedules queued jobs,
+    which any runner may claim. Running jobs whose lease has expired (their
+    runner died) are re-queued when the handler is marked `rerunnable` (safe to
+    repeat from the start, e.g. deduped imports); otherwise they are marked
+    "interrupted". Jobs another live runner holds are left alone.
+    """
+
+    def __init__(
+        self,
+        collection,
+        max_concurrency: int = 2,
+        persist_interval: float = 1.0,
+        lease_seconds: float = 30.0,
+        owner: Optional[str] = None,
+    ):
+        self.collection = collection
+        self.persist_interval = persist_interval
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: Dict[str, JobHandler] = {}
+        self._rerunnable: Dict[str, bool] = {}
+        self._cleanup: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._recover_task: Optional[asyncio.Task] = None
+
+    def register(
+        self,
+        kind: str,
+        handler: JobHandler,
+        rerunnable: bool = False,
+        cleanup: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
+        """`cleanup(params)` runs once a job of this kind has finished, whatever the outcome."""
+        self._handlers[kind] = handler
+        self._rerunnable[kind] = rerunnable
+        if cleanup:
+            self._cleanup[kind] = cleanup
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("id", 1)], unique=True)
+        await self.collection.create_index([("status", 1), ("created_at", -1)])
+        await self.collection.create_index([("status", 1), ("lease_expires_at", 1)])
+        await self.collection.create_index([("created_at", -1)])
+
+    async def submit(self, kind: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        now = datetime.utcnow()
+        doc = {
+            "id": str(uuid.uuid4()),
+            "kind": kind,
+            "params": params,
+            "status": "queued",
+            "progress": {},
+            "result": None,
+            "error": None,
+            "rows_per_second": None,
+            "owner": None,
+            "lease_expires_at": None,
+            "created_at": now,
+            "updated_at": now,
+            "started_at": None,
+            "finished_at": None,
+        }
+        await self.collection.insert_one(dict(doc))
+        self._schedule(doc["id"], kind, params)
+        return doc
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        return await self.collection.find_one({"id": job_id}, {"_id": 0})
+
+    async def list(self, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        query = {"status": status} if status else {}
+        return await self.collection.find(query, {"_id": 0}).sort([("created_at", -1)]).limit(limit).to_list(length=None)
+
+    def _schedule(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        if job_id in self._tasks:
+            return  # already waiting for a slot or running here
+        task = asyncio.create_task(self._run(job_id, kind, params))
+        self._tasks[job_id] = task
+        task.add_done_callback(lambda _: self._tasks.pop(job_id, None))
+
+    def _lease(self) -> datetime:
+        return datetime.utcnow() + timedelta(seconds=self.lease_seconds)
+
+    async def _claim(self, job_id: str) -> bool:
+        """Atomically take a queued job for this runner; False when another runner got it first."""
+        now = datetime.utcnow()
+        claimed = await self.collection.find_one_and_update(
+            {"id": job_id, "status": "queued"},
+            {"$set": {
+                "status": "running", "owner": self.owner, "lease_expires_at": self._lease(),
+                "started_at": now, "updated_at": now, "error": None,
+            }},
+            projection={"_id": 1},
+        )
+        return claimed is not None
+
+    async def _set_owned(self, job_id: str, **fields: Any) -> bool:
+        """Update a job this runner holds; False when the lease was lost to another runner."""
+        fields["updated_at"] = datetime.utcnow()
+        result = await self.collection.update_one({"id": job_id, "owner": self.owner, "status": "running"}, {"$set": fields})
+        return result.matched_count > 0
+
+    async def _persist_progress(self, job: Job, worker: asyncio.Task) -> None:
+        """Save progress and renew the lease; stop the job if another runner has taken it over."""
+        while True:
+            await asyncio.sleep(self.persist_interval)
+            try:
+                held = await self._set_owned(
+                    job.id, progress=job.progress, rows_per_second=job.rows_per_second, lease_expires_at=self._lease(),
+                )
+            except Exception as e:
+                logger.warning(f"Job {job.id} progress update failed: {e}")
+                continue
+            if not held:
+                logger.warning(f"Job {job.id} lease lost; stopping it here")
+                job.lease_lost = True
+                worker.cancel()
+                return
+
+    async def _run(self, job_id: str, kind: str, params: Dict[str, Any]) -> None:
+        async with self._semaphore:
+            if not await self._claim(job_id):
+                return
+            job = Job(job_id, kind, params)
+            reporter = asyncio.create_task(self._persist_progress(job, asyncio.current_task()))
+            final: Dict[str, Any]
+            try:
+                result = await self._handlers[kind](params, job)
+                final = {"status": "completed", "result": result}
+            except asyncio.CancelledError:
+                reporter.cancel()
+                if job.lease_lost:
+                    return  # the new owner runs it (and cleans up after it)
+                # Shutdown: release the lease so recover() can re-queue or mark it interrupted right away
+                await self._set_owned(job_id, progress=job.progress, rows_per_second=job.rows_per_second, lease_expires_at=datetime.utcnow())
+                raise
+            except Exception as e:
+                logger.exception(f"Job {job_id} ({kind}) failed")
+                final = {"status": "failed", "error": str(e)}
+            reporter.cancel()
+            held = await self._set_owned(
+                job_id,
+                progress=job.progress,
+                rows_per_second=job.rows_per_second,
+                finished_at=datetime.utcnow(),
+                **final,
+            )
+            if not held:
+                logger.warning(f"Job {job_id} finished after its lease was lost; result discarded")
+                return
+            cleanup = self._cleanup.get(kind)
+            if cleanup:
+                try:
+                    cleanup(params)
+                except Exception as e:
+                    logger.warning(f"Job {job_id} cleanup failed: {e}")
+
+    async def recover(self) -> int:
+        """Schedule queued jobs and take over running ones whose lease expired; returns jobs (re-)scheduled."""
+        requeued = 0
+        now = datetime.utcnow()
+        expired = {"$not": {"$gt": now}}  # also matches jobs from before leases existed
+        query = {"$or": [{"status": "queued"}, {"status": "running", "lease_expires_at": expired}]}
+        async for doc in self.collection.find(query, {"_id": 0, "id": 1, "kind": 1, "status": 1, "params": 1}):
+            kind = doc.get("kind")
+            if doc["status"] == "queued":
+                if kind in self._handlers and doc["id"] not in self._tasks:
+                    self._schedule(doc["id"], kind, doc.get("params") or {})
+                    requeued += 1
+                continue
+            # Only one runner wins the transition out of the expired "running" state
+            orphan = {"id": doc["id"], "status": "running", "lease_expires_at": expired}
+            if kind in self._handlers and self._rerunnable.get(kind):
+                taken = await self.collection.find_one_and_update(
+                    orphan, {"$set": {"status": "queued", "owner": None, "updated_at": now}}, projection={"_id": 1},
+                )
+                if taken:
+                    self._schedule(doc["id"], kind, doc.get("params") or {})
+                    requeued += 1
+            else:
+                await self.collection.update_one(
+                    orphan, {"$set": {"status": "interrupted", "owner": None, "finished_at": now, "updated_at": now}},
+                )
+        return requeued
+
+    async def _recover_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.lease_seconds)
+            try:
+                requeued = await self.recover()
+                if requeued:
+                    logger.info(f"Re-queued {requeued} background jobs")
+            except Exception as e:
+                logger.warning(f"Job recovery failed: {e}")
+
+    def start(self) -> None:
+        """Periodically pick up queued jobs and jobs whose runner died"""
+        if self._recover_task is None:
+            self._recover_task = asyncio.create_task(self._recover_loop())
+
+    async def shutdown(self) -> None:
+        if self._recover_task:
+            self._recover_task.cancel()
+            self._recover_task = None
+        tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
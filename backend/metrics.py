@@ -0,0 +1,242 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from pymongo import monitoring
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; HTTP buckets are the Prometheus client defaults, Mongo ones start lower
+HTTP_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0)
+MONGO_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+# Bytes: 256 B .. 16 MiB in powers of 4
+RESPONSE_SIZE_BUCKETS = tuple(256 * 4 ** i for i in range(9))
+# Documents per reply batch
+DOCUMENT_COUNT_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 500, 1000, 5000, 10000)
+
+# Connection handshake/heartbeat/auth chatter, not application queries
+IGNORED_COMMANDS = frozenset({
+    "hello", "ismaster", "isMaster", "ping", "buildinfo", "buildInfo", "endSessions",
+    "saslStart", "saslContinue", "authenticate", "getnonce", "killCursors",
+})
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(str(v))}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """Monotonic counter keyed by a tuple of label values."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        for labels, value in values:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    """Fixed-bucket histogram keyed by a tuple of label values; buckets are cumulative only when rendered."""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Iterable[float]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (+Inf last), sum]
+        self._values: Dict[Tuple[str, ...], List[Any]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)  # le semantics: value == bound lands in that bucket
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted((labels, (list(counts), total)) for labels, (counts, total) in self._values.items())
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, (counts, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {_format_value(total)}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    """Holds metric families and renders them in the Prometheus text exposition format."""
+
+    def __init__(self):
+        self._metrics: List[Any] = []
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str]) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str], buckets: Iterable[float]) -> Histogram:
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+class HTTPMetrics:
+    def __init__(self, registry: MetricsRegistry):
+        self.requests = registry.counter(
+            "http_requests_total", "HTTP requests by method, route template and status.", ("method", "route", "status"))
+        self.latency = registry.histogram(
+            "http_request_duration_seconds", "Time from request start to the last response byte.",
+            ("method", "route"), HTTP_LATENCY_BUCKETS)
+        self.size = registry.histogram(
+            "http_response_size_bytes", "Response body size.", ("method", "route"), RESPONSE_SIZE_BUCKETS)
+
+    def observe(self, method: str, route: str, status: int, seconds: float, size: int) -> None:
+        self.requests.inc((method, route, str(status)))
+        self.latency.observe((method, route), seconds)
+        self.size.observe((method, route), size)
+
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording count, latency and response size per route template.
+
+    Labels use the matched route's path template ("/api/colleges/{college_id}"),
+    never the raw URL, so label cardinality stays bounded; requests that match
+    no route are labelled "unmatched". Streaming responses are timed to their
+    last body chunk.
+    """
+
+    def __init__(self, app, metrics: HTTPMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        start = time.perf_counter()
+        status = 500
+        size = 0
+
+        async def send_wrapper(message):
+            nonlocal status, size
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            # The router stores the matched route on the (shared) scope
+            route = getattr(scope.get("route"), "path", None) or "unmatched"
+            self.metrics.observe(scope["method"], route, status, time.perf_counter() - start, size)
+
+
+def _documents_returned(command_name: str, reply: Dict[str, Any]) -> Optional[int]:
+    cursor = reply.get("cursor")
+    if isinstance(cursor, dict):
+        batch = cursor.get("firstBatch", cursor.get("nextBatch"))
+        if batch is not None:
+            return len(batch)
+    if command_name == "findAndModify":
+        return 1 if reply.get("value") is not None else 0
+    return None
+
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    """
+    pymongo command listener: latency, outcome and documents returned per collection and command.
+
+    Callbacks run on the driver's threads (Motor's executor), so state is lock-protected.
+    getMore is attributed to the collection of the cursor it continues.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        self.latency = registry.histogram(
+            "mongodb_command_duration_seconds", "MongoDB command round-trip time.",
+            ("collection", "command"), MONGO_LATENCY_BUCKETS)
+        self.commands = registry.counter(
+            "mongodb_commands_total", "MongoDB commands by outcome.", ("collection", "command", "outcome"))
+        self.documents = registry.histogram(
+            "mongodb_documents_returned", "Documents returned per reply batch.",
+            ("collection", "command"), DOCUMENT_COUNT_BUCKETS)
+        self._collections: Dict[Tuple[Any, int], str] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(event) -> Tuple[Any, int]:
+        return (event.connection_id, event.request_id)
+
+    def started(self, event) -> None:
+        if event.command_name in IGNORED_COMMANDS:
+            return
+        target = event.command.get(event.command_name)
+        if event.command_name == "getMore":
+            target = event.command.get("collection")
+        collection = target if isinstance(target, str) else ""
+        with self._lock:
+            self._collections[self._key(event)] = collection
+
+    def _finish(self, event, outcome: str) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            collection = self._collections.pop(self._key(event), None)
+        if collection is None:
+            return None
+        labels = (collection, event.command_name)
+        self.latency.observe(labels, event.duration_micros / 1e6)
+        self.commands.inc((collection, event.command_name, outcome))
+        return labels
+
+    def succeeded(self, event) -> None:
+        labels = self._finish(event, "succeeded")
+        if labels is None:
+            return
+        returned = _documents_returned(event.command_name, event.reply)
+        if returned is not None:
+            self.documents.observe(labels, returned)
+
+    def failed(self, event) -> None:
+        self._finish(event, "failed")
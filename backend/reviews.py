@@ -0,0 +1,140 @@
+import heapq
+import math
+import re
+from datetime import datetime
+from typing import List, Dict, Any, Optional
+
+# Review field -> dimension name in the aggregate
+REVIEW_DIMENSIONS = {
+    'rating_overall': 'overall',
+    'rating_academics': 'academics',
+    'rating_placements': 'placements',
+    'rating_infra': 'infra',
+    'rating_faculty': 'faculty',
+}
+
+# "Most helpful" ranking: log-scaled votes plus a recency term that grows by 1
+# every HELPFUL_DECAY_SECONDS, so a review needs 10x the votes to outrank one
+# that is that much newer. Two years keeps votes dominant: one year of recency
+# is worth about 3x the votes. The score only changes when votes do, so it can
+# be stored and indexed instead of being recomputed as reviews age (rerun
+# /api/dev/rebuild-helpful-scores after changing these).
+HELPFUL_SCORE_EPOCH = datetime(2024, 1, 1)
+HELPFUL_DECAY_SECONDS = 2 * 365 * 24 * 3600
+
+
+def helpful_score(helpful_count: int, created_at: Optional[datetime]) -> float:
+    age = ((created_at or HELPFUL_SCORE_EPOCH) - HELPFUL_SCORE_EPOCH).total_seconds()
+    return math.log10(max(helpful_count, 0) + 1) + age / HELPFUL_DECAY_SECONDS
+
+
+def helpful_score_update(increment: int) -> List[Dict[str, Any]]:
+    """Update pipeline that adds `increment` helpful votes and recomputes helpful_score in the same write"""
+    return [
+        {'$set': {'helpful_count': {'$add': [{'$ifNull': ['$helpful_count', 0]}, increment]}}},
+        {'$set': {'helpful_score': {'$add': [
+            {'$log10': {'$add': [{'$max': ['$helpful_count', 0]}, 1]}},
+            {'$divide': [
+                {'$subtract': [{'$ifNull': ['$created_at', HELPFUL_SCORE_EPOCH]}, HELPFUL_SCORE_EPOCH]},  # milliseconds
+                HELPFUL_DECAY_SECONDS * 1000,
+            ]},
+        ]}}},
+    ]
+
+
+def review_stats_increments(review: Dict[str, Any], prefix: str = 'review_stats') -> Dict[str, int]:
+    """
+    $inc document that folds one review into a college's aggregate.
+
+    Per dimension we keep count, sum and a histogram of ratings rounded to whole
+    stars, so averages and distributions are derived without reading reviews.
+    """
+    inc: Dict[str, Any] = {f'{prefix}.count': 1}
+    for field, dim in REVIEW_DIMENSIONS.items():
+        value = review.get(field)
+        if value is None:
+            continue
+        bucket = str(min(5, max(1, int(round(float(value))))))  # 0-star ratings count as 1
+        inc[f'{prefix}.{dim}.count'] = 1
+        inc[f'{prefix}.{dim}.sum'] = float(value)
+        inc[f'{prefix}.{dim}.hist.{bucket}'] = 1
+    return inc
+
+
+def accumulate_review_stats(stats: Dict[str, Any], review: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply review_stats_increments to an in-memory aggregate (used for rebuilds)"""
+    for path, amount in review_stats_increments(review, prefix='').items():
+        node = stats
+        *parents, leaf = path.lstrip('.').split('.')
+        for part in parents:
+            node = node.setdefault(part, {})
+        node[leaf] = node.get(leaf, 0) + amount
+    return stats
+
+
+def summarize_review_stats(stats: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Client-facing averages and overall histogram from a stored aggregate"""
+    stats = stats or {}
+    averages: Dict[str, Optional[float]] = {}
+    for dim in REVIEW_DIMENSIONS.values():
+        bucket = stats.get(dim) or {}
+        count = bucket.get('count', 0)
+        averages[dim] = round(bucket.get('sum', 0) / count, 2) if count else None
+    overall_hist = (stats.get('overall') or {}).get('hist', {})
+    return {
+        'count': stats.get('count', 0),
+        'averages': averages,
+        'histogram': {str(star): overall_hist.get(str(star), 0) for star in range(1, 6)},
+    }
+
+
+# Pros/cons term summaries. Sentiment words carry no information once we know
+# whether a phrase is a pro or a con, so they are dropped with the stopwords.
+TERM_STOPWORDS = frozenset("""
+a an and are as at be but by for from has have in is it its of on or so than that the
+their there this to too very was were with not no more most much many lot lots also
+good great nice best excellent awesome amazing bad poor worst terrible average decent okay ok
+""".split())
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+
+# Term maps are capped: every TERM_PRUNE_EVERY review writes a college's map is cut back
+# to its TERM_MAP_KEEP most mentioned terms per side. Long-tail terms lose their counts,
+# which only matters if one of them later climbs into the top list.
+TERM_MAP_KEEP = 200
+TERM_PRUNE_EVERY = 50
+
+
+def phrase_terms(phrase: str) -> List[str]:
+    """Distinct keywords and adjacent keyword pairs of one pros/cons phrase"""
+    tokens = [t for t in _TOKEN_RE.findall(phrase.lower()) if len(t) > 2 and t not in TERM_STOPWORDS]
+    terms = tokens + [f'{a} {b}' for a, b in zip(tokens, tokens[1:])]
+    return list(dict.fromkeys(terms))
+
+
+def review_term_increments(review: Dict[str, Any]) -> Dict[str, int]:
+    """$inc document folding a review's pros/cons into its college's term counts"""
+    inc: Dict[str, int] = {'review_count': 1}
+    for side in ('pros', 'cons'):
+        seen = set()
+        for phrase in review.get(side) or []:
+            seen.update(phrase_terms(str(phrase)))
+        for term in seen:  # a review counts once per term
+            inc[f'{side}.{term}'] = 1
+    return inc
+
+
+def _term_rank(item):
+    return (-item[1], item[0])
+
+
+def top_terms(counts: Optional[Dict[str, int]], limit: int) -> List[Dict[str, Any]]:
+    ranked = heapq.nsmallest(limit, (counts or {}).items(), key=_term_rank)
+    return [{'term': term, 'count': count} for term, count in ranked]
+
+
+def terms_to_prune(counts: Optional[Dict[str, int]], keep: int = TERM_MAP_KEEP) -> List[str]:
+    """Terms outside the `keep` most mentioned ones (same order as top_terms)"""
+    if not counts or len(counts) <= keep:
+        return []
+    kept = {term for term, _ in heapq.nsmallest(keep, counts.items(), key=_term_rank)}
+    return [term for term in counts if term not in kept]
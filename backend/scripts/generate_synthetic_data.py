@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Synthetic data generator for load testing and capacity planning.
+
+Writes colleges, cutoffs, seats, reviews, favorites and browsing events straight
+to MongoDB in batched unordered bulk inserts, generated column-wise with numpy.
+Distributions are skewed the way real traffic is: college popularity follows a
+Zipf law (top colleges get most reviews, favorites and views), fees and packages
+are log-normal, closing ranks track college rank and category, and a few power
+users write a large share of reviews. A fixed --seed gives identical data
+(including _ids) on every run.
+
+Examples:
+  # Full capacity-planning dataset into a local mongod (server stopped, indexes built on next start)
+  python backend/scripts/generate_synthetic_data.py --db educompare_load --drop
+
+  # 1% scale smoke run; measure generation speed without writing
+  python backend/scripts/generate_synthetic_data.py --scale 0.01 --dry-run
+
+After loading, rebuild derived views through the API:
+  POST /api/dev/rebuild-review-stats, /api/dev/rebuild-review-terms, /api/dev/rebuild-cutoff-trends,
+  /api/dev/rebuild-competitiveness, /api/dev/rebuild-college-signatures
+"""
+import argparse
+import os
+import re
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List
+
+import numpy as np
+from bson import ObjectId
+from pymongo import MongoClient
+from pymongo.write_concern import WriteConcern
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from reviews import HELPFUL_DECAY_SECONDS, HELPFUL_SCORE_EPOCH  # noqa: E402
+
+# Fixed epoch for generated _ids and timestamps so runs are reproducible
+BASE_TIME = datetime(2025, 6, 1)
+BASE_TS = int((BASE_TIME - datetime(1970, 1, 1)).total_seconds())
+
+STATES = [  # (state, cities, weight)
+    ("Maharashtra", ["Mumbai", "Pune", "Nagpur", "Nashik", "Aurangabad"], 0.14),
+    ("Tamil Nadu", ["Chennai", "Coimbatore", "Madurai", "Tiruchirappalli"], 0.13),
+    ("Karnataka", ["Bengaluru", "Mysuru", "Mangaluru", "Hubballi"], 0.11),
+    ("Uttar Pradesh", ["Lucknow", "Kanpur", "Noida", "Varanasi", "Prayagraj"], 0.12),
+    ("Andhra Pradesh", ["Visakhapatnam", "Vijayawada", "Guntur"], 0.08),
+    ("Telangana", ["Hyderabad", "Warangal"], 0.07),
+    ("Rajasthan", ["Jaipur", "Jodhpur", "Kota"], 0.06),
+    ("West Bengal", ["Kolkata", "Durgapur", "Siliguri"], 0.06),
+    ("Madhya Pradesh", ["Bhopal", "Indore", "Gwalior"], 0.06),
+    ("Gujarat", ["Ahmedabad", "Surat", "Vadodara"], 0.06),
+    ("Kerala", ["Kochi", "Thiruvananthapuram", "Kozhikode"], 0.04),
+    ("Delhi", ["New Delhi"], 0.03),
+    ("Punjab", ["Ludhiana", "Amritsar", "Mohali"], 0.02),
+    ("Odisha", ["Bhubaneswar", "Cuttack"], 0.02),
+]
+BRANCHES = [
+    "Computer Science", "Information Technology", "Electronics", "Electrical Engineering",
+    "Mechanical Engineering", "Civil Engineering", "Chemical Engineering", "Artificial Intelligence",
+    "Data Science", "Biotechnology", "Aerospace Engineering", "Production Engineering",
+]
+NAME_KINDS = ["Institute of Technology", "Engineering College", "University", "College of Engineering", "Institute of Science and Technology"]
+UNIVERSITY_TYPES = (["Government", "Private", "Deemed"], [0.3, 0.6, 0.1])
+ACCREDITATIONS = ["NAAC A++", "NAAC A+", "NAAC A", "NBA", "AICTE", "UGC"]
+EXAMS = (["JEE Main", "KCET", "MHT-CET", "WBJEE", "COMEDK", "EAMCET"], [0.45, 0.12, 0.14, 0.08, 0.09, 0.12])
+CATEGORIES = (["GEN", "EWS", "OBC", "SC", "ST"], [0.4, 0.1, 0.27, 0.15, 0.08])
+CATEGORY_RANK_FACTOR = np.array([1.0, 1.4, 1.8, 4.0, 6.0])
+PROS = ["Good placements", "Experienced faculty", "Great campus life", "Strong alumni network", "Modern labs",
+        "Active coding clubs", "Good hostel facilities", "Industry tie-ups", "Sports facilities", "Library"]
+CONS = ["Hostel food", "Strict attendance", "Old infrastructure", "Far from city", "High fees",
+        "Limited electives", "Slow administration", "Crowded classrooms", "Poor wifi", "Few core companies"]
+EVENT_ACTIONS = (["view", "favorite", "compare", "search"], [0.8, 0.08, 0.07, 0.05])
+
+
+def object_ids(kind: int, indexes: Iterable[int]) -> List[ObjectId]:
+    """Deterministic _ids: fixed timestamp, one byte of collection kind, seven bytes of index"""
+    prefix = struct.pack(">IB", BASE_TS, kind)
+    return [ObjectId(prefix + int(i).to_bytes(7, "big")) for i in indexes]
+
+
+def dedupe_key(name: str, city: str, state: str) -> str:
+    """Same normalization as the server's college_dedupe_key"""
+    def norm(value: str) -> str:
+        return " ".join(re.findall(r"[a-z0-9]+", value.lower().replace("&", " and ")))
+    return f"{norm(name)}|{norm(city)}|{norm(state)}"
+
+
+class ZipfSampler:
+    """Draw indexes 0..n-1 with P(i) proportional to 1 / (i + 1) ** exponent"""
+
+    def __init__(self, n: int, exponent: float):
+        weights = 1.0 / np.arange(1, n + 1, dtype=np.float64) ** exponent
+        self.cdf = np.cumsum(weights / weights.sum())
+
+    def sample(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        return np.minimum(np.searchsorted(self.cdf, rng.random(size)), len(self.cdf) - 1)
+
+
+def _choice(rng: np.random.Generator, options, size: int) -> np.ndarray:
+    values, weights = options
+    return rng.choice(len(values), size=size, p=weights)
+
+
+def _records(columns: Dict[str, List[Any]]) -> List[Dict[str, Any]]:
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+class Generator:
+    """
+    One shard of the dataset. Shard k of N takes every N-th batch of each
+    collection and draws from its own RNG stream, so output is reproducible
+    for a given (seed, processes) pair.
+    """
+
+    def __init__(self, args, shard: int = 0, shards: int = 1):
+        self.args = args
+        self.shard, self.shards = shard, shards
+        self.rng = np.random.default_rng([args.seed, shard])
+        self.n_colleges = max(1, int(args.colleges * args.scale))
+        self.n_users = max(1, int(args.users * args.scale))
+        self.college_zipf = ZipfSampler(self.n_colleges, 1.05)
+        self.user_zipf = ZipfSampler(self.n_users, 0.8)
+        self.cities = [(state, city) for state, cities, _ in STATES for city in cities]
+        self.city_weights = np.array([w / len(cities) for _, cities, w in STATES for _ in cities])
+        self.city_weights /= self.city_weights.sum()
+        self.counters: Dict[str, int] = {}
+        # str(_id) of every college, the college_id that child documents carry
+        self.college_ids = [str(oid) for oid in object_ids(1, range(self.n_colleges))]
+
+    # -- per-college quality, a deterministic function of popularity rank -----------------
+    def tier(self, idx: np.ndarray) -> np.ndarray:
+        """0.0 for the most popular college, 1.0 for the least"""
+        return idx / max(self.n_colleges - 1, 1)
+    # -- colleges (+ their cutoffs and seats) ---------------------------------------------
+    def college_batches(self) -> Iterator[Dict[str, List[Dict[str, Any]]]]:
+        rng, size = self.rng, self.args.batch_size
+        years = [BASE_TIME.year - d for d in range(3)]
+        for start in range(self.shard * size, self.n_colleges, self.shards * size):
+            idx = np.arange(start, min(start + size, self.n_colleges))
+            n = len(idx)
+            tier = self.tier(idx)
+            loc = rng.choice(len(self.cities), size=n, p=self.city_weights)
+            utype = _choice(rng, UNIVERSITY_TYPES, n)
+            fees = rng.lognormal(np.log(160000), 0.55, n) * np.where(utype == 0, 0.35, 1.0)
+            avg_pkg = rng.lognormal(np.log(1_400_000) - 1.3 * tier, 0.35, n)
+            students = rng.lognormal(np.log(6000), 0.6, n).astype(int) + 500
+            n_courses = rng.integers(3, 9, n)
+            course_order = np.argsort(rng.random((n, len(BRANCHES))), axis=1)
+            courses = [[BRANCHES[j] for j in row[:k]] for row, k in zip(course_order.tolist(), n_courses.tolist())]
+            kinds = rng.integers(0, len(NAME_KINDS), n)
+
+            states = [self.cities[l][0] for l in loc]
+            cities = [self.cities[l][1] for l in loc]
+            names = [f"{cities[i]} {NAME_KINDS[kinds[i]]} {idx[i] + 1}" for i in range(n)]
+            colleges = _records({
+                "_id": object_ids(1, idx),
+                "name": names,
+                "city": cities,
+                "state": states,
+                "country": ["India"] * n,
+                "ranking": (idx + 1).tolist(),
+                "star_rating": np.round(np.clip(rng.normal(4.5 - 1.3 * tier, 0.25), 1.0, 5.0), 1).tolist(),
+                "annual_fees": fees.astype(int).tolist(),
+                "courses_offered": courses,
+                "established_year": rng.integers(1950, 2019, n).tolist(),
+                "university_type": [UNIVERSITY_TYPES[0][t] for t in utype],
+                "accreditation": [[ACCREDITATIONS[min(int(t * 6), 5)]] for t in tier],
+                "campus_size": [f"{a} acres" for a in rng.integers(20, 500, n)],
+                "total_students": students.tolist(),
+                "faculty_count": np.maximum(40, (students * rng.uniform(0.03, 0.07, n))).astype(int).tolist(),
+                "placement_percentage": np.round(np.clip(rng.normal(92 - 35 * tier, 7), 20, 100), 1).tolist(),
+                "average_package": avg_pkg.astype(int).tolist(),
+                "highest_package": (avg_pkg * rng.uniform(3, 10, n)).astype(int).tolist(),
+                "hostel_facilities": (rng.random(n) < 0.8).tolist(),
+                "library_facilities": [True] * n,
+                "sports_facilities": (rng.random(n) < 0.75).tolist(),
+                "wifi": (rng.random(n) < 0.9).tolist(),
+                "canteen": [True] * n,
+                "medical_facilities": (rng.random(n) < 0.6).tolist(),
+                "description": [f"Synthetic college #{i + 1} for load testing." for i in idx],
+                "admission_process": [EXAMS[0][e] for e in _choice(rng, EXAMS, n)],
+                "contact_email": [f"info@college{i + 1}.edu" for i in idx],
+                "contact_phone": [f"+91-{p}" for p in rng.integers(1_000_000_000, 9_999_999_999, n)],
+                "website": [f"https://college{i + 1}.edu" for i in idx],
+                "address": [f"{cities[i]}, {states[i]}, India" for i in range(n)],
+                "updated_at": [BASE_TIME] * n,
+                "version": [1] * n,
+                "dedupe_key": [dedupe_key(names[i], cities[i], states[i]) for i in range(n)],
+            })
+            yield {
+                "colleges": colleges,
+                "cutoffs": self._cutoffs(idx, tier, courses, years),
+                "seats": self._seats(idx, courses, years[:2]),
+            }
+
+    def _cutoffs(self, idx, tier, courses, years) -> List[Dict[str, Any]]:
+        rng = self.rng
+        # Popular colleges publish more cutoff rows (more exams/categories/rounds)
+        counts = rng.poisson(self.args.cutoffs_per_college * (1.5 - tier))
+        owner = np.repeat(np.arange(len(idx)), counts)
+        total = len(owner)
+        n_courses = np.array([len(c) for c in courses])[owner]
+        branch_pos = (rng.random(total) * n_courses).astype(int)
+        category = _choice(rng, CATEGORIES, total)
+        rnd = rng.integers(1, 4, total)
+        year = rng.integers(0, len(years), total)
+        base = 300 + 250_000 * tier[owner] ** 0.8
+        ranks = base * CATEGORY_RANK_FACTOR[category] * (1 + 0.15 * (rnd - 1)) * rng.lognormal(0, 0.2, total)
+        return _records({
+            "_id": self._ids(2, "cutoffs", total),
+            "college_id": [self.college_ids[i] for i in idx[owner].tolist()],
+            "year": [years[y] for y in year],
+            "round": rnd.tolist(),
+            "exam": [EXAMS[0][e] for e in _choice(rng, EXAMS, total)],
+            "category": [CATEGORIES[0][c] for c in category],
+            "branch": [courses[o][b] for o, b in zip(owner, branch_pos)],
+            "closing_rank": ranks.astype(int).tolist(),
+            "closing_percentile": [None] * total,
+            "created_at": [BASE_TIME] * total,
+        })
+
+    def _seats(self, idx, courses, years) -> List[Dict[str, Any]]:
+        rng = self.rng
+        rows = [(i, branch, year) for i in range(len(idx)) for branch in courses[i] for year in years]
+        total = len(rows)
+        intake = rng.choice([30, 60, 120, 180, 240], size=total, p=[0.1, 0.45, 0.3, 0.1, 0.05])
+        return _records({
+            "_id": self._ids(3, "seats", total),
+            "college_id": [self.college_ids[idx[i]] for i, _, _ in rows],
+            "year": [y for _, _, y in rows],
+            "branch": [b for _, b, _ in rows],
+            "category": [None] * total,
+            "intake": intake.tolist(),
+            "created_at": [BASE_TIME] * total,
+        })
+
+    def _ids(self, kind: int, name: str, count: int) -> List[ObjectId]:
+        """_ids for rows whose count per college is random: shard number in the high bits, then a per-shard counter"""
+        start = self.counters.get(name, 0) + (self.shard << 40)
+        self.counters[name] = self.counters.get(name, 0) + count
+        return object_ids(kind, range(start, start + count))
+
+    # -- user activity --------------------------------------------------------------------
+    def _activity_batches(self, total: int, build: Callable[[int, int], List[Dict[str, Any]]]) -> Iterator[List[Dict[str, Any]]]:
+        """build(start, n) for this shard's batches; `start` is the global index of the first document"""
+        size = self.args.batch_size
+        for start in range(self.shard * size, total, self.shards * size):
+            yield build(start, min(size, total - start))
+
+    def _ages(self, n: int, days: int) -> np.ndarray:
+        """Age in whole seconds before BASE_TIME; recent activity is denser (exponential, clipped to the window)"""
+        return (np.minimum(self.rng.exponential(days / 3, n), days) * 86400).astype(np.int64)
+
+    @staticmethod
+    def _timestamps(ages: np.ndarray) -> List[datetime]:
+        return [BASE_TIME - timedelta(seconds=a) for a in ages.tolist()]
+
+    def review_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        rng = self.rng
+
+        def build(start: int, n: int) -> List[Dict[str, Any]]:
+            colleges = self.college_zipf.sample(rng, n)
+            users = self.user_zipf.sample(rng, n)
+            overall = np.round(np.clip(rng.normal(4.3 - 1.2 * self.tier(colleges), 0.6), 1, 5), 1)
+            dims = np.round(np.clip(overall[:, None] + rng.normal(0, 0.5, (n, 4)), 1, 5), 1)
+            helpful = rng.geometric(0.3, n) - 1
+            ages = self._ages(n, 3 * 365)
+            # reviews.helpful_score, vectorized
+            scores = np.log10(helpful + 1) + ((BASE_TIME - HELPFUL_SCORE_EPOCH).total_seconds() - ages) / HELPFUL_DECAY_SECONDS
+            pros = rng.integers(0, len(PROS), (n, 2))
+            cons = rng.integers(0, len(CONS), (n, 2))
+            return _records({
+                "_id": object_ids(4, range(start, start + n)),
+                "id": [f"rev-{i}" for i in range(start, start + n)],
+                "college_id": [self.college_ids[c] for c in colleges.tolist()],
+                "user_id": [f"user-{u}" for u in users],
+                "title": [f"Review of college {c + 1}" for c in colleges],
+                "body": [f"{PROS[p[0]]}; {CONS[c[0]].lower()} could improve." for p, c in zip(pros, cons)],
+                "rating_overall": overall.tolist(),
+                "rating_academics": dims[:, 0].tolist(),
+                "rating_placements": dims[:, 1].tolist(),
+                "rating_infra": dims[:, 2].tolist(),
+                "rating_faculty": dims[:, 3].tolist(),
+                "pros": [sorted({PROS[a], PROS[b]}) for a, b in pros],
+                "cons": [sorted({CONS[a], CONS[b]}) for a, b in cons],
+                "verified": (rng.random(n) < 0.3).tolist(),
+                "helpful_count": helpful.tolist(),
+                "helpful_score": scores.tolist(),
+                "created_at": self._timestamps(ages),
+            })
+        return self._activity_batches(int(self.args.reviews * self.args.scale), build)
+
+    def favorite_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        rng = self.rng
+
+        def build(start: int, n: int) -> List[Dict[str, Any]]:
+            colleges = self.college_zipf.sample(rng, n)
+            users = self.user_zipf.sample(rng, n)
+            return _records({
+                "_id": object_ids(5, range(start, start + n)),
+                "id": [f"fav-{i}" for i in range(start, start + n)],
+                "user_id": [f"user-{u}" for u in users],
+                "college_id": [self.college_ids[c] for c in colleges.tolist()],
+                "created_at": self._timestamps(self._ages(n, 365)),
+            })
+        return self._activity_batches(int(self.args.favorites * self.args.scale), build)
+
+    def event_batches(self) -> Iterator[List[Dict[str, Any]]]:
+        rng = self.rng
+
+        def build(start: int, n: int) -> List[Dict[str, Any]]:
+            colleges = self.college_zipf.sample(rng, n)
+            users = self.user_zipf.sample(rng, n)
+            actions = _choice(rng, EVENT_ACTIONS, n)
+            durations = rng.lognormal(np.log(25), 0.9, n).astype(int)
+            return _records({
+                "_id": object_ids(6, range(start, start + n)),
+                "user_id": [f"user-{u}" for u in users],
+                "college_id": [self.college_ids[c] for c in colleges.tolist()],
+                "action": [EVENT_ACTIONS[0][a] for a in actions],
+                "duration": durations.tolist(),
+                "created_at": self._timestamps(self._ages(n, 90)),
+            })
+        return self._activity_batches(int(self.args.events * self.args.scale), build)
+
+
+class BulkWriter:
+    """Unordered insert_many from a small thread pool; pymongo releases the GIL on socket I/O."""
+
+    def __init__(self, db, workers: int, unacknowledged: bool, dry_run: bool):
+        self.db = db
+        self.dry_run = dry_run
+        self.write_concern = WriteConcern(w=0) if unacknowledged else None
+        self.pool = ThreadPoolExecutor(max_workers=workers)
+        self.slots = threading.BoundedSemaphore(workers * 2)
+        self.counts: Dict[str, int] = {}
+        self.futures = []
+
+    def write(self, name: str, docs: List[Dict[str, Any]]) -> None:
+        if not docs:
+            return
+        self.counts[name] = self.counts.get(name, 0) + len(docs)
+        if self.dry_run:
+            return
+        collection = self.db.get_collection(name, write_concern=self.write_concern) if self.write_concern else self.db[name]
+        self.slots.acquire()
+
+        def run():
+            try:
+                collection.insert_many(docs, ordered=False, bypass_document_validation=True)
+            finally:
+                self.slots.release()
+        self.futures.append(self.pool.submit(run))
+        # Surface write errors early and keep the futures list short
+        done = [f for f in self.futures if f.done()]
+        for f in done:
+            f.result()
+        self.futures = [f for f in self.futures if not f.done()]
+
+    def close(self) -> None:
+        for f in self.futures:
+            f.result()
+        self.pool.shutdown()
+
+
+COLLECTIONS = ["colleges", "cutoffs", "seats", "reviews", "favorites", "browsing_events"]
+
+
+def run_shard(args, shard: int, shards: int) -> Dict[str, int]:
+    """Generate and write one shard; returns documents written per collection"""
+    client = None if args.dry_run else MongoClient(args.mongo_url)
+    db = client[args.db] if client else None
+    gen = Generator(args, shard, shards)
+    writer = BulkWriter(db, args.workers, args.unacknowledged, args.dry_run)
+    started = time.monotonic()
+
+    def progress(label: str) -> None:
+        elapsed = time.monotonic() - started
+        total = sum(writer.counts.values())
+        print(f"[{elapsed:7.1f}s] shard {shard} {label}: {total:,} docs ({total / max(elapsed, 1e-9):,.0f} docs/s)", file=sys.stderr)
+
+    for i, batch in enumerate(gen.college_batches()):
+        for name, docs in batch.items():
+            writer.write(name, docs)
+        if i % 20 == 0:
+            progress("colleges")
+    for name, batches in (("reviews", gen.review_batches()), ("favorites", gen.favorite_batches()), ("browsing_events", gen.event_batches())):
+        for i, docs in enumerate(batches):
+            writer.write(name, docs)
+            if i % 50 == 0:
+                progress(name)
+    writer.close()
+    if client:
+        client.close()
+    return writer.counts
+
+
+def main():
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument('--mongo-url', default=os.environ.get('MONGO_URL', 'mongodb://localhost:27017'))
+    ap.add_argument('--db', default=os.environ.get('DB_NAME', 'educompare_load'))
+    ap.add_argument('--seed', type=int, default=42)
+    ap.add_argument('--scale', type=float, default=1.0, help='Multiply every count (e.g. 0.01 for a quick run)')
+    ap.add_argument('--colleges', type=int, default=500_000)
+    ap.add_argument('--cutoffs-per-college', type=float, default=40.0, help='Average; popular colleges get more')
+    ap.add_argument('--users', type=int, default=2_000_000)
+    ap.add_argument('--reviews', type=int, default=5_000_000)
+    ap.add_argument('--favorites', type=int, default=3_000_000)
+    ap.add_argument('--events', type=int, default=20_000_000)
+    ap.add_argument('--batch-size', type=int, default=5000, help='Documents generated and inserted per batch')
+    ap.add_argument('--processes', type=int, default=max(1, min(8, (os.cpu_count() or 1))), help='Generator processes (shards)')
+    ap.add_argument('--workers', type=int, default=2, help='Concurrent insert_many calls per process')
+    ap.add_argument('--unacknowledged', action='store_true', help='w=0 writes (fastest, errors are not reported)')
+    ap.add_argument('--drop', action='store_true', help='Drop the generated collections first')
+    ap.add_argument('--dry-run', action='store_true', help='Generate without writing (measures generation speed)')
+    args = ap.parse_args()
+
+    db = None if args.dry_run else MongoClient(args.mongo_url)[args.db]
+    if args.drop and db is not None:
+        for name in COLLECTIONS:
+            db.drop_collection(name)
+
+    started = time.monotonic()
+    counts: Dict[str, int] = {}
+    if args.processes == 1:
+        results = [run_shard(args, 0, 1)]
+    else:
+        with ProcessPoolExecutor(max_workers=args.processes) as pool:
+            futures = [pool.submit(run_shard, args, shard, args.processes) for shard in range(args.processes)]
+            results = [f.result() for f in futures]
+    for result in results:
+        for name, n in result.items():
+            counts[name] = counts.get(name, 0) + n
+
+    if db is not None:
+        # Bump catalog version stamps so a running server drops its caches and ETags
+        for name in ("colleges", "cutoffs", "seats", "reviews"):
+            db.catalog_versions.update_one(
+                {"_id": name}, {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}}, upsert=True
+            )
+
+    elapsed = time.monotonic() - started
+    total = sum(counts.values())
+    print({**counts, "seconds": round(elapsed, 1), "docs_per_second": round(total / max(elapsed, 1e-9))})
+
+
+if __name__ == '__main__':
+    main()
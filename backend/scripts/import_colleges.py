@@ -16,21 +16,327 @@ Examples:
 
   # From JSON file with {"colleges": [...]}
   python backend/scripts/import_colleges.py --file backend/data/colleges_india_min.json
+
+  # Large file: 8 concurrent uploads; rerun with --resume after a failure
+  python backend/scripts/import_colleges.py --file india.csv --workers 8 --chunk-size 2000
+  python backend/scripts/import_colleges.py --file india.csv --workers 8 --chunk-size 2000 --resume
+
+  # Million-row CSV: normalize with pandas instead of row-by-row Python
+  python backend/scripts/import_colleges.py --file national.csv --columnar --courses-col Courses
+
+Input is read incrementally (CSV, NDJSON), split into chunks and uploaded as NDJSON
+by concurrent workers, each reusing one keep-alive connection. Failed chunks are
+retried with backoff; completed chunk offsets are recorded in a checkpoint file.
 """
 import argparse
 import csv
 import io
 import json
+import os
+import random
 import sys
-from typing import Dict, Any, List
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, as_completed, wait
+from typing import Dict, Any, List, Iterator, Optional, BinaryIO, Tuple
 from urllib import request
 
+import requests
+
 
 def fetch_bytes(url: str) -> bytes:
     with request.urlopen(url) as resp:
         return resp.read()
 
 
+def map_csv_row(row: Dict[str, Any], args) -> Optional[Dict[str, Any]]:
+    """Map one CSV row through the column options; None when name/city/state is missing."""
+    item: Dict[str, Any] = {}
+    def g(col):
+        return row.get(col) if col else None
+
+    item['name'] = (g(args.name_col) or '').strip()
+    item['city'] = (g(args.city_col) or '').strip()
+    item['state'] = (g(args.state_col) or '').strip()
+    if args.website_col:
+        item['website'] = (g(args.website_col) or '').strip()
+    if args.university_type_col:
+        item['university_type'] = (g(args.university_type_col) or '').strip()
+    if args.courses_col:
+        raw_courses = (g(args.courses_col) or '').strip()
+        if raw_courses:
+            # split by comma or semicolon
+            parts = [c.strip() for c in raw_courses.replace(';', ',').split(',') if c.strip()]
+            if parts:
+                item['courses_offered'] = parts
+    if not item['name'] or not item['city'] or not item['state']:
+        return None
+    return item
+
+
+def open_input(args) -> BinaryIO:
+    if args.file:
+        return open(args.file, 'rb')
+    if args.url:
+        return request.urlopen(args.url)
+    raise SystemExit("Provide --file or --url")
+
+
+def input_format(args) -> str:
+    """'json', 'ndjson' or 'csv', from the --file/--url extension (CSV when unrecognized)"""
+    source = (args.file or args.url or '').lower().split('?')[0]
+    if source.endswith('.json'):
+        return 'json'
+    if source.endswith(('.ndjson', '.jsonl')):
+        return 'ndjson'
+    return 'csv'
+
+
+def iter_records(args) -> Iterator[Dict[str, Any]]:
+    """Yield college records one at a time; CSV and NDJSON are streamed, a JSON document is loaded whole."""
+    fmt = input_format(args)
+    if fmt == 'json':
+        yield from load_input(args).get('colleges', [])
+        return
+    with open_input(args) as raw:
+        text = io.TextIOWrapper(raw, encoding='utf-8', errors='replace', newline='')
+        if fmt == 'ndjson':
+            for line in text:
+                if line.strip():
+                    yield json.loads(line)
+            return
+        for row in csv.DictReader(text, delimiter=args.delimiter):
+            item = map_csv_row(row, args)
+            if item:
+                yield item
+
+
+# Columnar (pandas) CSV normalization: rows read per pandas chunk
+COLUMNAR_READ_ROWS = 200_000
+
+
+def _dedupe_hashes(frame) -> Any:
+    """
+    64-bit hashes of the server's college_dedupe_key (case/punctuation/spacing insensitive),
+    computed per normalized column and combined per row without building the joined string.
+    """
+    import pandas as pd
+
+    parts = pd.DataFrame({
+        col: frame[col].str.lower().str.replace('&', ' and ', regex=False)
+        .str.replace(r'[^a-z0-9]+', ' ', regex=True).str.strip()
+        for col in ('name', 'city', 'state')
+    })
+    return pd.util.hash_pandas_object(parts, index=False).to_numpy()
+
+
+def normalize_frame(frame, seen_hashes: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Trim, split courses, drop incomplete rows and in-file duplicates, all as column operations.
+    `frame` already has canonical column names; `seen_hashes['keys']` is a sorted array of the
+    64-bit dedupe-key hashes from earlier chunks.
+    """
+    import numpy as np
+    import pandas as pd
+
+    frame = frame.apply(lambda col: col.str.strip())
+    frame = frame[(frame['name'] != '') & (frame['city'] != '') & (frame['state'] != '')]
+
+    hashes = _dedupe_hashes(frame)
+    fresh = ~pd.Series(hashes).duplicated().to_numpy() & ~np.isin(hashes, seen_hashes['keys'])
+    frame = frame[fresh]
+    seen_hashes['keys'] = np.union1d(seen_hashes['keys'], hashes[fresh])
+
+    if 'courses_offered' in frame.columns:
+        # Collapse separator runs, trim the ends, then split: no empty or padded entries remain
+        courses = (
+            frame['courses_offered'].str.replace(r'(\s*[;,]\s*)+', ',', regex=True).str.strip(' ,')
+        )
+        frame = frame.assign(courses_offered=courses.where(courses != '').str.split(','))
+
+    # Build dicts from column lists (much cheaper than DataFrame.to_dict); empty optional
+    # cells are left out so server defaults apply
+    names = list(frame.columns)
+    columns = [frame[c].astype(object).where(frame[c].notna(), None).tolist() for c in names]
+    required = len([c for c in names if c in ('name', 'city', 'state')])
+    if required == len(names):
+        return [dict(zip(names, values)) for values in zip(*columns)]
+    return [{k: v for k, v in zip(names, values) if v} for values in zip(*columns)]
+
+
+def iter_records_columnar(args) -> Iterator[Dict[str, Any]]:
+    """CSV records normalized with pandas, one chunk of COLUMNAR_READ_ROWS rows at a time."""
+    if input_format(args) != 'csv':
+        raise SystemExit("--columnar only supports CSV input; drop it for JSON/NDJSON files")
+    import numpy as np
+    import pandas as pd
+
+    mapping = {
+        args.name_col: 'name',
+        args.city_col: 'city',
+        args.state_col: 'state',
+        args.website_col: 'website',
+        args.university_type_col: 'university_type',
+        args.courses_col: 'courses_offered',
+    }
+    mapping = {src: dst for src, dst in mapping.items() if src}
+    # Typed empty seed: union1d with a plain [] would upcast the hashes to float64, which merges distinct keys above 2**53
+    seen_hashes: Dict[str, Any] = {'keys': np.empty(0, dtype=np.uint64)}
+    with open_input(args) as raw:
+        reader = pd.read_csv(
+            raw,
+            sep=args.delimiter,
+            usecols=list(mapping),
+            dtype={col: 'string' for col in mapping},
+            keep_default_na=False,
+            chunksize=COLUMNAR_READ_ROWS,
+            encoding_errors='replace',
+        )
+        for frame in reader:
+            yield from normalize_frame(frame.rename(columns=mapping), seen_hashes)
+
+
+def iter_chunks(records: Iterator[Dict[str, Any]], size: int) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+    """(row offset, rows) chunks; offsets are stable across runs of the same input."""
+    chunk: List[Dict[str, Any]] = []
+    offset = 0
+    for record in records:
+        chunk.append(record)
+        if len(chunk) >= size:
+            yield offset, chunk
+            offset += len(chunk)
+            chunk = []
+    if chunk:
+        yield offset, chunk
+
+
+class Checkpoint:
+    """Completed chunk offsets for one input, rewritten atomically after every chunk."""
+
+    def __init__(self, path: str, source: str, chunk_size: int):
+        self.path = path
+        self.data: Dict[str, Any] = {
+            'source': source,
+            'chunk_size': chunk_size,
+            'completed': [],
+            'totals': {'inserted': 0, 'skipped': 0, 'rejected': 0},
+        }
+
+    def load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path) as f:
+            saved = json.load(f)
+        if saved.get('source') != self.data['source'] or saved.get('chunk_size') != self.data['chunk_size']:
+            raise SystemExit(f"{self.path} was written for a different input or --chunk-size")
+        self.data = saved
+
+    @property
+    def completed(self) -> set:
+        return set(self.data['completed'])
+
+    def mark_done(self, offset: int, result: Dict[str, Any]) -> None:
+        self.data['completed'].append(offset)
+        for key in self.data['totals']:
+            self.data['totals'][key] += int(result.get(key) or 0)
+        tmp = self.path + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.data, f)
+        os.replace(tmp, self.path)
+
+
+class RetryableUploadError(Exception):
+    pass
+
+
+_local = threading.local()
+
+
+def _session() -> 'requests.Session':
+    """One keep-alive session per worker thread"""
+    if not hasattr(_local, 'session'):
+        _local.session = requests.Session()
+    return _local.session
+
+
+def upload_chunk(rows: List[Dict[str, Any]], args) -> Dict[str, Any]:
+    """POST one chunk as NDJSON, retrying 5xx/429/connection errors with jittered exponential backoff."""
+    url = args.backend.rstrip('/') + '/api/colleges/bulk'
+    body = b'\n'.join(json.dumps(row).encode('utf-8') for row in rows) + b'\n'
+    for attempt in range(args.retries + 1):
+        try:
+            resp = _session().post(url, data=body, headers={'Content-Type': 'application/x-ndjson'}, timeout=args.timeout)
+            if resp.status_code == 429 or resp.status_code >= 500:
+                raise RetryableUploadError(f"HTTP {resp.status_code}")
+            resp.raise_for_status()
+            return resp.json()
+        except (RetryableUploadError, requests.ConnectionError, requests.Timeout) as e:
+            if attempt == args.retries:
+                raise
+            delay = min(args.backoff * 2 ** attempt, 30.0) * random.uniform(0.5, 1.5)
+            print(f"chunk failed ({e}), retrying in {delay:.1f}s", file=sys.stderr)
+            time.sleep(delay)
+    raise AssertionError('unreachable')
+
+
+def upload_parallel(records: Iterator[Dict[str, Any]], args) -> Dict[str, Any]:
+    """
+    Upload chunks with `args.workers` concurrent connections. At most two chunks per
+    worker are in memory at once; completed offsets go to the checkpoint so a rerun
+    with --resume skips them (re-sent rows are deduped server-side anyway).
+    """
+    source = os.path.abspath(args.file) if args.file else args.url
+    checkpoint = Checkpoint(args.checkpoint or default_checkpoint_path(args), source, args.chunk_size)
+    if args.resume:
+        checkpoint.load()
+    done = checkpoint.completed
+    failed: List[Tuple[int, str]] = []
+    rows_sent = 0
+    started = time.monotonic()
+
+    def collect(future, offset: int, count: int) -> None:
+        nonlocal rows_sent
+        error = future.exception()
+        if error is not None:
+            failed.append((offset, str(error)))
+            print(f"chunk at row {offset} failed: {error}", file=sys.stderr)
+            return
+        checkpoint.mark_done(offset, future.result())
+        rows_sent += count
+        elapsed = time.monotonic() - started
+        print(f"{rows_sent} rows uploaded ({rows_sent / max(elapsed, 1e-9):.0f} rows/s)", file=sys.stderr)
+
+    with ThreadPoolExecutor(max_workers=args.workers) as pool:
+        in_flight: Dict[Any, Tuple[int, int]] = {}
+        for offset, rows in iter_chunks(records, args.chunk_size):
+            if offset in done:
+                continue
+            in_flight[pool.submit(upload_chunk, rows, args)] = (offset, len(rows))
+            if len(in_flight) >= args.workers * 2:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    collect(future, *in_flight.pop(future))
+        for future in as_completed(list(in_flight)):
+            collect(future, *in_flight.pop(future))
+
+    elapsed = time.monotonic() - started
+    return {
+        **checkpoint.data['totals'],
+        'rows_uploaded': rows_sent,
+        'chunks_resumed': len(done),
+        'failed_chunks': [{'offset': offset, 'error': error} for offset, error in failed],
+        'seconds': round(elapsed, 2),
+        'rows_per_second': round(rows_sent / max(elapsed, 1e-9), 1),
+        'checkpoint': checkpoint.path,
+    }
+
+
+def default_checkpoint_path(args) -> str:
+    if args.file:
+        return args.file + '.checkpoint.json'
+    return 'import_colleges.checkpoint.json'
+
+
 def load_input(args) -> Dict[str, Any]:
     if args.file:
         with open(args.file, 'rb') as f:
@@ -55,27 +361,9 @@ def load_input(args) -> Dict[str, Any]:
     reader = csv.DictReader(io.StringIO(text), delimiter=args.delimiter)
     out: List[Dict[str, Any]] = []
     for row in reader:
-        item: Dict[str, Any] = {}
-        def g(col):
-            return row.get(col) if col else None
-
-        item['name'] = (g(args.name_col) or '').strip()
-        item['city'] = (g(args.city_col) or '').strip()
-        item['state'] = (g(args.state_col) or '').strip()
-        if args.website_col:
-            item['website'] = (g(args.website_col) or '').strip()
-        if args.university_type_col:
-            item['university_type'] = (g(args.university_type_col) or '').strip()
-        if args.courses_col:
-            raw_courses = (g(args.courses_col) or '').strip()
-            if raw_courses:
-                # split by comma or semicolon
-                parts = [c.strip() for c in raw_courses.replace(';', ',').split(',') if c.strip()]
-                if parts:
-                    item['courses_offered'] = parts
-        if not item['name'] or not item['city'] or not item['state']:
-            continue
-        out.append(item)
+        item = map_csv_row(row, args)
+        if item:
+            out.append(item)
     return {"colleges": out}
 
 
@@ -105,7 +393,28 @@ def main():
     ap.add_argument('--website-col', default=None)
     ap.add_argument('--university-type-col', default=None)
     ap.add_argument('--courses-col', default=None)
+    # Upload tuning
+    ap.add_argument('--workers', type=int, default=4, help='Concurrent upload connections (default 4)')
+    ap.add_argument('--chunk-size', type=int, default=1000, help='Rows per request (default 1000)')
+    ap.add_argument('--retries', type=int, default=5, help='Retries per chunk on 5xx/429/connection errors')
+    ap.add_argument('--backoff', type=float, default=0.5, help='Initial retry delay in seconds (doubles per attempt)')
+    ap.add_argument('--timeout', type=float, default=120.0, help='Per-request timeout in seconds')
+    ap.add_argument('--checkpoint', default=None, help='Checkpoint file (default <file>.checkpoint.json)')
+    ap.add_argument('--resume', action='store_true', help='Skip chunks recorded as completed in the checkpoint')
+    ap.add_argument('--no-stream', action='store_true', help='Load the whole input and send it as one JSON request')
+    ap.add_argument('--columnar', action='store_true', help='Normalize CSV with pandas (vectorized trim/split/filter/dedupe)')
     args = ap.parse_args()
+    if args.columnar and input_format(args) != 'csv':
+        ap.error('--columnar only supports CSV input; drop it for JSON/NDJSON files')
+
+    if not args.no_stream:
+        records = iter_records_columnar(args) if args.columnar else iter_records(args)
+        res = upload_parallel(records, args)
+        print(json.dumps(res, indent=2))
+        if res['failed_chunks']:
+            print('Some chunks failed; rerun with --resume to retry them.', file=sys.stderr)
+            sys.exit(1)
+        return
 
     data = load_input(args)
     if not data.get('colleges'):
@@ -1,33 +1,74 @@
-from fastapi import FastAPI, APIRouter, Query, HTTPException
+from fastapi import FastAPI, APIRouter, Query, HTTPException, Request, Response
 from dotenv import load_dotenv
+from fastapi.responses import JSONResponse, StreamingResponse
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReplaceOne, ReturnDocument, UpdateOne
+from pymongo.errors import BulkWriteError, DuplicateKeyError
 import os
+import asyncio
 import logging
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any, Union
+from pydantic import BaseModel, Field, ValidationError
+from typing import List, Optional, Dict, Any, Union, AsyncIterator, Set, Tuple, Type
+from collections import OrderedDict
 import uuid
-from datetime import datetime
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from bson import ObjectId
 import re
 from recommendation_engine import RecommendationEngine
-import io
-import csv
+from comparison import build_comparison_matrix, select_comparison_columns, ComparisonCache
+from cutoff_analytics import CutoffRankIndex, trend_key, merge_trend_series, summarize_trend, join_competitiveness
+from reviews import (
+    review_stats_increments, accumulate_review_stats, summarize_review_stats,
+    helpful_score, helpful_score_update, review_term_increments, top_terms, terms_to_prune,
+    TERM_PRUNE_EVERY,
+)
+from helpful_votes import HelpfulVoteBuffer
+from jobs import JobRunner, Job
+from fuzzy_dedupe import college_signature, best_match, city_tokens
+from metrics import MetricsRegistry, HTTPMetrics, MetricsMiddleware, MongoCommandMetrics, PROMETHEUS_CONTENT_TYPE
+from exports import CUTOFF_EXPORT_TYPES, SEAT_EXPORT_TYPES, EXPORT_FORMATS, COMPRESSED_FORMATS, EXPORT_BATCH_SIZE, stream_export, gzip_stream
 import random
 import json
+import csv
+import codecs
+import tempfile
+import hashlib
 import urllib.request
+import orjson
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
+# Process-wide metrics, exposed on /metrics
+metrics_registry = MetricsRegistry()
+
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, event_listeners=[MongoCommandMetrics(metrics_registry)])
 db = client[os.environ['DB_NAME']]
 
+def _orjson_default(obj: Any) -> Any:
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered by orjson (datetime, numpy values and ObjectId handled natively).
+
+    Handlers that build payloads from trusted documents via college_helper return
+    this directly, which skips response_model validation and jsonable_encoder; the
+    college write paths validate through the College model so stored fields are typed.
+    """
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_orjson_default, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=FastJSONResponse)
 
 # Add CORS middleware first
 app.add_middleware(
@@ -37,6 +78,13 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Added last so it is outermost: timings include CORS and error handling
+app.add_middleware(MetricsMiddleware, metrics=HTTPMetrics(metrics_registry))
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus text exposition of HTTP and MongoDB metrics"""
+    return Response(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -44,6 +92,50 @@ api_router = APIRouter(prefix="/api")
 # Initialize recommendation engine
 recommendation_engine = RecommendationEngine()
 
+# Sorted closing-rank arrays for the admission predictor (rebuilt lazily when stale)
+cutoff_rank_index = CutoffRankIndex()
+cutoff_rank_index_lock = asyncio.Lock()
+
+# Cutoff filter facets keyed by college_id (None = global) -> (cutoffs version, payload)
+cutoff_options_cache: Dict[Optional[str], Any] = {}
+CUTOFF_OPTIONS_CACHE_MAX = 4096
+
+# Max concurrent Mongo round trips a single handler fans out
+MONGO_FANOUT_LIMIT = int(os.environ.get('MONGO_FANOUT_LIMIT', '8'))
+
+# Full refresh interval for the competitiveness view (0 disables the periodic task)
+COMPETITIVENESS_REFRESH_SECONDS = int(os.environ.get('COMPETITIVENESS_REFRESH_SECONDS', '3600'))
+COMPETITIVENESS_CHUNK = 200
+
+# Compare-and-retry attempts when concurrent cutoff inserts race on one trend document
+TREND_UPDATE_RETRIES = 8
+
+# Natural keys for bulk upserts (match the compound indexes in create_indexes)
+CUTOFF_NATURAL_KEY = ["college_id", "year", "exam", "category", "branch", "round"]
+SEAT_NATURAL_KEY = ["college_id", "year", "branch", "category"]
+BULK_BATCH_SIZE = 1000
+BULK_MAX_ERRORS = 20
+
+# Background jobs: concurrent job limit and where uploaded import bodies are spooled
+JOB_CONCURRENCY = int(os.environ.get('JOB_CONCURRENCY', '2'))
+JOB_SPOOL_DIR = Path(os.environ.get('JOB_SPOOL_DIR', Path(tempfile.gettempdir()) / 'educompare-jobs'))
+JOB_SPOOL_CHUNK = 1 << 20
+SEED_JOB_BATCH = 1000
+
+# Running reports of streamed college imports, by import id (most recent kept)
+import_progress: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+IMPORT_PROGRESS_MAX = 100
+
+# Conditional GET: how long clients may reuse catalog responses before revalidating
+CATALOG_CACHE_CONTROL = f"public, max-age={int(os.environ.get('CATALOG_CACHE_MAX_AGE', '60'))}, must-revalidate"
+
+# Helpful taps are buffered in-process and flushed as one bulk write per interval
+HELPFUL_FLUSH_SECONDS = float(os.environ.get('HELPFUL_FLUSH_SECONDS', '2'))
+HELPFUL_MAX_PENDING = int(os.environ.get('HELPFUL_MAX_PENDING', '5000'))
+
+# Comparison payloads keyed by (sorted college ids, catalog version)
+comparison_cache = ComparisonCache(maxsize=int(os.environ.get('COMPARISON_CACHE_SIZE', '512')))
+
 # Define Models
 class College(BaseModel):
     id: Optional[str] = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -170,6 +262,9 @@ class CollegeResponse(BaseModel):
     departments: List[str] = []
     campus_life: List[str] = []
     video_urls: List[str] = []
+    updated_at: Optional[datetime] = None
+    version: int = 0
+    review_summary: Optional[Dict[str, Any]] = None
 
 class CollegeSearchResponse(BaseModel):
     colleges: List[CollegeResponse]
@@ -337,10 +432,18 @@ def college_helper(college) -> dict:
         "departments": college.get("departments", []),
         "campus_life": college.get("campus_life", []),
         "video_urls": college.get("video_urls", []),
+        "updated_at": college.get("updated_at") or college.get("created_at"),
+        "version": college.get("version", 0),
+        "review_summary": summarize_review_stats(college.get("review_stats")),
     }
 
 def _fill_defaults_for_college(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Fill required College fields with sensible defaults if missing for bulk imports."""
+    """
+    Fill required College fields with sensible defaults if missing for bulk imports, then coerce
+    every field to its College type (CSV/NDJSON cells arrive as strings). Raises ValidationError.
+    """
+    # Blank cells count as missing
+    data = {k: v for k, v in data.items() if v is not None and v != ""}
     now_year = datetime.utcnow().year
     name = data.get("name", "Unnamed College")
     city = data.get("city", "City")
@@ -351,24 +454,24 @@ def _fill_defaults_for_college(data: Dict[str, Any]) -> Dict[str, Any]:
     defaults: Dict[str, Any] = {
         "country": "India",
         "ranking": data.get("ranking") or random.randint(1, 500),
-        "star_rating": float(data.get("star_rating") or round(random.uniform(3.2, 4.8), 1)),
-        "annual_fees": int(data.get("annual_fees") or random.randint(90000, 350000)),
+        "star_rating": data.get("star_rating") or round(random.uniform(3.2, 4.8), 1),
+        "annual_fees": data.get("annual_fees") or random.randint(90000, 350000),
         "courses_offered": data.get("courses_offered") or ["Computer Science","Electronics","Mechanical Engineering","Civil Engineering"],
-        "established_year": int(data.get("established_year") or random.randint(1950, now_year-5)),
+        "established_year": data.get("established_year") or random.randint(1950, now_year-5),
         "university_type": uni_type,
         "accreditation": data.get("accreditation") or ["AICTE"],
         "campus_size": data.get("campus_size") or f"{random.randint(30, 300)} acres",
-        "total_students": int(data.get("total_students") or random.randint(2000, 30000)),
-        "faculty_count": int(data.get("faculty_count") or random.randint(150, 1200)),
-        "placement_percentage": float(data.get("placement_percentage") or round(random.uniform(55.0, 96.0), 1)),
-        "average_package": int(data.get("average_package") or random.randint(450000, 1500000)),
-        "highest_package": int(data.get("highest_package") or random.randint(1500000, 6000000)),
-        "hostel_facilities": bool(data.get("hostel_facilities") if data.get("hostel_facilities") is not None else random.choice([True, True, False])),
-        "library_facilities": bool(data.get("library_facilities") if data.get("library_facilities") is not None else True),
-        "sports_facilities": bool(data.get("sports_facilities") if data.get("sports_facilities") is not None else random.choice([True, True, False])),
-        "wifi": bool(data.get("wifi") if data.get("wifi") is not None else True),
-        "canteen": bool(data.get("canteen") if data.get("canteen") is not None else True),
-        "medical_facilities": bool(data.get("medical_facilities") if data.get("medical_facilities") is not None else random.choice([True, False])),
+        "total_students": data.get("total_students") or random.randint(2000, 30000),
+        "faculty_count": data.get("faculty_count") or random.randint(150, 1200),
+        "placement_percentage": data.get("placement_percentage") or round(random.uniform(55.0, 96.0), 1),
+        "average_package": data.get("average_package") or random.randint(450000, 1500000),
+        "highest_package": data.get("highest_package") or random.randint(1500000, 6000000),
+        "hostel_facilities": data.get("hostel_facilities") if data.get("hostel_facilities") is not None else random.choice([True, True, False]),
+        "library_facilities": data.get("library_facilities") if data.get("library_facilities") is not None else True,
+        "sports_facilities": data.get("sports_facilities") if data.get("sports_facilities") is not None else random.choice([True, True, False]),
+        "wifi": data.get("wifi") if data.get("wifi") is not None else True,
+        "canteen": data.get("canteen") if data.get("canteen") is not None else True,
+        "medical_facilities": data.get("medical_facilities") if data.get("medical_facilities") is not None else random.choice([True, False]),
         "description": data.get("description") or f"{name} is a higher education institute in {city}, {state}.",
         "admission_process": data.get("admission_process") or random.choice(["JEE Main","State CET","Institutional Exam"]),
         "contact_email": data.get("contact_email") or f"info@{name.lower().replace(' ','')}.edu",
@@ -391,7 +494,531 @@ def _fill_defaults_for_college(data: Dict[str, Any]) -> Dict[str, Any]:
         if merged.get(key) is None:
             # fallback if something slipped through
             merged[key] = defaults[key]
-    return merged
+    # "250000" -> 250000, "false" -> False; extra columns are kept as given
+    return {**merged, **College.model_validate(merged).model_dump(exclude={"id"})}
+
+async def _gather_bounded(*aws, limit: int = MONGO_FANOUT_LIMIT) -> List[Any]:
+    """
+    Run independent awaitables concurrently, at most `limit` at a time, returning results in order.
+    The first failure cancels the remaining work and is re-raised.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+async def _get_version_stamp(name: str) -> Dict[str, Any]:
+    """Version and last write time of a catalog collection (version 0 if never written)."""
+    doc = await db.catalog_versions.find_one({"_id": name})
+    return {"version": int(doc.get("version", 0)), "updated_at": doc.get("updated_at")} if doc else {"version": 0, "updated_at": None}
+
+async def _get_version(name: str) -> int:
+    """Current version stamp of a catalog collection (0 if never written)."""
+    return (await _get_version_stamp(name))["version"]
+
+async def _bump_version(name: str) -> int:
+    """Increment the version stamp of a catalog collection after a write."""
+    doc = await db.catalog_versions.find_one_and_update(
+        {"_id": name},
+        {"$inc": {"version": 1}, "$set": {"updated_at": datetime.utcnow()}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    return int(doc.get("version", 0)) if doc else 0
+
+def _college_query(college_id: str) -> Dict[str, Any]:
+    """Match a college by ObjectId when the id looks like one, else by custom id."""
+    return {"_id": ObjectId(college_id)} if ObjectId.is_valid(college_id) else {"id": college_id}
+
+def college_dedupe_key(name: Any, city: Any, state: Any) -> str:
+    """Normalized (name, city, state) identity: case, punctuation and spacing insensitive."""
+    def norm(value: Any) -> str:
+        text = str(value or "").lower().replace("&", " and ")
+        return " ".join(re.findall(r"[a-z0-9]+", text))
+    return "|".join(norm(v) for v in (name, city, state))
+
+def _stamp_new_college(doc: Dict[str, Any]) -> Dict[str, Any]:
+    """Set the per-document content version and dedupe key on a college about to be inserted."""
+    doc["updated_at"] = datetime.utcnow()
+    doc["version"] = 1
+    doc["dedupe_key"] = college_dedupe_key(doc.get("name"), doc.get("city"), doc.get("state"))
+    return doc
+
+async def _insert_new_colleges(docs: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Insert stamped colleges as one unordered bulk write; the unique dedupe_key index rejects
+    duplicates (of existing rows or within the batch). Returns (inserted docs, duplicate count).
+    """
+    if not docs:
+        return [], 0
+    try:
+        await db.colleges.insert_many(docs, ordered=False)
+        inserted, duplicates = docs, 0
+    except BulkWriteError as e:
+        errors = e.details.get("writeErrors", [])
+        if any(err.get("code") != 11000 for err in errors):
+            raise
+        failed = {err["index"] for err in errors}
+        inserted, duplicates = [d for i, d in enumerate(docs) if i not in failed], len(failed)
+    await _store_college_signatures(inserted)
+    return inserted, duplicates
+
+async def _store_college_signatures(docs: List[Dict[str, Any]]) -> None:
+    """Persist MinHash/LSH signatures of newly inserted colleges so later imports can be fuzzy-checked."""
+    ops = [
+        UpdateOne(
+            {"college_id": str(doc["_id"])},
+            {"$set": {
+                "name": doc.get("name"),
+                "dedupe_key": college_dedupe_key(doc.get("name"), doc.get("city"), doc.get("state")),
+                **college_signature(doc),
+            }},
+            upsert=True,
+        )
+        for doc in docs
+    ]
+    if ops:
+        await db.college_signatures.bulk_write(ops, ordered=False)
+
+async def _fuzzy_screen(docs: List[Dict[str, Any]], mode: str, report: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Find likely duplicates of incoming colleges among stored ones and earlier rows of the chunk.
+
+    Candidates share an LSH band key (same state/city block, similar name tokens) and are
+    confirmed by weighted token Jaccard. One signature lookup per chunk. mode "flag" inserts and
+    reports them; "skip" treats them as duplicates of the existing college and drops them
+    (counted as skipped_fuzzy). Exact dedupe_key duplicates are left to the unique index.
+    """
+    if mode == "off" or not docs:
+        return docs
+    signatures = [college_signature(doc) for doc in docs]
+    all_keys = list({key for sig in signatures for key in sig["band_keys"]})
+    stored: Dict[str, List[Tuple[Dict[str, Any], List[str]]]] = {}
+    seen_keys: Set[Optional[str]] = set()
+    if all_keys:
+        cursor = db.college_signatures.find(
+            {"band_keys": {"$in": all_keys}}, {"_id": 0, "college_id": 1, "name": 1, "dedupe_key": 1, "tokens": 1, "band_keys": 1}
+        )
+        async for row in cursor:
+            for key in row["band_keys"]:
+                stored.setdefault(key, []).append(({"id": row["college_id"], "name": row.get("name")}, row["tokens"]))
+            seen_keys.add(row.get("dedupe_key"))
+
+    report.setdefault("possible_duplicates", 0)
+    report.setdefault("skipped_fuzzy", 0)
+    report.setdefault("duplicate_samples", [])
+    kept: List[Dict[str, Any]] = []
+    for doc, sig in zip(docs, signatures):
+        if doc.get("dedupe_key") in seen_keys:
+            # Exact duplicate: the unique index rejects it and counts it as skipped
+            kept.append(doc)
+            continue
+        candidates = [c for key in sig["band_keys"] for c in stored.get(key, [])]
+        match = best_match(sig["tokens"], candidates, common=city_tokens(doc.get("city")))
+        if match is None:
+            kept.append(doc)
+            seen_keys.add(doc.get("dedupe_key"))
+            # Later rows of this chunk are checked against this one too
+            for key in sig["band_keys"]:
+                stored.setdefault(key, []).append(({"id": None, "name": doc.get("name")}, sig["tokens"]))
+            continue
+        ref, similarity = match
+        report["possible_duplicates"] += 1
+        if len(report["duplicate_samples"]) < BULK_MAX_ERRORS:
+            report["duplicate_samples"].append({
+                "name": doc.get("name"), "city": doc.get("city"), "state": doc.get("state"),
+                "matched_id": ref["id"], "matched_name": ref["name"], "similarity": round(similarity, 3),
+            })
+        if mode == "skip":
+            report["skipped_fuzzy"] += 1
+        else:
+            kept.append(doc)
+            seen_keys.add(doc.get("dedupe_key"))
+    return kept
+
+def _make_etag(*parts: Any) -> str:
+    """Strong ETag derived from version stamps and request identity."""
+    digest = hashlib.sha1(json.dumps(parts, default=str, sort_keys=True).encode("utf-8")).hexdigest()
+    return f'"{digest}"'
+
+def _request_identity(request: Request) -> List[Any]:
+    return [request.url.path, sorted(request.query_params.multi_items())]
+
+def _http_date(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return format_datetime(dt.astimezone(timezone.utc), usegmt=True)
+
+def _conditional_headers(etag: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL}
+    if last_modified:
+        headers["Last-Modified"] = _http_date(last_modified)
+    return headers
+
+def _not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+    """Return a 304 response when the client's validators still match, else None."""
+    headers = _conditional_headers(etag, last_modified)
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # If-None-Match takes precedence over If-Modified-Since (RFC 9110)
+        tags = [t.strip().removeprefix("W/") for t in if_none_match.split(",")]
+        if "*" in tags or etag in tags:
+            return Response(status_code=304, headers=headers)
+        return None
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return None
+        modified = last_modified if last_modified.tzinfo else last_modified.replace(tzinfo=timezone.utc)
+        if modified.replace(microsecond=0) <= since:
+            return Response(status_code=304, headers=headers)
+    return None
+
+async def _collection_validators(request: Request, name: str):
+    """ETag and Last-Modified for a response derived from a whole catalog collection."""
+    stamp = await _get_version_stamp(name)
+    return _make_etag(name, stamp["version"], _request_identity(request)), stamp["updated_at"]
+
+async def _college_list_validators(request: Request):
+    """Validators for college cards, which carry review_summary: the catalog stamp plus the reviews stamp."""
+    colleges, reviews = await _gather_bounded(_get_version_stamp("colleges"), _get_version_stamp("reviews"))
+    last_modified = max(filter(None, (colleges["updated_at"], reviews["updated_at"])), default=None)
+    return _make_etag("colleges", colleges["version"], reviews["version"], _request_identity(request)), last_modified
+
+def _college_validators(college: Dict[str, Any]):
+    """Detail validators: content version plus the review aggregate's own version (review_summary)."""
+    last_modified = max(filter(None, (college.get("updated_at") or college.get("created_at"), college.get("reviews_updated_at"))), default=None)
+    etag = _make_etag("college", str(college["_id"]), college.get("version", 0), college.get("review_version", 0), last_modified)
+    return etag, last_modified
+
+def _wants_gzip(request: Request, gzip: Optional[bool]) -> bool:
+    """Explicit ?gzip= wins; otherwise negotiate from Accept-Encoding."""
+    if gzip is not None:
+        return gzip
+    return "gzip" in request.headers.get("accept-encoding", "").lower()
+
+def _streaming_export(cursor, column_types: Dict[str, str], basename: str, fmt: str, compress: bool) -> StreamingResponse:
+    media_type, extension = EXPORT_FORMATS[fmt]
+    chunks = stream_export(cursor, fmt, column_types)
+    headers = {"Content-Disposition": f"attachment; filename={basename}.{extension}"}
+    # Parquet/Arrow are zstd-compressed internally; only text formats get gzip
+    if compress and fmt not in COMPRESSED_FORMATS:
+        chunks = gzip_stream(chunks)
+        headers["Content-Encoding"] = "gzip"
+        headers["Vary"] = "Accept-Encoding"
+    return StreamingResponse(chunks, media_type=media_type, headers=headers)
+
+async def _find_colleges_by_ids(college_ids: List[str]) -> Dict[str, dict]:
+    """Fetch colleges by ObjectId or custom id in a single query, keyed by the requested id."""
+    object_ids = [ObjectId(cid) for cid in college_ids if ObjectId.is_valid(cid)]
+    or_clauses: List[Dict[str, Any]] = [{"id": {"$in": college_ids}}]
+    if object_ids:
+        or_clauses.insert(0, {"_id": {"$in": object_ids}})
+    wanted = set(college_ids)
+    found: Dict[str, dict] = {}
+    async for college in db.colleges.find({"$or": or_clauses}):
+        oid = str(college["_id"])
+        if oid in wanted:
+            found[oid] = college
+        if college.get("id") in wanted and college["id"] not in found:
+            found[college["id"]] = college
+    return found
+
+def _college_summary(college: Dict[str, Any]) -> Dict[str, Any]:
+    """Compact card fields for list-style payloads"""
+    return {
+        "id": str(college["_id"]) if "_id" in college else college.get("id"),
+        "name": college.get("name"),
+        "city": college.get("city"),
+        "state": college.get("state"),
+        "ranking": college.get("ranking"),
+        "star_rating": college.get("star_rating"),
+        "annual_fees": college.get("annual_fees"),
+        "university_type": college.get("university_type"),
+        "logo_base64": college.get("logo_base64"),
+    }
+
+async def _ensure_cutoff_rank_index() -> CutoffRankIndex:
+    """
+    Rebuild the predictor arrays if another writer moved the cutoffs version, or the colleges
+    version (rows of colleges that don't exist are left out, so totals only count real colleges).
+    """
+    version, colleges_version = await _gather_bounded(_get_version("cutoffs"), _get_version("colleges"))
+    if cutoff_rank_index.version == version and cutoff_rank_index.colleges_version == colleges_version:
+        return cutoff_rank_index
+    async with cutoff_rank_index_lock:
+        if cutoff_rank_index.version != version or cutoff_rank_index.colleges_version != colleges_version:
+            projection = {"_id": 0, "college_id": 1, "exam": 1, "category": 1, "branch": 1, "year": 1, "round": 1, "closing_rank": 1}
+            rows = await db.cutoffs.find({"closing_rank": {"$ne": None}}, projection).to_list(length=None)
+            college_ids: Set[str] = set()
+            async for college in db.colleges.find({}, {"_id": 1, "id": 1}):
+                college_ids.add(str(college["_id"]))
+                if college.get("id"):
+                    college_ids.add(college["id"])
+            cutoff_rank_index.load(rows, version, college_ids, colleges_version)
+    return cutoff_rank_index
+
+async def _update_cutoff_trend(key: tuple, new_rows: List[Dict[str, Any]], doc: Optional[Dict[str, Any]], now: datetime) -> None:
+    """
+    Merge rows into one trend document with compare-and-retry on its `rev` counter: the write only
+    lands if nobody changed the series since it was read (a first insert is guarded by the unique
+    key index), otherwise the document is re-read and merged again.
+    """
+    college_id, exam, category, branch = key
+    selector = {"college_id": college_id, "exam": exam, "category": category, "branch": branch}
+    for _ in range(TREND_UPDATE_RETRIES):
+        series = merge_trend_series(doc.get("series", []) if doc else [], new_rows)
+        fields = {"series": series, **summarize_trend(series), "updated_at": now}
+        try:
+            if doc is None:
+                await db.cutoff_trends.insert_one({**selector, **fields, "rev": 1})
+                return
+            # rev None also matches documents written before the counter existed
+            result = await db.cutoff_trends.update_one({**selector, "rev": doc.get("rev")}, {"$set": fields, "$inc": {"rev": 1}})
+            if result.matched_count:
+                return
+        except DuplicateKeyError:
+            pass
+        doc = await db.cutoff_trends.find_one(selector, {"_id": 0, "series": 1, "rev": 1})
+    raise RuntimeError(f"Cutoff trend {key} changed on every attempt; gave up after {TREND_UPDATE_RETRIES}")
+
+async def _update_cutoff_trends(rows: List[Dict[str, Any]]) -> None:
+    """Fold freshly inserted cutoff rows into their materialized trend documents (one read for all series)."""
+    grouped: Dict[tuple, List[Dict[str, Any]]] = {}
+    for row in rows:
+        if row.get("closing_rank") is not None and row.get("college_id"):
+            grouped.setdefault(trend_key(row), []).append(row)
+    if not grouped:
+        return
+    college_ids = list({key[0] for key in grouped})
+    existing = {}
+    async for doc in db.cutoff_trends.find({"college_id": {"$in": college_ids}}, {"_id": 0, "college_id": 1, "exam": 1, "category": 1, "branch": 1, "series": 1, "rev": 1}):
+        existing[trend_key(doc)] = doc
+
+    now = datetime.utcnow()
+    await _gather_bounded(*(_update_cutoff_trend(key, new_rows, existing.get(key), now) for key, new_rows in grouped.items()))
+
+async def _refresh_competitiveness(college_ids: List[str]) -> int:
+    """Recompute the seat-intake vs closing-rank view for a set of colleges."""
+    college_ids = list({str(cid) for cid in college_ids if cid})
+    if not college_ids:
+        return 0
+    seats, cutoffs = await _gather_bounded(
+        db.seats.find(
+            {"college_id": {"$in": college_ids}},
+            {"_id": 0, "college_id": 1, "year": 1, "branch": 1, "category": 1, "intake": 1},
+        ).to_list(length=None),
+        db.cutoffs.find(
+            {"college_id": {"$in": college_ids}, "closing_rank": {"$ne": None}},
+            {"_id": 0, "college_id": 1, "year": 1, "branch": 1, "category": 1, "exam": 1, "round": 1, "closing_rank": 1},
+        ).to_list(length=None),
+    )
+    rows = join_competitiveness(seats, cutoffs)
+    colleges = await _find_colleges_by_ids(list({r["college_id"] for r in rows})) if rows else {}
+
+    now = datetime.utcnow()
+    ops = []
+    for row in rows:
+        college = colleges.get(row["college_id"], {})
+        key = {k: row[k] for k in ("college_id", "year", "branch", "category", "exam")}
+        ops.append(UpdateOne(key, {"$set": {
+            **row,
+            "college_name": college.get("name"),
+            "city": college.get("city"),
+            "state": college.get("state"),
+            "refreshed_at": now,
+        }}, upsert=True))
+    if ops:
+        await db.competitiveness.bulk_write(ops, ordered=False)
+    # Drop keys that no longer join (e.g. seat rows removed)
+    await db.competitiveness.delete_many({"college_id": {"$in": college_ids}, "refreshed_at": {"$lt": now}})
+    return len(ops)
+
+async def _rebuild_competitiveness() -> int:
+    """Full refresh, chunked by college so memory stays bounded."""
+    college_ids = await db.seats.distinct("college_id")
+    refreshed = 0
+    for i in range(0, len(college_ids), COMPETITIVENESS_CHUNK):
+        refreshed += await _refresh_competitiveness(college_ids[i:i + COMPETITIVENESS_CHUNK])
+    return refreshed
+
+async def _competitiveness_refresh_loop():
+    while True:
+        await asyncio.sleep(COMPETITIVENESS_REFRESH_SECONDS)
+        try:
+            refreshed = await _rebuild_competitiveness()
+            logger.info(f"Competitiveness view refreshed ({refreshed} rows)")
+        except Exception as e:
+            logger.warning(f"Competitiveness refresh failed: {e}")
+
+async def _iter_request_records(request: Request) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    async for item in _iter_stream_records(request.stream(), request.headers.get("content-type", "")):
+        yield item
+
+async def _iter_stream_records(
+    chunks: AsyncIterator[bytes], content_type: str
+) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Yield (record, error) pairs from a JSON array body, an NDJSON stream or a CSV stream.
+    NDJSON and CSV are parsed incrementally as chunks arrive; malformed lines yield an error instead of aborting.
+    """
+    content_type = content_type.lower()
+    if "csv" in content_type:
+        async for item in _iter_csv_records(chunks):
+            yield item
+        return
+    if "ndjson" in content_type or "jsonl" in content_type:
+        buffer = b""
+        line_no = 0
+        async for chunk in chunks:
+            buffer += chunk
+            *lines, buffer = buffer.split(b"\n")
+            for line in lines:
+                line_no += 1
+                if line.strip():
+                    yield _parse_record_line(line, line_no)
+        if buffer.strip():
+            yield _parse_record_line(buffer, line_no + 1)
+        return
+
+    try:
+        body = orjson.loads(b"".join([chunk async for chunk in chunks]))
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or NDJSON")
+    # {"colleges": [...]} is the college bulk import's own JSON shape
+    items = body.get("items", body.get("colleges")) if isinstance(body, dict) else body
+    if not isinstance(items, list):
+        raise HTTPException(status_code=400, detail="Body must be a JSON array or an object with 'items'")
+    for item in items:
+        yield (item, None) if isinstance(item, dict) else (None, "Row is not an object")
+
+async def _iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+    """CSV with a header row; quoted fields may span lines. Empty cells are left out so defaults apply."""
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    header: Optional[List[str]] = None
+    text = ""
+    record = ""
+    quotes_open = False
+    row_no = 0
+
+    def parse(raw: str) -> Optional[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        nonlocal header, row_no
+        if not raw.strip():
+            return None
+        values = next(csv.reader([raw]))
+        if header is None:
+            header = [h.strip().lstrip("\ufeff") for h in values]
+            return None
+        row_no += 1
+        if len(values) > len(header):
+            return None, f"row {row_no}: {len(values)} values for {len(header)} columns"
+        return {k: v.strip() for k, v in zip(header, values) if v.strip()}, None
+
+    async for chunk in chunks:
+        text += decoder.decode(chunk)
+        *lines, text = text.split("\n")
+        for line in lines:
+            record += line + "\n"
+            quotes_open ^= line.count('"') % 2 == 1
+            if not quotes_open:
+                item = parse(record)
+                record = ""
+                if item:
+                    yield item
+    record += text + decoder.decode(b"", final=True)
+    item = parse(record)
+    if item:
+        yield item
+
+def _parse_record_line(line: bytes, line_no: int) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    try:
+        record = orjson.loads(line)
+    except orjson.JSONDecodeError as e:
+        return None, f"line {line_no}: {e}"
+    return (record, None) if isinstance(record, dict) else (None, f"line {line_no}: row is not an object")
+
+def _upsert_op(doc: Dict[str, Any], key_fields: List[str]) -> UpdateOne:
+    """Upsert on the natural key; id/created_at are only written when the row is new."""
+    on_insert = {"id": doc.pop("id"), "created_at": doc.pop("created_at")}
+    return UpdateOne({k: doc.get(k) for k in key_fields}, {"$set": doc, "$setOnInsert": on_insert}, upsert=True)
+
+def _validation_message(e: ValidationError) -> str:
+    return "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+
+async def _bulk_upsert_records(
+    request: Request,
+    collection,
+    model: Type[BaseModel],
+    key_fields: List[str],
+    on_batch=None,
+) -> Dict[str, Any]:
+    """Validate streamed rows in batches and write each batch as one unordered bulk upsert."""
+    report: Dict[str, Any] = {"inserted": 0, "updated": 0, "unchanged": 0, "rejected": 0, "errors": []}
+
+    def reject(index: int, message: str):
+        report["rejected"] += 1
+        if len(report["errors"]) < BULK_MAX_ERRORS:
+            report["errors"].append({"row": index, "error": message})
+
+    async def flush(rows: List[Dict[str, Any]]):
+        result = await collection.bulk_write([_upsert_op(dict(r), key_fields) for r in rows], ordered=False)
+        report["inserted"] += result.upserted_count
+        report["updated"] += result.modified_count
+        report["unchanged"] += result.matched_count - result.modified_count
+        if on_batch:
+            await on_batch(rows, result)
+
+    batch: List[Dict[str, Any]] = []
+    index = 0
+    async for record, error in _iter_request_records(request):
+        if error:
+            reject(index, error)
+        else:
+            try:
+                batch.append(model(**record).dict())
+            except ValidationError as e:
+                reject(index, _validation_message(e))
+        index += 1
+        if len(batch) >= BULK_BATCH_SIZE:
+            await flush(batch)
+            batch = []
+    if batch:
+        await flush(batch)
+    return report
+
+async def _comparison_payload(college_ids: List[str]) -> Dict[str, Any]:
+    """Colleges plus normalized comparison matrix, cached per id set and catalog/reviews version."""
+    # The cached cards carry review_summary, so a review write must miss the cache too
+    catalog_version, reviews_version = await _gather_bounded(_get_version("colleges"), _get_version("reviews"))
+    key = ComparisonCache.make_key(college_ids, catalog_version, reviews_version)
+    cached = comparison_cache.get(key)
+    if cached is None:
+        found = await _find_colleges_by_ids(list(key[0]))
+        by_id = {cid: college_helper(doc) for cid, doc in found.items()}
+        columns = [cid for cid in key[0] if cid in by_id]
+        cached = {
+            "by_id": by_id,
+            "columns": {cid: i for i, cid in enumerate(columns)},
+            "comparison": build_comparison_matrix([by_id[cid] for cid in columns]),
+        }
+        comparison_cache.set(key, cached)
+    # The cached matrix is in sorted-id order; serve it in request order, labelled with the requested ids
+    requested = [cid for cid in dict.fromkeys(college_ids) if cid in cached["by_id"]]
+    comparison = select_comparison_columns(cached["comparison"], [cached["columns"][cid] for cid in requested], requested)
+    colleges = [cached["by_id"][cid] for cid in requested]
+    return {"colleges": colleges, "comparison": comparison, "catalog_version": catalog_version}
 
 # Routes
 
@@ -403,6 +1030,7 @@ async def root():
 async def create_indexes():
     try:
         # Basic field indexes for filtering and sorting
+        await db.colleges.create_index([("id", 1)])
         await db.colleges.create_index([("name", 1)])
         await db.colleges.create_index([("city", 1)])
         await db.colleges.create_index([("state", 1)])
@@ -416,48 +1044,74 @@ async def create_indexes():
         # Reviews indexes
         await db.reviews.create_index([("college_id", 1), ("created_at", -1)])
         await db.reviews.create_index([("user_id", 1), ("college_id", 1)])
+        await db.reviews.create_index([("college_id", 1), ("helpful_score", -1)])
+        # Per-college keyword search; the college_id prefix keeps $text scoped to one college's reviews
+        await db.reviews.create_index(
+            [("college_id", 1), ("title", "text"), ("body", "text"), ("pros", "text"), ("cons", "text")],
+            name="college_review_text",
+            weights={"title": 3, "pros": 2, "cons": 2, "body": 1},
+        )
+        await db.review_terms.create_index([("college_id", 1)], unique=True)
+        await db.college_signatures.create_index([("college_id", 1)], unique=True)
+        await db.college_signatures.create_index([("band_keys", 1)])  # multikey LSH bucket lookup
         # Cutoffs & Seats indexes
         await db.cutoffs.create_index([("college_id", 1), ("year", -1), ("exam", 1), ("category", 1), ("branch", 1), ("round", 1)])
         await db.seats.create_index([("college_id", 1), ("year", -1), ("branch", 1), ("category", 1)])
+        await db.cutoff_trends.create_index([("college_id", 1), ("exam", 1), ("category", 1), ("branch", 1)], unique=True)
+        await db.competitiveness.create_index([("college_id", 1), ("year", 1), ("branch", 1), ("category", 1), ("exam", 1)], unique=True)
+        await db.competitiveness.create_index([("state", 1), ("year", -1), ("score", -1)])
+        await db.competitiveness.create_index([("year", -1), ("score", -1)])
     except Exception as e:
         logging.getLogger(__name__).warning(f"Index creation failed or already exists: {e}")
+    # Imports dedupe only through the partial unique index, which skips rows without dedupe_key:
+    # key older rows first, and refuse to start if the index can't be built
+    try:
+        report = await _backfill_college_keys()
+    except Exception as e:
+        raise RuntimeError(f"College dedupe index creation failed: {e}") from e
+    if report["duplicate_count"]:
+        logging.getLogger(__name__).warning(
+            f"{report['duplicate_count']} unkeyed colleges duplicate a keyed one; see /api/dev/backfill-college-keys"
+        )
 
 # College Routes
 @api_router.post("/colleges", response_model=CollegeResponse)
 async def create_college(college: CollegeCreate):
-    college_dict = college.dict()
-    result = await db.colleges.insert_one(college_dict)
+    college_dict = _stamp_new_college(college.dict())
+    try:
+        result = await db.colleges.insert_one(college_dict)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=409, detail="A college with this name, city and state already exists")
+    await _store_college_signatures([college_dict])
+    await _bump_version("colleges")
     created_college = await db.colleges.find_one({"_id": result.inserted_id})
     return CollegeResponse(**college_helper(created_college))
 
-@api_router.get("/colleges/search", response_model=CollegeSearchResponse)
-async def search_colleges(
-    q: Optional[str] = Query(None, description="Search query"),
-    city: Optional[str] = Query(None, description="Filter by city"),
-    state: Optional[str] = Query(None, description="Filter by state"),
-    min_fees: Optional[int] = Query(None, description="Minimum annual fees"),
-    max_fees: Optional[int] = Query(None, description="Maximum annual fees"),
-    university_type: Optional[str] = Query(None, description="University type"),
-    courses: Optional[str] = Query(None, description="Comma-separated courses"),
-    min_rating: Optional[float] = Query(None, description="Minimum star rating"),
-    max_rating: Optional[float] = Query(None, description="Maximum star rating"),
-    ranking_from: Optional[int] = Query(None, description="Ranking from"),
-    ranking_to: Optional[int] = Query(None, description="Ranking to"),
-    accreditation: Optional[str] = Query(None, description="Comma-separated accreditations (e.g., NAAC A++,NBA)"),
-    hostel: Optional[bool] = Query(None, description="Require hostel facilities"),
-    wifi: Optional[bool] = Query(None, description="Require WiFi"),
-    library: Optional[bool] = Query(None, description="Require library"),
-    sports: Optional[bool] = Query(None, description="Require sports"),
-    canteen: Optional[bool] = Query(None, description="Require canteen"),
-    medical: Optional[bool] = Query(None, description="Require medical facilities"),
-    min_placement: Optional[float] = Query(None, description="Minimum placement percentage"),
-    min_avg_package: Optional[int] = Query(None, description="Minimum average package (₹)"),
-    page: int = Query(1, ge=1, description="Page number"),
-    limit: int = Query(20, ge=1, le=100, description="Items per page"),
-    sort: Optional[str] = Query("relevance", description="Sort key: relevance|ranking|fees_low|fees_high|rating_high"),
-):
-    # Build query filter
-    filter_query = {}
+def _build_search_query(
+    q: Optional[str] = None,
+    city: Optional[str] = None,
+    state: Optional[str] = None,
+    min_fees: Optional[int] = None,
+    max_fees: Optional[int] = None,
+    university_type: Optional[str] = None,
+    courses: Optional[str] = None,
+    min_rating: Optional[float] = None,
+    max_rating: Optional[float] = None,
+    ranking_from: Optional[int] = None,
+    ranking_to: Optional[int] = None,
+    accreditation: Optional[str] = None,
+    hostel: Optional[bool] = None,
+    wifi: Optional[bool] = None,
+    library: Optional[bool] = None,
+    sports: Optional[bool] = None,
+    canteen: Optional[bool] = None,
+    medical: Optional[bool] = None,
+    min_placement: Optional[float] = None,
+    min_avg_package: Optional[int] = None,
+    sort: Optional[str] = "relevance",
+) -> Tuple[Dict[str, Any], Optional[List[Tuple[str, int]]]]:
+    """Mongo filter and sort spec for /colleges/search parameters."""
+    filter_query: Dict[str, Any] = {}
     
     # Text search
     if q:
@@ -535,12 +1189,6 @@ async def search_colleges(
     if min_avg_package is not None:
         filter_query["average_package"] = {"$gte": int(min_avg_package)}
     
-    # Calculate pagination
-    skip = (page - 1) * limit
-    
-    # Get total count
-    total = await db.colleges.count_documents(filter_query)
-    
     # Build sorting
     sort_fields = None
     if sort and sort != "relevance":
@@ -553,49 +1201,132 @@ async def search_colleges(
         elif sort == "rating_high":
             sort_fields = [("star_rating", -1)]
 
+    return filter_query, sort_fields
+
+@api_router.get("/colleges/search", response_model=CollegeSearchResponse)
+async def search_colleges(
+    request: Request,
+    q: Optional[str] = Query(None, description="Search query"),
+    city: Optional[str] = Query(None, description="Filter by city"),
+    state: Optional[str] = Query(None, description="Filter by state"),
+    min_fees: Optional[int] = Query(None, description="Minimum annual fees"),
+    max_fees: Optional[int] = Query(None, description="Maximum annual fees"),
+    university_type: Optional[str] = Query(None, description="University type"),
+    courses: Optional[str] = Query(None, description="Comma-separated courses"),
+    min_rating: Optional[float] = Query(None, description="Minimum star rating"),
+    max_rating: Optional[float] = Query(None, description="Maximum star rating"),
+    ranking_from: Optional[int] = Query(None, description="Ranking from"),
+    ranking_to: Optional[int] = Query(None, description="Ranking to"),
+    accreditation: Optional[str] = Query(None, description="Comma-separated accreditations (e.g., NAAC A++,NBA)"),
+    hostel: Optional[bool] = Query(None, description="Require hostel facilities"),
+    wifi: Optional[bool] = Query(None, description="Require WiFi"),
+    library: Optional[bool] = Query(None, description="Require library"),
+    sports: Optional[bool] = Query(None, description="Require sports"),
+    canteen: Optional[bool] = Query(None, description="Require canteen"),
+    medical: Optional[bool] = Query(None, description="Require medical facilities"),
+    min_placement: Optional[float] = Query(None, description="Minimum placement percentage"),
+    min_avg_package: Optional[int] = Query(None, description="Minimum average package (₹)"),
+    page: int = Query(1, ge=1, description="Page number"),
+    limit: int = Query(20, ge=1, le=100, description="Items per page"),
+    sort: Optional[str] = Query("relevance", description="Sort key: relevance|ranking|fees_low|fees_high|rating_high"),
+):
+    etag, last_modified = await _college_list_validators(request)
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    filter_query, sort_fields = _build_search_query(
+        q=q, city=city, state=state, min_fees=min_fees, max_fees=max_fees,
+        university_type=university_type, courses=courses, min_rating=min_rating, max_rating=max_rating,
+        ranking_from=ranking_from, ranking_to=ranking_to, accreditation=accreditation,
+        hostel=hostel, wifi=wifi, library=library, sports=sports, canteen=canteen, medical=medical,
+        min_placement=min_placement, min_avg_package=min_avg_package, sort=sort,
+    )
+    skip = (page - 1) * limit
+
     # Get colleges with sorting + pagination
     cursor = db.colleges.find(filter_query)
     if sort_fields:
         cursor = cursor.sort(sort_fields)
     cursor = cursor.skip(skip).limit(limit)
-    colleges = await cursor.to_list(length=None)
+    # Count and page fetch are independent round trips
+    total, colleges = await _gather_bounded(db.colleges.count_documents(filter_query), cursor.to_list(length=None))
     
-    # Convert to response format
-    college_responses = [CollegeResponse(**college_helper(college)) for college in colleges]
+    # Convert to response format (trusted documents: no re-validation)
+    college_responses = [college_helper(college) for college in colleges]
     
     total_pages = (total + limit - 1) // limit
     
-    return CollegeSearchResponse(
-        colleges=college_responses,
-        total=total,
-        page=page,
-        limit=limit,
-        total_pages=total_pages
-    )
+    return FastJSONResponse({
+        "colleges": college_responses,
+        "total": total,
+        "page": page,
+        "limit": limit,
+        "total_pages": total_pages,
+    }, headers=_conditional_headers(etag, last_modified))
 
 @api_router.get("/colleges/{college_id}", response_model=CollegeResponse)
-async def get_college(college_id: str):
+async def get_college(college_id: str, request: Request):
     # Try to find by ObjectId first, then by custom id
-    college = None
-    try:
-        college = await db.colleges.find_one({"_id": ObjectId(college_id)})
-    except:
-        college = await db.colleges.find_one({"id": college_id})
-    
+    query = _college_query(college_id)
+
+    # Revalidation: answer from the version stamp alone before loading the full document
+    if request.headers.get("if-none-match") or request.headers.get("if-modified-since"):
+        stamp = await db.colleges.find_one(query, {"version": 1, "review_version": 1, "updated_at": 1, "created_at": 1, "reviews_updated_at": 1})
+        if not stamp:
+            raise HTTPException(status_code=404, detail="College not found")
+        not_modified = _not_modified(request, *_college_validators(stamp))
+        if not_modified:
+            return not_modified
+
+    college = await db.colleges.find_one(query)
     if not college:
         raise HTTPException(status_code=404, detail="College not found")
     
-    return CollegeResponse(**college_helper(college))
+    return FastJSONResponse(
+        college_helper(college),
+        headers=_conditional_headers(*_college_validators(college)),
+    )
 
 # Cutoffs Routes
 @api_router.post("/cutoffs")
 async def create_cutoff(cutoff: CutoffCreate):
     data = cutoff.dict()
     result = await db.cutoffs.insert_one(data)
+    version = await _bump_version("cutoffs")
+    cutoff_rank_index.apply([data], version - 1, version)
+    cutoff_options_cache.clear()
+    await _gather_bounded(_update_cutoff_trends([data]), _refresh_competitiveness([data["college_id"]]))
     return {"message": "Cutoff created", "id": str(result.inserted_id)}
 
+@api_router.post("/cutoffs/bulk")
+async def bulk_upsert_cutoffs(request: Request):
+    """
+    Bulk-load cutoffs from a JSON array or an NDJSON stream (Content-Type: application/x-ndjson).
+    Rows are upserted on (college_id, year, exam, category, branch, round).
+    """
+    start_version = await _get_version("cutoffs")
+    inserted_rows: List[Dict[str, Any]] = []
+    updated_any = False
+
+    async def after_batch(rows, result):
+        nonlocal updated_any
+        updated_any = updated_any or result.matched_count > 0
+        inserted_rows.extend(rows[i] for i in result.upserted_ids)
+        await _gather_bounded(_update_cutoff_trends(rows), _refresh_competitiveness([r["college_id"] for r in rows]))
+
+    report = await _bulk_upsert_records(request, db.cutoffs, CutoffCreate, CUTOFF_NATURAL_KEY, on_batch=after_batch)
+    if report["inserted"] or report["updated"]:
+        version = await _bump_version("cutoffs")
+        # Pure inserts can be folded into the predictor; updated ranks force a rebuild
+        if not updated_any:
+            cutoff_rank_index.apply(inserted_rows, start_version, version)
+        cutoff_options_cache.clear()
+    return report
+
 @api_router.get("/cutoffs")
 async def list_cutoffs(
+    request: Request,
     college_id: Optional[str] = None,
     year: Optional[int] = None,
     exam: Optional[Union[str, List[str]]] = Query(default=None),
@@ -604,8 +1335,13 @@ async def list_cutoffs(
     round: Optional[int] = None,
     page: int = Query(1, ge=1),
     limit: int = Query(20, ge=1, le=100),
-    sort: str = Query("recent")
+    sort: str = Query("recent"),
 ):
+    etag, last_modified = await _collection_validators(request, "cutoffs")
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
     query: Dict[str, Any] = {}
     if college_id: query["college_id"] = college_id
     if year is not None: query["year"] = year
@@ -632,44 +1368,119 @@ async def list_cutoffs(
     skip = (page - 1) * limit
     sort_spec = [("year", -1), ("round", -1)] if sort == "recent" else [("closing_rank", 1)]
     cursor = db.cutoffs.find(query).sort(sort_spec).skip(skip).limit(limit)
-    items = await cursor.to_list(length=None)
-    total = await db.cutoffs.count_documents(query)
+    items, total = await _gather_bounded(cursor.to_list(length=None), db.cutoffs.count_documents(query))
     # Coerce id
     for it in items:
       if "id" not in it:
         it["id"] = str(it.get("_id", ""))
-    return {"items": items, "page": page, "limit": limit, "total": total}
+    return FastJSONResponse(
+        {"items": items, "page": page, "limit": limit, "total": total},
+        headers=_conditional_headers(etag, last_modified),
+    )
 
 @api_router.get("/cutoffs/options")
-async def get_cutoff_options(college_id: Optional[str] = None):
-    query: Dict[str, Any] = {}
+async def get_cutoff_options(request: Request, response: Response, college_id: Optional[str] = None):
+    stamp = await _get_version_stamp("cutoffs")
+    etag, last_modified = _make_etag("cutoffs", stamp["version"], _request_identity(request)), stamp["updated_at"]
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+    response.headers.update(_conditional_headers(etag, last_modified))
+
+    cache_key = college_id or None
+    cached = cutoff_options_cache.get(cache_key)
+    if cached and cached[0] == stamp["version"]:
+        return cached[1]
+
+    # All four facets in one aggregation round trip
+    pipeline: List[Dict[str, Any]] = []
     if college_id:
-        query["college_id"] = college_id
-    years = await db.cutoffs.distinct("year", query)
-    exams = await db.cutoffs.distinct("exam", query)
-    categories = await db.cutoffs.distinct("category", query)
-    branches = await db.cutoffs.distinct("branch", query)
+        pipeline.append({"$match": {"college_id": college_id}})
+    pipeline.append({"$group": {
+        "_id": None,
+        "years": {"$addToSet": "$year"},
+        "exams": {"$addToSet": "$exam"},
+        "categories": {"$addToSet": "$category"},
+        "branches": {"$addToSet": "$branch"},
+    }})
+    facets = await db.cutoffs.aggregate(pipeline).to_list(length=1)
+    facets = facets[0] if facets else {}
     # Clean/Sort
-    years_sorted = sorted([y for y in years if y is not None], reverse=True)
-    exams_sorted = sorted([e for e in exams if e], key=lambda s: s.lower())
-    categories_sorted = sorted([c for c in categories if c], key=lambda s: s.lower())
-    branches_sorted = sorted([b for b in branches if b], key=lambda s: s.lower())
-    return {
-        "years": years_sorted,
-        "exams": exams_sorted,
-        "categories": categories_sorted,
-        "branches": branches_sorted,
+    options = {
+        "years": sorted([y for y in facets.get("years", []) if y is not None], reverse=True),
+        "exams": sorted([e for e in facets.get("exams", []) if e], key=lambda s: s.lower()),
+        "categories": sorted([c for c in facets.get("categories", []) if c], key=lambda s: s.lower()),
+        "branches": sorted([b for b in facets.get("branches", []) if b], key=lambda s: s.lower()),
     }
+    if len(cutoff_options_cache) >= CUTOFF_OPTIONS_CACHE_MAX:
+        cutoff_options_cache.clear()
+    cutoff_options_cache[cache_key] = (stamp["version"], options)
+    return options
+
+@api_router.get("/cutoffs/predict")
+async def predict_colleges_for_rank(
+    rank: int = Query(..., ge=1, description="Candidate's rank in the exam"),
+    exam: str = Query(..., description="Exam, e.g. JEE Main"),
+    category: Optional[str] = Query(None, description="Reservation category, e.g. GEN (default: any)"),
+    branch: Optional[str] = Query(None, description="Restrict to one branch"),
+    year: Optional[int] = Query(None, description="Cutoff year (default: latest available)"),
+    limit: int = Query(50, ge=1, le=200),
+):
+    """Colleges whose closing rank admits `rank`, answered by binary search over sorted cutoff arrays"""
+    index = await _ensure_cutoff_rank_index()
+    prediction = index.predict(rank, exam, category=category, branch=branch, year=year, limit=limit)
+
+    # Join college summaries in one batched query
+    found = await _find_colleges_by_ids(list({r["college_id"] for r in prediction["results"]}))
+    results = []
+    for r in prediction["results"]:
+        college = found.get(r["college_id"])
+        if college:
+            results.append({**r, "college": _college_summary(college)})
+
+    return FastJSONResponse({
+        "rank": rank,
+        "exam": exam,
+        "category": category,
+        "branch": branch,
+        "year": prediction["year"],
+        "total": prediction["total"],
+        "results": results,
+    })
+
+@api_router.get("/cutoffs/trends/{college_id}")
+async def get_cutoff_trends(
+    college_id: str,
+    request: Request,
+    exam: Optional[str] = None,
+    category: Optional[str] = None,
+    branch: Optional[str] = None,
+):
+    """Materialized year-over-year closing-rank series for a college (one indexed read)"""
+    etag, last_modified = await _collection_validators(request, "cutoffs")
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    query: Dict[str, Any] = {"college_id": college_id}
+    if exam: query["exam"] = exam
+    if category: query["category"] = category
+    if branch: query["branch"] = branch
+    trends = await db.cutoff_trends.find(query, {"_id": 0}).to_list(length=None)
+    return FastJSONResponse({"college_id": college_id, "trends": trends}, headers=_conditional_headers(etag, last_modified))
 
 @api_router.get("/cutoffs/export")
 async def export_cutoffs_csv(
+    request: Request,
     college_id: Optional[str] = None,
     year: Optional[int] = None,
     exam: Optional[str] = None,
     category: Optional[str] = None,
     branch: Optional[str] = None,
     round: Optional[int] = None,
-    sort: str = Query("recent")
+    sort: str = Query("recent"),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet|arrow)$", description="csv|ndjson|parquet|arrow"),
+    gzip: Optional[bool] = Query(None, description="Gzip the stream (default: negotiate via Accept-Encoding)"),
 ):
     query: Dict[str, Any] = {}
     if college_id: query["college_id"] = college_id
@@ -680,48 +1491,48 @@ async def export_cutoffs_csv(
     if round is not None: query["round"] = round
 
     sort_spec = [("year", -1), ("round", -1)] if sort == "recent" else [("closing_rank", 1)]
-    cursor = db.cutoffs.find(query).sort(sort_spec)
-    items = await cursor.to_list(length=None)
-
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["id","college_id","year","round","exam","category","branch","closing_rank","closing_percentile","created_at"])
-    for it in items:
-        writer.writerow([
-            it.get("id") or str(it.get("_id", "")),
-            it.get("college_id",""),
-            it.get("year",""),
-            it.get("round",""),
-            it.get("exam",""),
-            it.get("category",""),
-            it.get("branch",""),
-            it.get("closing_rank",""),
-            it.get("closing_percentile",""),
-            (it.get("created_at") or "")
-        ])
-
-    csv_data = output.getvalue()
-    from fastapi import Response
-    filename = f"cutoffs_{college_id or 'all'}.csv"
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=csv_data, media_type="text/csv", headers=headers)
+    # Stream straight from the cursor: memory stays at one batch regardless of result size
+    cursor = db.cutoffs.find(query).sort(sort_spec).batch_size(EXPORT_BATCH_SIZE)
+    return _streaming_export(cursor, CUTOFF_EXPORT_TYPES, f"cutoffs_{college_id or 'all'}", format, _wants_gzip(request, gzip))
 
 # Seats Routes
 @api_router.post("/seats")
 async def create_seat(seat: SeatCreate):
     data = seat.dict()
     result = await db.seats.insert_one(data)
+    await _bump_version("seats")
+    await _refresh_competitiveness([data["college_id"]])
     return {"message": "Seat matrix created", "id": str(result.inserted_id)}
 
+@api_router.post("/seats/bulk")
+async def bulk_upsert_seats(request: Request):
+    """
+    Bulk-load seat matrices from a JSON array or an NDJSON stream.
+    Rows are upserted on (college_id, year, branch, category).
+    """
+    async def after_batch(rows, result):
+        await _refresh_competitiveness([r["college_id"] for r in rows])
+
+    report = await _bulk_upsert_records(request, db.seats, SeatCreate, SEAT_NATURAL_KEY, on_batch=after_batch)
+    if report["inserted"] or report["updated"]:
+        await _bump_version("seats")
+    return report
+
 @api_router.get("/seats")
 async def list_seats(
+    request: Request,
     college_id: Optional[str] = None,
     year: Optional[int] = None,
     branch: Optional[Union[str, List[str]]] = Query(default=None),
     category: Optional[Union[str, List[str]]] = Query(default=None),
     page: int = Query(1, ge=1),
-    limit: int = Query(50, ge=1, le=200)
+    limit: int = Query(50, ge=1, le=200),
 ):
+    etag, last_modified = await _collection_validators(request, "seats")
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
     query: Dict[str, Any] = {}
     if college_id: query["college_id"] = college_id
     if year is not None: query["year"] = year
@@ -743,19 +1554,61 @@ async def list_seats(
 
     skip = (page - 1) * limit
     cursor = db.seats.find(query).sort([("year", -1)]).skip(skip).limit(limit)
-    items = await cursor.to_list(length=None)
-    total = await db.seats.count_documents(query)
+    items, total = await _gather_bounded(cursor.to_list(length=None), db.seats.count_documents(query))
     for it in items:
       if "id" not in it:
         it["id"] = str(it.get("_id", ""))
-    return {"items": items, "page": page, "limit": limit, "total": total}
+    return FastJSONResponse(
+        {"items": items, "page": page, "limit": limit, "total": total},
+        headers=_conditional_headers(etag, last_modified),
+    )
+
+@api_router.get("/competitiveness")
+async def list_competitive_branches(
+    request: Request,
+    state: Optional[str] = Query(None, description="Exact state name, e.g. Karnataka"),
+    year: Optional[int] = None,
+    exam: Optional[str] = None,
+    category: Optional[str] = None,
+    branch: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Most competitive branches (closing rank vs seat intake), index-backed on (state, year, score)"""
+    # The view is derived from both cutoffs and seats, so both stamps make up the ETag
+    cutoffs_stamp, seats_stamp = await _gather_bounded(_get_version_stamp("cutoffs"), _get_version_stamp("seats"))
+    etag = _make_etag("competitiveness", cutoffs_stamp["version"], seats_stamp["version"], _request_identity(request))
+    last_modified = max((d for d in (cutoffs_stamp["updated_at"], seats_stamp["updated_at"]) if d), default=None)
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    query: Dict[str, Any] = {}
+    if state: query["state"] = state
+    if year is None:
+        latest = await db.competitiveness.find(query, {"year": 1}).sort([("year", -1)]).limit(1).to_list(length=1)
+        year = latest[0]["year"] if latest else None
+    if year is not None: query["year"] = year
+    if exam: query["exam"] = exam
+    if category: query["category"] = category
+    if branch: query["branch"] = branch
+    items = await db.competitiveness.find(query, {"_id": 0}).sort([("score", -1)]).limit(limit).to_list(length=None)
+    return FastJSONResponse({"year": year, "state": state, "items": items}, headers=_conditional_headers(etag, last_modified))
+
+@api_router.post("/dev/rebuild-competitiveness")
+async def rebuild_competitiveness():
+    """Full recompute of the competitiveness view (also runs periodically)."""
+    refreshed = await _rebuild_competitiveness()
+    return {"message": "Competitiveness view rebuilt", "rows": refreshed}
 
 @api_router.get("/seats/export")
 async def export_seats_csv(
+    request: Request,
     college_id: Optional[str] = None,
     year: Optional[int] = None,
     branch: Optional[Union[str, List[str]]] = Query(default=None),
     category: Optional[Union[str, List[str]]] = Query(default=None),
+    format: str = Query("csv", pattern="^(csv|ndjson|parquet|arrow)$", description="csv|ndjson|parquet|arrow"),
+    gzip: Optional[bool] = Query(None, description="Gzip the stream (default: negotiate via Accept-Encoding)"),
 ):
     query: Dict[str, Any] = {}
     if college_id: query["college_id"] = college_id
@@ -777,26 +1630,8 @@ async def export_seats_csv(
     if cats:
         query["category"] = {"$in": cats}
 
-    cursor = db.seats.find(query).sort([("year", -1)])
-    items = await cursor.to_list(length=None)
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(["id","college_id","year","branch","category","intake","created_at"])
-    for it in items:
-        writer.writerow([
-            it.get("id") or str(it.get("_id", "")),
-            it.get("college_id",""),
-            it.get("year",""),
-            it.get("branch",""),
-            it.get("category",""),
-            it.get("intake",""),
-            (it.get("created_at") or ""),
-        ])
-    csv_data = output.getvalue()
-    from fastapi import Response
-    filename = f"seats_{college_id or 'all'}.csv"
-    headers = {"Content-Disposition": f"attachment; filename={filename}"}
-    return Response(content=csv_data, media_type="text/csv", headers=headers)
+    cursor = db.seats.find(query).sort([("year", -1)]).batch_size(EXPORT_BATCH_SIZE)
+    return _streaming_export(cursor, SEAT_EXPORT_TYPES, f"seats_{college_id or 'all'}", format, _wants_gzip(request, gzip))
 
 # Reviews Routes
 @api_router.post("/reviews", response_model=ReviewResponse)
@@ -804,10 +1639,27 @@ async def create_review(review: ReviewCreate):
     review_dict = review.dict()
     review_dict["created_at"] = datetime.utcnow()
     review_dict["helpful_count"] = 0
+    review_dict["helpful_score"] = helpful_score(0, review_dict["created_at"])
     # allow custom id field for consistency
     if "id" not in review_dict:
         review_dict["id"] = str(uuid.uuid4())
     result = await db.reviews.insert_one(review_dict)
+    # Fold the ratings into the college's aggregate atomically. It has its own version, which only the
+    # detail validator reads, so catalog listings, search ETags and the comparison cache stay valid.
+    await db.colleges.update_one(
+        _college_query(review_dict["college_id"]),
+        {"$inc": {**review_stats_increments(review_dict), "review_version": 1}, "$set": {"reviews_updated_at": datetime.utcnow()}},
+    )
+    terms = await db.review_terms.find_one_and_update(
+        {"college_id": review_dict["college_id"]},
+        {"$inc": {**review_term_increments(review_dict), "writes_since_prune": 1}, "$set": {"updated_at": datetime.utcnow()}},
+        projection={"_id": 0, "writes_since_prune": 1},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+    )
+    if terms["writes_since_prune"] >= TERM_PRUNE_EVERY:
+        await _prune_review_terms(review_dict["college_id"])
+    await _bump_version("reviews")
     created = await db.reviews.find_one({"_id": result.inserted_id})
     # Convert ObjectId to string id for response
     return ReviewResponse(
@@ -826,44 +1678,145 @@ async def create_review(review: ReviewCreate):
         created_at=created.get("created_at", datetime.utcnow()),
     )
 
+async def _prune_review_terms(college_id: str) -> None:
+    """Cut a college's pros/cons maps back to the TERM_MAP_KEEP top terms; $unset leaves concurrent increments of kept terms intact."""
+    doc = await db.review_terms.find_one({"college_id": college_id}, {"_id": 0, "pros": 1, "cons": 1, "writes_since_prune": 1})
+    if not doc:
+        return
+    update: Dict[str, Any] = {"$inc": {"writes_since_prune": -doc.get("writes_since_prune", 0)}}
+    drop = {f"{side}.{term}": "" for side in ("pros", "cons") for term in terms_to_prune(doc.get(side))}
+    if drop:
+        update["$unset"] = drop
+    await db.review_terms.update_one({"college_id": college_id}, update)
+
+def _review_item(r: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a review document to a client-friendly dict."""
+    return {
+        "id": r.get("id", str(r.get("_id", ""))),
+        "college_id": r["college_id"],
+        "user_id": r["user_id"],
+        "title": r.get("title"),
+        "body": r.get("body"),
+        "rating_overall": r.get("rating_overall"),
+        "rating_academics": r.get("rating_academics"),
+        "rating_placements": r.get("rating_placements"),
+        "rating_infra": r.get("rating_infra"),
+        "rating_faculty": r.get("rating_faculty"),
+        "pros": r.get("pros", []),
+        "cons": r.get("cons", []),
+        "verified": r.get("verified", False),
+        "helpful_count": r.get("helpful_count", 0),
+        "created_at": r.get("created_at"),
+    }
+
+async def _bump_helpful_versions(review_ids: List[str]) -> None:
+    """After a helpful-vote flush: bump helpful_version on the colleges whose reviews it changed."""
+    object_ids = [ObjectId(rid) for rid in review_ids if ObjectId.is_valid(rid)]
+    college_ids = await db.reviews.distinct(
+        "college_id", {"$or": [{"id": {"$in": review_ids}}, {"_id": {"$in": object_ids}}]}
+    )
+    if not college_ids:
+        return
+    college_oids = [ObjectId(cid) for cid in college_ids if ObjectId.is_valid(cid)]
+    await db.colleges.update_many(
+        {"$or": [{"id": {"$in": college_ids}}, {"_id": {"$in": college_oids}}]},
+        {"$inc": {"helpful_version": 1}, "$set": {"helpful_updated_at": datetime.utcnow()}},
+    )
+
+async def _review_list_validators(request: Request, college_id: str):
+    """
+    Validators for review listings: the reviews stamp (new reviews, rebuilds) plus the college's
+    helpful_version, so helpful-vote flushes only revalidate the colleges whose counts moved.
+    """
+    stamp, college = await _gather_bounded(
+        _get_version_stamp("reviews"),
+        db.colleges.find_one(_college_query(college_id), {"_id": 0, "helpful_version": 1, "helpful_updated_at": 1}),
+    )
+    college = college or {}
+    last_modified = max(filter(None, (stamp["updated_at"], college.get("helpful_updated_at"))), default=None)
+    etag = _make_etag("reviews", stamp["version"], college_id, college.get("helpful_version", 0), _request_identity(request))
+    return etag, last_modified
+
+async def _review_count(college_id: str) -> int:
+    """Review total from the college's aggregate; counts the collection only when no aggregate exists."""
+    college = await db.colleges.find_one(_college_query(college_id), {"_id": 0, "review_stats.count": 1})
+    count = ((college or {}).get("review_stats") or {}).get("count")
+    if count is not None:
+        return count
+    return await db.reviews.count_documents({"college_id": college_id})
+
 @api_router.get("/reviews/{college_id}")
-async def list_reviews(college_id: str, page: int = Query(1, ge=1), limit: int = Query(10, ge=1, le=50), sort: str = Query("recent")):
+async def list_reviews(
+    college_id: str,
+    request: Request,
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=50),
+    sort: str = Query("recent"),
+):
+    etag, last_modified = await _review_list_validators(request, college_id)
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
     skip = (page - 1) * limit
-    sort_spec = [("created_at", -1)] if sort == "recent" else [("helpful_count", -1)]
+    # Both sorts are served by a (college_id, key) index
+    sort_spec = [("created_at", -1)] if sort == "recent" else [("helpful_score", -1)]
     cursor = db.reviews.find({"college_id": college_id}).sort(sort_spec).skip(skip).limit(limit)
-    items = await cursor.to_list(length=None)
-    total = await db.reviews.count_documents({"college_id": college_id})
-    # Map to client-friendly dicts
-    def map_rev(r):
-        return {
-            "id": r.get("id", str(r.get("_id", ""))),
-            "college_id": r["college_id"],
-            "user_id": r["user_id"],
-            "title": r.get("title"),
-            "body": r.get("body"),
-            "rating_overall": r.get("rating_overall"),
-            "rating_academics": r.get("rating_academics"),
-            "rating_placements": r.get("rating_placements"),
-            "rating_infra": r.get("rating_infra"),
-            "rating_faculty": r.get("rating_faculty"),
-            "pros": r.get("pros", []),
-            "cons": r.get("cons", []),
-            "verified": r.get("verified", False),
-            "helpful_count": r.get("helpful_count", 0),
-            "created_at": r.get("created_at"),
-        }
-    return {"reviews": [map_rev(r) for r in items], "page": page, "limit": limit, "total": total}
+    items, total = await _gather_bounded(cursor.to_list(length=None), _review_count(college_id))
+    return FastJSONResponse(
+        {"reviews": [_review_item(r) for r in items], "page": page, "limit": limit, "total": total},
+        headers=_conditional_headers(etag, last_modified),
+    )
+
+@api_router.get("/reviews/{college_id}/search")
+async def search_reviews(
+    college_id: str,
+    request: Request,
+    q: str = Query(..., min_length=2),
+    page: int = Query(1, ge=1),
+    limit: int = Query(10, ge=1, le=50),
+):
+    """Keyword search within one college's reviews, best matches first."""
+    etag, last_modified = await _review_list_validators(request, college_id)
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    query = {"college_id": college_id, "$text": {"$search": q}}
+    score = {"score": {"$meta": "textScore"}}
+    cursor = db.reviews.find(query, score).sort([("score", {"$meta": "textScore"})]).skip((page - 1) * limit).limit(limit)
+    items, total = await _gather_bounded(cursor.to_list(length=None), db.reviews.count_documents(query))
+    return FastJSONResponse(
+        {"reviews": [_review_item(r) for r in items], "query": q, "page": page, "limit": limit, "total": total},
+        headers=_conditional_headers(etag, last_modified),
+    )
+
+@api_router.get("/reviews/{college_id}/summary")
+async def review_term_summary(college_id: str, request: Request, top: int = Query(10, ge=1, le=50)):
+    """Most mentioned pros/cons terms for a college, from the incrementally maintained term counts."""
+    etag, last_modified = await _collection_validators(request, "reviews")
+    not_modified = _not_modified(request, etag, last_modified)
+    if not_modified:
+        return not_modified
+
+    doc = await db.review_terms.find_one({"college_id": college_id}, {"_id": 0}) or {}
+    return FastJSONResponse(
+        {
+            "college_id": college_id,
+            "review_count": doc.get("review_count", 0),
+            "pros": top_terms(doc.get("pros"), top),
+            "cons": top_terms(doc.get("cons"), top),
+        },
+        headers=_conditional_headers(etag, last_modified),
+    )
 
 @api_router.post("/reviews/{review_id}/helpful")
-async def mark_review_helpful(review_id: str):
-    result = await db.reviews.update_one({"id": review_id}, {"$inc": {"helpful_count": 1}})
-    if result.matched_count == 0:
-        # fallback to ObjectId matching
-        try:
-            await db.reviews.update_one({"_id": ObjectId(review_id)}, {"$inc": {"helpful_count": 1}})
-        except:
-            raise HTTPException(status_code=404, detail="Review not found")
-    return {"message": "Marked helpful"}
+async def mark_review_helpful(review_id: str, user_id: Optional[str] = Query(None)):
+    if not await helpful_votes.review_exists(review_id):
+        raise HTTPException(status_code=404, detail="Review not found")
+    # Counted on the next flush; repeat taps from the same user are ignored
+    counted = await helpful_votes.record(review_id, user_id)
+    return {"message": "Marked helpful", "counted": counted}
 
 # Favorites Routes
 @api_router.post("/favorites")
@@ -906,11 +1859,11 @@ async def get_user_favorites(user_id: str):
             if not college:
                 college = await db.colleges.find_one({"id": college_id})
             if college:
-                colleges.append(CollegeResponse(**college_helper(college)))
+                colleges.append(college_helper(college))
         except:
             continue
     
-    return {"favorites": colleges}
+    return FastJSONResponse({"favorites": colleges})
 
 # Leads Routes
 @api_router.post("/leads")
@@ -940,7 +1893,7 @@ async def list_saved_searches(user_id: str):
     for it in items:
         if "id" not in it:
             it["id"] = str(it.get("_id", ""))
-    return {"items": items}
+    return FastJSONResponse({"items": items})
 
 @api_router.patch("/saved_searches/{search_id}")
 async def update_saved_search(search_id: str, alerts_enabled: Optional[bool] = None):
@@ -959,66 +1912,145 @@ async def create_comparison(compare: CompareCreate):
         raise HTTPException(status_code=400, detail="At least 2 colleges required for comparison")
     
     compare_dict = compare.dict()
+    # Warm the matrix cache so opening the saved comparison is a cache hit
+    payload = await _comparison_payload(compare.college_ids)
+    compare_dict["catalog_version"] = payload["catalog_version"]
     result = await db.comparisons.insert_one(compare_dict)
-    return {"message": "Comparison created", "comparison_id": str(result.inserted_id)}
+    return {
+        "message": "Comparison created",
+        "comparison_id": str(result.inserted_id),
+        "comparison": payload["comparison"],
+    }
 
 @api_router.get("/compare/{user_id}")
 async def get_user_comparisons(user_id: str):
     comparisons = await db.comparisons.find({"user_id": user_id}).to_list(length=None)
-    return {"comparisons": comparisons}
+    return FastJSONResponse({"comparisons": comparisons})
 
 @api_router.post("/compare/colleges")
 async def compare_colleges(college_ids: List[str]):
     if len(college_ids) < 2:
         raise HTTPException(status_code=400, detail="At least 2 colleges required for comparison")
     
-    colleges = []
-    for college_id in college_ids:
-        try:
-            college = await db.colleges.find_one({"_id": ObjectId(college_id)})
-            if not college:
-                college = await db.colleges.find_one({"id": college_id})
-            if college:
-                colleges.append(CollegeResponse(**college_helper(college)))
-        except:
-            continue
-    
-    return {"colleges": colleges}
-
-# Bulk import colleges (JSON)
+    return FastJSONResponse(await _comparison_payload(college_ids))
+
+@api_router.get("/compare/{comparison_id}/matrix")
+async def get_comparison_matrix(comparison_id: str):
+    """Comparison matrix for a stored comparison (reuses the shared matrix cache)"""
+    query: Dict[str, Any] = {"_id": ObjectId(comparison_id)} if ObjectId.is_valid(comparison_id) else {"id": comparison_id}
+    stored = await db.comparisons.find_one(query)
+    if not stored:
+        raise HTTPException(status_code=404, detail="Comparison not found")
+    payload = await _comparison_payload(stored.get("college_ids", []))
+    return FastJSONResponse({"comparison_id": comparison_id, **payload})
+
+def _college_import_record(raw: Dict[str, Any]) -> Dict[str, Any]:
+    """Split delimited list columns (CSV cells, flat NDJSON) on ';' or ','."""
+    for field in ("courses_offered", "accreditation", "recruiters", "departments", "campus_life", "gallery_urls", "video_urls"):
+        value = raw.get(field)
+        if isinstance(value, str):
+            raw[field] = [part.strip() for part in value.replace(";", ",").split(",") if part.strip()]
+    return raw
+
+async def _ingest_college_records(
+    records: AsyncIterator[Tuple[Optional[Dict[str, Any]], Optional[str]]],
+    report: Dict[str, Any],
+    fuzzy: str = "flag",
+) -> Dict[str, Any]:
+    """Insert parsed college records in fixed-size chunks, counting into `report` as it goes; memory is one chunk."""
+    for key in ("rows", "inserted", "skipped", "rejected"):
+        report.setdefault(key, 0)
+    report.setdefault("errors", [])
+
+    def reject(message: str):
+        report["rejected"] += 1
+        if len(report["errors"]) < BULK_MAX_ERRORS:
+            report["errors"].append({"row": report["rows"], "error": message})
+
+    async def flush(docs: List[Dict[str, Any]]):
+        done, duplicates = await _insert_new_colleges(await _fuzzy_screen(docs, fuzzy, report))
+        report["inserted"] += len(done)
+        report["skipped"] += duplicates
+
+    batch: List[Dict[str, Any]] = []
+    try:
+        async for record, error in records:
+            if error:
+                reject(error)
+            elif not record.get("name") or not record.get("city") or not record.get("state"):
+                reject("name, city and state are required")
+            else:
+                try:
+                    batch.append(_stamp_new_college(_fill_defaults_for_college(_college_import_record(record))))
+                except ValidationError as e:
+                    reject(_validation_message(e))
+                except (TypeError, ValueError) as e:
+                    reject(str(e))
+            report["rows"] += 1
+            if len(batch) >= BULK_BATCH_SIZE:
+                await flush(batch)
+                batch = []
+        if batch:
+            await flush(batch)
+    finally:
+        if report["inserted"]:
+            await _bump_version("colleges")
+    return report
+
+async def _ingest_college_stream(request: Request, import_id: str, fuzzy: str = "flag") -> Dict[str, Any]:
+    """Streamed import inside the request; the running report is kept in import_progress."""
+    report: Dict[str, Any] = {"import_id": import_id, "status": "running", "started_at": datetime.utcnow()}
+    import_progress[import_id] = report
+    while len(import_progress) > IMPORT_PROGRESS_MAX:
+        import_progress.popitem(last=False)
+    try:
+        await _ingest_college_records(_iter_request_records(request), report, fuzzy)
+        report["status"] = "completed"
+    except Exception:
+        report["status"] = "failed"
+        raise
+    finally:
+        report["finished_at"] = datetime.utcnow()
+    return report
+
+# Bulk import colleges (JSON, NDJSON or CSV)
 @api_router.post("/colleges/bulk")
-async def bulk_import_colleges(payload: Dict[str, Any]):
+async def bulk_import_colleges(
+    request: Request,
+    import_id: Optional[str] = Query(None),
+    fuzzy: str = Query("flag", pattern="^(off|flag|skip)$", description="Near-duplicate names: report (flag), drop (skip) or ignore (off)"),
+):
     """Import a list of colleges. Missing fields are filled with sensible defaults.
-    Body format: {"colleges": [ { name, city, state, ... }, ... ]}
+    Body format: {"colleges": [ { name, city, state, ... }, ... ]}, or a streamed NDJSON
+    (application/x-ndjson) / CSV (text/csv) body with one college per row. Streamed imports
+    report progress at GET /api/colleges/bulk/{import_id} while they run.
     """
-    items = payload.get("colleges", [])
+    content_type = request.headers.get("content-type", "").lower()
+    if any(kind in content_type for kind in ("ndjson", "jsonl", "csv")):
+        return FastJSONResponse(await _ingest_college_stream(request, import_id or str(uuid.uuid4()), fuzzy))
+
+    try:
+        payload = orjson.loads(await request.body())
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Body must be JSON, NDJSON or CSV")
+    items = payload.get("colleges", []) if isinstance(payload, dict) else None
     if not isinstance(items, list) or not items:
         raise HTTPException(status_code=400, detail="'colleges' must be a non-empty list")
 
-    docs = []
-    for raw in items:
-        if not isinstance(raw, dict):
-            continue
-        # minimal required provided
-        if not raw.get("name") or not raw.get("city") or not raw.get("state"):
-            continue
-        docs.append(_fill_defaults_for_college(raw))
+    async def records():
+        for item in items:
+            yield (item, None) if isinstance(item, dict) else (None, "Row is not an object")
 
-    if not docs:
-        raise HTTPException(status_code=400, detail="No valid college items to insert")
+    # Same validation and counters as the streamed formats: incomplete or invalid rows are rejected with errors
+    return FastJSONResponse(await _ingest_college_records(records(), {}, fuzzy))
 
-    # Dedupe by (name, city, state)
-    to_insert = []
-    for d in docs:
-        exists = await db.colleges.count_documents({"name": d["name"], "city": d["city"], "state": d["state"]})
-        if exists == 0:
-            to_insert.append(d)
-
-    if not to_insert:
-        return {"inserted": 0, "skipped": len(docs)}
-
-    result = await db.colleges.insert_many(to_insert)
-    return {"inserted": len(result.inserted_ids), "skipped": len(docs) - len(to_insert)}
+@api_router.get("/colleges/bulk/{import_id}")
+async def bulk_import_progress(import_id: str):
+    """Running (or final) report of a streamed college import."""
+    report = import_progress.get(import_id)
+    if report is None:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return FastJSONResponse(report)
 
 # Recommendation Routes
 @api_router.post("/recommendations")
@@ -1051,11 +2083,11 @@ async def get_recommendations(request: RecommendationRequest):
         # Limit results
         limited_recommendations = recommendations[:request.limit]
         
-        return {
+        return FastJSONResponse({
             "recommendations": limited_recommendations,
             "total_found": len(recommendations),
             "user_id": request.user_id
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error generating recommendations: {str(e)}")
@@ -1077,10 +2109,10 @@ async def get_trending_colleges(limit: int = Query(10, ge=1, le=50)):
         # Get trending colleges (fallback to top-rated if no browsing history)
         trending = recommendation_engine.get_trending_colleges(colleges_dict, [])
         
-        return {
+        return FastJSONResponse({
             "trending": trending[:limit],
             "total_found": len(trending)
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting trending colleges: {str(e)}")
@@ -1115,16 +2147,16 @@ async def get_quick_recommendations(
         colleges = await colleges_cursor.to_list(length=None)
         
         # Convert to response format
-        college_responses = [CollegeResponse(**college_helper(college)) for college in colleges]
+        college_responses = [college_helper(college) for college in colleges]
         
-        return {
+        return FastJSONResponse({
             "quick_recommendations": college_responses,
             "criteria": {
                 "courses": preferred_courses,
                 "max_budget": budget_max,
                 "state": preferred_state
             }
-        }
+        })
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error getting quick recommendations: {str(e)}")
@@ -1465,9 +2497,198 @@ async def initialize_dummy_data():
     ]
     
     # Insert dummy data
+    for doc in dummy_colleges:
+        _stamp_new_college(doc)
     result = await db.colleges.insert_many(dummy_colleges)
+    await _bump_version("colleges")
     return {"message": f"Successfully inserted {len(result.inserted_ids)} colleges"}
 
+@api_router.post("/dev/rebuild-cutoff-trends")
+async def rebuild_cutoff_trends(college_id: Optional[str] = None):
+    """Recompute materialized cutoff trends from the raw cutoffs (backfill / repair)."""
+    match: Dict[str, Any] = {"closing_rank": {"$ne": None}}
+    if college_id:
+        match["college_id"] = college_id
+    pipeline = [
+        {"$match": match},
+        {"$group": {
+            "_id": {"college_id": "$college_id", "exam": "$exam", "category": "$category", "branch": "$branch"},
+            "rows": {"$push": {"year": "$year", "round": "$round", "closing_rank": "$closing_rank"}},
+        }},
+    ]
+    ops = []
+    now = datetime.utcnow()
+    async for group in db.cutoffs.aggregate(pipeline, allowDiskUse=True):
+        key = group["_id"]
+        series = merge_trend_series([], group["rows"])
+        ops.append(UpdateOne(
+            {"college_id": key["college_id"], "exam": key.get("exam"), "category": key.get("category"), "branch": key.get("branch")},
+            {"$set": {"series": series, **summarize_trend(series), "updated_at": now}, "$inc": {"rev": 1}},
+            upsert=True,
+        ))
+        if len(ops) >= 1000:
+            await db.cutoff_trends.bulk_write(ops, ordered=False)
+            ops = []
+    if ops:
+        await db.cutoff_trends.bulk_write(ops, ordered=False)
+    return {"message": "Cutoff trends rebuilt"}
+
+async def _backfill_college_keys() -> Dict[str, Any]:
+    """
+    Set dedupe_key on colleges inserted before it existed and build the unique index.
+    The oldest row of each duplicate group gets the key; the others are reported, not touched.
+    Collisions are checked per batch against the stored keys, so the key set is never loaded whole.
+    """
+    keyed = 0
+    duplicates: List[str] = []
+
+    async def key_batch(batch: List[Tuple[Any, str]]) -> None:
+        nonlocal keyed
+        keys = list({key for _, key in batch})
+        taken = {doc["dedupe_key"] async for doc in db.colleges.find({"dedupe_key": {"$in": keys}}, {"dedupe_key": 1})}
+        ops: List[UpdateOne] = []
+        for oid, key in batch:
+            if key in taken:
+                duplicates.append(str(oid))
+                continue
+            taken.add(key)
+            ops.append(UpdateOne({"_id": oid}, {"$set": {"dedupe_key": key}}))
+        if ops:
+            await db.colleges.bulk_write(ops, ordered=False)
+            keyed += len(ops)
+
+    if await db.colleges.find_one({"dedupe_key": {"$exists": False}}, {"_id": 1}) is not None:
+        batch: List[Tuple[Any, str]] = []
+        cursor = db.colleges.find({"dedupe_key": {"$exists": False}}, {"name": 1, "city": 1, "state": 1}).sort([("_id", 1)])
+        async for doc in cursor:
+            batch.append((doc["_id"], college_dedupe_key(doc.get("name"), doc.get("city"), doc.get("state"))))
+            if len(batch) >= BULK_BATCH_SIZE:
+                await key_batch(batch)  # written before the next batch looks its keys up
+                batch = []
+        if batch:
+            await key_batch(batch)
+    await db.colleges.create_index(
+        [("dedupe_key", 1)], unique=True, partialFilterExpression={"dedupe_key": {"$exists": True}}
+    )
+    return {"keyed": keyed, "duplicates": duplicates[:100], "duplicate_count": len(duplicates)}
+
+@api_router.post("/dev/backfill-college-keys")
+async def backfill_college_keys():
+    """Key colleges inserted before dedupe_key existed (also run at startup) and report leftover duplicates."""
+    return await _backfill_college_keys()
+
+@api_router.post("/dev/normalize-college-types")
+async def normalize_college_types():
+    """
+    Coerce stored colleges to the College field types (rows bulk-imported as raw CSV strings).
+    Rows that don't validate are reported, not touched.
+    """
+    fixed = 0
+    invalid: List[str] = []
+    ops: List[UpdateOne] = []
+    async for doc in db.colleges.find({}):
+        try:
+            typed = College.model_validate(doc).model_dump(exclude={"id", "created_at"})
+        except ValidationError:
+            invalid.append(str(doc["_id"]))
+            continue
+        changes = {k: v for k, v in typed.items() if k in doc and (doc[k] != v or type(doc[k]) is not type(v))}
+        if not changes:
+            continue
+        fixed += 1
+        ops.append(UpdateOne({"_id": doc["_id"]}, {"$set": {**changes, "updated_at": datetime.utcnow()}, "$inc": {"version": 1}}))
+        if len(ops) >= BULK_BATCH_SIZE:
+            await db.colleges.bulk_write(ops, ordered=False)
+            ops = []
+    if ops:
+        await db.colleges.bulk_write(ops, ordered=False)
+    if fixed:
+        await _bump_version("colleges")
+    return {"fixed": fixed, "invalid": invalid[:100], "invalid_count": len(invalid)}
+
+@api_router.post("/dev/rebuild-college-signatures")
+async def rebuild_college_signatures():
+    """Compute fuzzy-dedupe signatures for every college (backfill after deploy or a tokenizer change)."""
+    batch: List[Dict[str, Any]] = []
+    total = 0
+    async for doc in db.colleges.find({}, {"name": 1, "city": 1, "state": 1}):
+        batch.append(doc)
+        if len(batch) >= BULK_BATCH_SIZE:
+            await _store_college_signatures(batch)
+            total += len(batch)
+            batch = []
+    await _store_college_signatures(batch)
+    return {"colleges": total + len(batch)}
+
+@api_router.post("/dev/rebuild-review-stats")
+async def rebuild_review_stats():
+    """Recompute every college's review aggregate from the reviews collection (backfill / repair)."""
+    now = datetime.utcnow()
+    projection = {"_id": 0, "college_id": 1, **{field: 1 for field in ("rating_overall", "rating_academics", "rating_placements", "rating_infra", "rating_faculty")}}
+    ops: List[UpdateOne] = []
+    current_id, stats = None, {}
+
+    def flush_college():
+        if current_id is not None:
+            ops.append(UpdateOne(_college_query(current_id), {"$set": {"review_stats": stats, "reviews_updated_at": now}, "$inc": {"review_version": 1}}))
+
+    async for review in db.reviews.find({}, projection).sort([("college_id", 1)]):
+        if review.get("college_id") != current_id:
+            flush_college()
+            current_id, stats = review.get("college_id"), {}
+        accumulate_review_stats(stats, review)
+        if len(ops) >= 1000:
+            await db.colleges.bulk_write(ops, ordered=False)
+            ops = []
+    flush_college()
+    if ops:
+        await db.colleges.bulk_write(ops, ordered=False)
+    # Colleges whose reviews are all gone lose their aggregate
+    await db.colleges.update_many(
+        {"review_stats": {"$exists": True}, "$or": [{"reviews_updated_at": {"$lt": now}}, {"reviews_updated_at": {"$exists": False}}]},
+        {"$unset": {"review_stats": ""}, "$set": {"reviews_updated_at": now}, "$inc": {"review_version": 1}},
+    )
+    await _bump_version("reviews")
+    return {"message": "Review stats rebuilt"}
+
+@api_router.post("/dev/rebuild-review-terms")
+async def rebuild_review_terms():
+    """
+    Recompute pros/cons term counts for every college from its reviews. Each college's document is
+    replaced in place (readers never see it missing); documents of colleges with no reviews left are removed.
+    """
+    now = datetime.utcnow()
+    terms: Dict[str, Dict[str, Any]] = {}
+    async for review in db.reviews.find({}, {"_id": 0, "college_id": 1, "pros": 1, "cons": 1}):
+        doc = terms.setdefault(review["college_id"], {"review_count": 0, "pros": {}, "cons": {}})
+        for path, amount in review_term_increments(review).items():
+            side, _, term = path.partition(".")
+            if term:
+                doc[side][term] = doc[side].get(term, 0) + amount
+            else:
+                doc[side] += amount
+    ops: List[ReplaceOne] = []
+    for cid, doc in terms.items():
+        for side in ("pros", "cons"):
+            for term in terms_to_prune(doc[side]):
+                del doc[side][term]
+        ops.append(ReplaceOne({"college_id": cid}, {"college_id": cid, **doc, "writes_since_prune": 0, "updated_at": now}, upsert=True))
+        if len(ops) >= BULK_BATCH_SIZE:
+            await db.review_terms.bulk_write(ops, ordered=False)
+            ops = []
+    if ops:
+        await db.review_terms.bulk_write(ops, ordered=False)
+    await db.review_terms.delete_many({"updated_at": {"$not": {"$gte": now}}})
+    await _bump_version("reviews")
+    return {"colleges": len(terms)}
+
+@api_router.post("/dev/rebuild-helpful-scores")
+async def rebuild_helpful_scores():
+    """Backfill helpful_score on reviews written before it existed (or after a formula change)."""
+    result = await db.reviews.update_many({}, helpful_score_update(0))
+    await _bump_version("reviews")
+    return {"updated": result.modified_count}
+
 @api_router.post("/dev/seed-colleges")
 async def seed_more_colleges(
     count: int = Query(100, ge=1, le=1000),
@@ -1519,7 +2740,7 @@ async def seed_more_colleges(
         offered = random.sample(branches, k=random.randint(4, min(7, len(branches))))
 
         name = f"{city} Institute of Technology & Sciences {random.randint(100,999)}"
-        docs.append({
+        docs.append(_stamp_new_college({
             "name": name,
             "city": city,
             "state": state,
@@ -1549,12 +2770,14 @@ async def seed_more_colleges(
             "contact_phone": f"+91-{random.randint(100,999)}-{random.randint(1000000,9999999)}",
             "website": f"https://{city.lower().replace(' ','')}{random.randint(100,999)}.edu",
             "address": f"{random.randint(1,200)}, {city}, {state}",
-        })
+        }))
 
     if not docs:
         return {"inserted": 0}
 
-    result = await db.colleges.insert_many(docs)
+    # Random names can collide with each other or earlier seeds; those are skipped
+    docs, _ = await _insert_new_colleges(docs)
+    await _bump_version("colleges")
 
     seeded_cutoffs = 0
     if with_cutoffs:
@@ -1562,7 +2785,7 @@ async def seed_more_colleges(
         categories = ["GEN", "EWS", "OBC", "SC", "ST"]
         cutoff_docs = []
         # Fetch inserted documents' ids
-        ids = result.inserted_ids
+        ids = [doc["_id"] for doc in docs]
         # For each college, create a few cutoff entries across years/branches
         years = [datetime.utcnow().year - d for d in range(0, 3)]
         for _id, doc in zip(ids, docs):
@@ -1585,9 +2808,100 @@ async def seed_more_colleges(
                     })
         if cutoff_docs:
             await db.cutoffs.insert_many(cutoff_docs)
+            version = await _bump_version("cutoffs")
+            cutoff_rank_index.apply(cutoff_docs, version - 1, version)
+            cutoff_options_cache.clear()
+            await _gather_bounded(_update_cutoff_trends(cutoff_docs), _refresh_competitiveness([str(_id) for _id in ids]))
             seeded_cutoffs = len(cutoff_docs)
 
-    return {"inserted": len(result.inserted_ids), "cutoffs": seeded_cutoffs}
+    return {"inserted": len(docs), "cutoffs": seeded_cutoffs}
+
+# Background jobs
+job_runner = JobRunner(db.jobs, max_concurrency=JOB_CONCURRENCY)
+
+async def _spool_request(request: Request) -> Path:
+    """Copy the request body to disk chunk by chunk so a job can read it after the response."""
+    JOB_SPOOL_DIR.mkdir(parents=True, exist_ok=True)
+    path = JOB_SPOOL_DIR / f"{uuid.uuid4()}.body"
+    with open(path, "wb") as f:
+        async for chunk in request.stream():
+            await asyncio.to_thread(f.write, chunk)
+    return path
+
+async def _iter_file_chunks(path: str) -> AsyncIterator[bytes]:
+    with open(path, "rb") as f:
+        while True:
+            chunk = await asyncio.to_thread(f.read, JOB_SPOOL_CHUNK)
+            if not chunk:
+                return
+            yield chunk
+
+def _remove_spool(params: Dict[str, Any]) -> None:
+    Path(params["path"]).unlink(missing_ok=True)
+
+async def _import_colleges_job(params: Dict[str, Any], job: Job) -> Dict[str, Any]:
+    if not Path(params["path"]).exists():
+        raise RuntimeError("Uploaded body is no longer available")
+    records = _iter_stream_records(_iter_file_chunks(params["path"]), params.get("content_type", ""))
+    report = await _ingest_college_records(records, job.progress, params.get("fuzzy", "flag"))
+    return {k: report.get(k, 0) for k in ("rows", "inserted", "skipped", "rejected", "possible_duplicates", "skipped_fuzzy")}
+
+async def _seed_colleges_job(params: Dict[str, Any], job: Job) -> Dict[str, Any]:
+    total = int(params["count"])
+    job.progress.update({"total": total, "cutoffs": 0})
+    while job.progress["rows"] < total:
+        batch = min(SEED_JOB_BATCH, total - job.progress["rows"])
+        result = await seed_more_colleges(count=batch, with_cutoffs=bool(params.get("with_cutoffs")))
+        # rows counts generated colleges (name collisions are skipped, so inserted may be lower)
+        job.progress["rows"] += batch
+        job.progress["inserted"] = job.progress.get("inserted", 0) + result["inserted"]
+        job.progress["cutoffs"] += result["cutoffs"]
+    return {"inserted": job.progress.get("inserted", 0), "cutoffs": job.progress["cutoffs"]}
+
+async def _init_data_job(params: Dict[str, Any], job: Job) -> Dict[str, Any]:
+    return await initialize_dummy_data()
+
+# Imports are deduped and init-data checks for existing data, so both are safe to re-run after a restart
+job_runner.register("import_colleges", _import_colleges_job, rerunnable=True, cleanup=_remove_spool)
+job_runner.register("seed_colleges", _seed_colleges_job)
+job_runner.register("init_data", _init_data_job, rerunnable=True)
+
+@api_router.post("/jobs/import-colleges", status_code=202)
+async def submit_import_job(request: Request, fuzzy: str = Query("flag", pattern="^(off|flag|skip)$")):
+    """Queue a college import. Body: JSON ({"colleges": [...]} or an array), NDJSON or CSV, as for /colleges/bulk."""
+    path = await _spool_request(request)
+    job = await job_runner.submit("import_colleges", {
+        "path": str(path),
+        "content_type": request.headers.get("content-type", "application/json"),
+        "fuzzy": fuzzy,
+    })
+    return FastJSONResponse({"job_id": job["id"], "status": job["status"]}, status_code=202)
+
+@api_router.post("/jobs/seed-colleges", status_code=202)
+async def submit_seed_job(
+    count: int = Query(1000, ge=1, le=1_000_000),
+    with_cutoffs: bool = Query(False),
+):
+    """Queue synthetic college seeding (in batches of 1000) without the request-time cap."""
+    job = await job_runner.submit("seed_colleges", {"count": count, "with_cutoffs": with_cutoffs})
+    return FastJSONResponse({"job_id": job["id"], "status": job["status"]}, status_code=202)
+
+@api_router.post("/jobs/init-data", status_code=202)
+async def submit_init_data_job():
+    job = await job_runner.submit("init_data", {})
+    return FastJSONResponse({"job_id": job["id"], "status": job["status"]}, status_code=202)
+
+@api_router.get("/jobs")
+async def list_jobs(status: Optional[str] = Query(None), limit: int = Query(50, ge=1, le=200)):
+    return FastJSONResponse({"jobs": await job_runner.list(status=status, limit=limit)})
+
+@api_router.get("/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Status, progress counters, throughput (rows_per_second) and errors of a job."""
+    job = await job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return FastJSONResponse(job)
 
 # Include the router in the main app
 app.include_router(api_router)
@@ -1599,6 +2913,46 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+competitiveness_task: Optional[asyncio.Task] = None
+helpful_votes = HelpfulVoteBuffer(
+    db.reviews,
+    db.review_helpful_votes,
+    flush_interval=HELPFUL_FLUSH_SECONDS,
+    max_pending=HELPFUL_MAX_PENDING,
+    on_flush=_bump_helpful_versions,
+    increment_update=helpful_score_update,
+)
+
+@app.on_event("startup")
+async def start_competitiveness_refresh():
+    global competitiveness_task
+    if COMPETITIVENESS_REFRESH_SECONDS > 0:
+        competitiveness_task = asyncio.create_task(_competitiveness_refresh_loop())
+
+@app.on_event("startup")
+async def start_helpful_votes():
+    try:
+        await helpful_votes.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Helpful vote index creation failed: {e}")
+    helpful_votes.start()
+
+@app.on_event("startup")
+async def start_jobs():
+    try:
+        await job_runner.ensure_indexes()
+    except Exception as e:
+        logger.warning(f"Job index creation failed: {e}")
+    requeued = await job_runner.recover()
+    if requeued:
+        logger.info(f"Re-queued {requeued} background jobs")
+    job_runner.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    if competitiveness_task:
+        competitiveness_task.cancel()
+    # Flush buffered helpful votes and stop jobs before the connection goes away
+    await helpful_votes.stop()
+    await job_runner.shutdown()
     client.close()
@@ -0,0 +1,39 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent / "backend"
+sys.path.insert(0, str(BACKEND_DIR))
+# server.py reads these at import time
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "college_test")
+
+
+@pytest.fixture(scope="session")
+def server():
+    """The FastAPI app module backed by an in-memory mongomock database."""
+    mongomock_motor = pytest.importorskip("mongomock_motor")
+    import motor.motor_asyncio
+
+    def mock_client(*args, **kwargs):
+        return mongomock_motor.AsyncMongoMockClient()
+
+    motor.motor_asyncio.AsyncIOMotorClient = mock_client
+    import server as server_module
+    return server_module
+
+
+@pytest.fixture
+def api(server):
+    from fastapi.testclient import TestClient
+
+    with TestClient(server.app) as client:
+        yield client
+
+
+@pytest.fixture
+def run_app(api):
+    """Run a coroutine on the event loop the TestClient drives the app on."""
+    return lambda coro: api.portal.call(lambda: coro)
@@ -0,0 +1,31 @@
+import json
+
+CUTOFF = {"college_id": "bulk-c1", "year": 2024, "exam": "JEE Main", "category": "GEN", "branch": "CSE", "round": 1, "closing_rank": 2000}
+SEAT = {"college_id": "bulk-c1", "year": 2024, "branch": "CSE", "category": "GEN", "intake": 120}
+
+
+def test_cutoff_bulk_upserts_on_the_natural_key(server, api, run_app):
+    rows = [CUTOFF, {**CUTOFF, "round": 2, "closing_rank": 2300}, {**CUTOFF, "year": "not a year"}]
+    first = api.post("/api/cutoffs/bulk", json=rows).json()
+    assert {k: first[k] for k in ("inserted", "updated", "unchanged", "rejected")} == {
+        "inserted": 2, "updated": 0, "unchanged": 0, "rejected": 1,
+    }
+    assert first["errors"][0]["row"] == 2 and "year" in first["errors"][0]["error"]
+
+    ndjson = "\n".join(json.dumps(r) for r in ({**CUTOFF, "closing_rank": 1900}, {**CUTOFF, "round": 2, "closing_rank": 2300}))
+    again = api.post("/api/cutoffs/bulk", content=ndjson, headers={"content-type": "application/x-ndjson"}).json()
+    assert (again["inserted"], again["updated"], again["unchanged"], again["rejected"]) == (0, 1, 1, 0)
+
+    stored = run_app(server.db.cutoffs.find({"college_id": "bulk-c1"}).sort([("round", 1)]).to_list(length=None))
+    assert [(d["round"], d["closing_rank"]) for d in stored] == [(1, 1900), (2, 2300)]
+
+
+def test_seat_bulk_reports_malformed_lines_and_upserts(server, api, run_app):
+    body = "\n".join([json.dumps(SEAT), "{not json", json.dumps({**SEAT, "category": "OBC", "intake": 40}), json.dumps({**SEAT, "intake": 150})])
+    report = api.post("/api/seats/bulk", content=body, headers={"content-type": "application/x-ndjson"}).json()
+    # The third row updates the first row's key within the same batch
+    assert report["rejected"] == 1 and report["errors"][0]["row"] == 1
+    assert report["inserted"] + report["updated"] + report["unchanged"] == 3
+
+    stored = run_app(server.db.seats.find({"college_id": "bulk-c1"}).to_list(length=None))
+    assert sorted((d["category"], d["intake"]) for d in stored) == [("GEN", 150), ("OBC", 40)]
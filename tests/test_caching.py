@@ -0,0 +1,48 @@
+CUTOFF = {"college_id": "cache-c1", "year": 2024, "exam": "JEE Main", "category": "GEN", "branch": "CSE", "round": 1, "closing_rank": 900}
+
+
+def test_etag_revalidation_returns_304_until_the_catalog_changes(api):
+    api.post("/api/cutoffs", json=CUTOFF)
+    first = api.get("/api/cutoffs", params={"college_id": "cache-c1"})
+    etag = first.headers["etag"]
+    assert first.headers["cache-control"]
+
+    cached = api.get("/api/cutoffs", params={"college_id": "cache-c1"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304 and cached.content == b""
+    assert cached.headers["etag"] == etag
+    weak = {"If-None-Match": f'"other", W/{etag}'}
+    assert api.get("/api/cutoffs", params={"college_id": "cache-c1"}, headers=weak).status_code == 304
+
+    api.post("/api/cutoffs", json={**CUTOFF, "round": 2})
+    assert api.get("/api/cutoffs", params={"college_id": "cache-c1"}, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_last_modified_revalidation(api):
+    api.post("/api/cutoffs", json={**CUTOFF, "branch": "ECE"})
+    last_modified = api.get("/api/cutoffs").headers["last-modified"]
+    assert api.get("/api/cutoffs", headers={"If-Modified-Since": last_modified}).status_code == 304
+    assert api.get("/api/cutoffs", headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}).status_code == 200
+    # If-None-Match wins over If-Modified-Since
+    assert api.get("/api/cutoffs", headers={"If-None-Match": '"stale"', "If-Modified-Since": last_modified}).status_code == 200
+
+
+def test_cutoff_options_are_cached_per_college_and_cleared_on_write(server, api):
+    api.post("/api/cutoffs", json={**CUTOFF, "college_id": "options-c1", "branch": "Civil"})
+    assert api.get("/api/cutoffs/options", params={"college_id": "options-c1"}).json()["branches"] == ["Civil"]
+    assert "options-c1" in server.cutoff_options_cache
+    everywhere = api.get("/api/cutoffs/options").json()
+    assert None in server.cutoff_options_cache and "Civil" in everywhere["branches"]
+
+    # A cached entry is served as-is while the cutoffs version is unchanged
+    version, options = server.cutoff_options_cache["options-c1"]
+    server.cutoff_options_cache["options-c1"] = (version, {**options, "branches": ["from cache"]})
+    assert api.get("/api/cutoffs/options", params={"college_id": "options-c1"}).json()["branches"] == ["from cache"]
+
+    api.post("/api/cutoffs", json={**CUTOFF, "college_id": "options-c1", "branch": "Mining", "year": 2025})
+    assert server.cutoff_options_cache == {}
+    options = api.get("/api/cutoffs/options", params={"college_id": "options-c1"}).json()
+    assert options["branches"] == ["Civil", "Mining"]
+    assert options["years"] == [2025, 2024]
+
+    api.post("/api/cutoffs/bulk", json=[{**CUTOFF, "college_id": "options-c1", "branch": "Aero"}])
+    assert "Aero" in api.get("/api/cutoffs/options", params={"college_id": "options-c1"}).json()["branches"]
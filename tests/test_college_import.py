@@ -0,0 +1,134 @@
+import asyncio
+import json
+
+import pytest
+
+
+CSV_BODY = (
+    "name,city,state,annual_fees,star_rating,hostel_facilities,wifi,established_year,courses_offered\n"
+    "Typed Institute of Technology,Pune,Maharashtra,250000,4.5,false,0,1998,Computer Science;Electronics\n"
+    "Blank Cells College,Nagpur,Maharashtra,,,,yes,,\n"
+    "Bad Fees College,Nashik,Maharashtra,a lot,4.0,true,true,2001,\n"
+)
+
+
+def _stored(run_app, server, name):
+    return run_app(server.db.colleges.find_one({"name": name}))
+
+
+def test_csv_import_stores_model_types(server, api, run_app):
+    res = api.post("/api/colleges/bulk", content=CSV_BODY, headers={"content-type": "text/csv"})
+    assert res.status_code == 200
+    report = res.json()
+    assert report["inserted"] == 2
+    assert report["rejected"] == 1
+    assert "annual_fees" in report["errors"][0]["error"]
+
+    doc = _stored(run_app, server, "Typed Institute of Technology")
+    assert doc["annual_fees"] == 250000 and type(doc["annual_fees"]) is int
+    assert doc["star_rating"] == 4.5 and type(doc["star_rating"]) is float
+    assert doc["established_year"] == 1998
+    assert doc["hostel_facilities"] is False
+    assert doc["wifi"] is False
+    assert doc["courses_offered"] == ["Computer Science", "Electronics"]
+
+    blank = _stored(run_app, server, "Blank Cells College")
+    assert blank["wifi"] is True
+    assert type(blank["annual_fees"]) is int
+    assert type(blank["star_rating"]) is float
+    assert type(blank["hostel_facilities"]) is bool
+
+
+def test_hostel_filter_excludes_false_strings(api):
+    api.post(
+        "/api/colleges/bulk",
+        content="name,city,state,hostel_facilities\nNo Hostel Academy,Thane,Maharashtra,false\n",
+        headers={"content-type": "text/csv"},
+    )
+    res = api.get("/api/colleges/search", params={"city": "Thane", "hostel": True})
+    names = [c["name"] for c in res.json()["colleges"]]
+    assert "No Hostel Academy" not in names
+    res = api.get("/api/colleges/search", params={"city": "Thane", "hostel": False})
+    assert "No Hostel Academy" in [c["name"] for c in res.json()["colleges"]]
+
+
+def test_normalize_college_types_fixes_string_rows(server, api, run_app):
+    api.post("/api/colleges/bulk", json={"colleges": [{"name": "Legacy Strings College", "city": "Kota", "state": "Rajasthan"}]})
+    run_app(server.db.colleges.update_one(
+        {"name": "Legacy Strings College"},
+        {"$set": {"annual_fees": "120000", "hostel_facilities": "false", "star_rating": "3.5"}},
+    ))
+    assert api.post("/api/dev/normalize-college-types").json()["fixed"] == 1
+
+    doc = _stored(run_app, server, "Legacy Strings College")
+    assert doc["annual_fees"] == 120000
+    assert doc["hostel_facilities"] is False
+    assert doc["star_rating"] == 3.5
+
+
+def test_fast_json_response_serializes_numpy(server):
+    np = pytest.importorskip("numpy")
+    body = server.FastJSONResponse({"score": np.float64(0.5), "count": np.int64(3), "flag": np.bool_(True)}).body
+    assert body == b'{"score":0.5,"count":3,"flag":true}'
+
+
+def test_import_dedupes_against_rows_stored_before_dedupe_key(server):
+    from fastapi.testclient import TestClient
+
+    legacy = server._fill_defaults_for_college({"name": "Old Row University", "city": "Agra", "state": "Uttar Pradesh"})
+    asyncio.run(server.db.colleges.insert_one(legacy))
+    # Startup keys the legacy row, so the unique index sees it
+    with TestClient(server.app) as client:
+        report = client.post(
+            "/api/colleges/bulk",
+            json={"colleges": [{"name": "old row university", "city": "Agra", "state": "Uttar Pradesh"}]},
+            params={"fuzzy": "off"},
+        ).json()
+    assert report["inserted"] == 0
+    assert report["skipped"] == 1
+
+
+def test_backfill_keys_in_batches_and_reports_only_rows_it_keyed(server, monkeypatch):
+    import mongomock_motor
+
+    db = mongomock_motor.AsyncMongoMockClient()["backfill_test"]
+    monkeypatch.setattr(server, "db", db)
+    monkeypatch.setattr(server, "BULK_BATCH_SIZE", 1)
+    rows = [
+        {"name": "Keyed College", "city": "Kota", "state": "Rajasthan"},
+        {"name": "Plain College", "city": "Kota", "state": "Rajasthan"},
+        {"name": "plain college", "city": "Kota", "state": "Rajasthan"},
+    ]
+    docs = [server._fill_defaults_for_college(r) for r in rows]
+    docs[0]["dedupe_key"] = server.college_dedupe_key("Keyed College", "Kota", "Rajasthan")
+    ids = asyncio.run(db.colleges.insert_many(docs)).inserted_ids
+
+    # One batch per row: the second legacy row must see the key the first batch just wrote
+    report = asyncio.run(server._backfill_college_keys())
+    assert report == {"keyed": 1, "duplicates": [str(ids[2])], "duplicate_count": 1}
+    assert asyncio.run(db.colleges.find_one({"_id": ids[1]}))["dedupe_key"] == server.college_dedupe_key("Plain College", "Kota", "Rajasthan")
+
+    asyncio.run(db.colleges.delete_one({"_id": ids[2]}))
+    assert asyncio.run(server._backfill_college_keys()) == {"keyed": 0, "duplicates": [], "duplicate_count": 0}
+
+
+def test_json_body_reports_the_same_counters_as_ndjson(api):
+    def rows(tag):
+        return [
+            {"name": f"Parity {tag} College", "city": "Bhopal", "state": "Madhya Pradesh"},
+            {"name": f"Parity {tag} No City", "state": "Madhya Pradesh"},
+            {"name": f"Parity {tag} Bad Fees", "city": "Bhopal", "state": "Madhya Pradesh", "annual_fees": "a lot"},
+            [f"Parity {tag} not an object"],
+        ]
+
+    from_json = api.post("/api/colleges/bulk", json={"colleges": rows("Json")}, params={"fuzzy": "off"}).json()
+    ndjson = "\n".join(json.dumps(r) for r in rows("Ndjson"))
+    from_ndjson = api.post(
+        "/api/colleges/bulk", content=ndjson, headers={"content-type": "application/x-ndjson"}, params={"fuzzy": "off"}
+    ).json()
+
+    counters = ("rows", "inserted", "skipped", "rejected")
+    assert {k: from_json[k] for k in counters} == {"rows": 4, "inserted": 1, "skipped": 0, "rejected": 3}
+    assert {k: from_json[k] for k in counters} == {k: from_ndjson[k] for k in counters}
+    assert [e["row"] for e in from_json["errors"]] == [e["row"] for e in from_ndjson["errors"]] == [1, 2, 3]
+    assert "annual_fees" in from_json["errors"][1]["error"]
@@ -0,0 +1,48 @@
+from comparison import ComparisonCache, build_comparison_matrix, select_comparison_columns
+
+
+def college(cid, **fields):
+    return {"id": cid, **fields}
+
+
+def test_matrix_normalizes_so_one_is_best_in_each_row():
+    matrix = build_comparison_matrix([
+        college("a", annual_fees=100000, average_package=500000),
+        college("b", annual_fees=300000, average_package=900000),
+        college("c", annual_fees=None, average_package=700000),
+    ])
+    by_key = {m["key"]: m for m in matrix["metrics"]}
+    assert matrix["college_ids"] == ["a", "b", "c"]
+    assert by_key["annual_fees"]["normalized"] == [1.0, 0.0, None]
+    assert by_key["average_package"]["normalized"] == [0.0, 1.0, 0.5]
+    assert by_key["average_package"]["best"] == [False, True, False]
+    assert by_key["ranking"]["values"] == [None, None, None]
+
+
+def test_selected_columns_follow_the_requested_order():
+    matrix = build_comparison_matrix([college("a", star_rating=3.0), college("b", star_rating=4.5)])
+    swapped = select_comparison_columns(matrix, [1, 0], ["B", "A"])
+    rating = next(m for m in swapped["metrics"] if m["key"] == "star_rating")
+    assert swapped["college_ids"] == ["B", "A"]
+    assert rating["values"] == [4.5, 3.0]
+    assert rating["best"] == [True, False]
+    assert rating["best_value"] == 4.5
+    assert swapped["overall"] == matrix["overall"][::-1]
+
+
+def test_cache_key_ignores_order_and_duplicates():
+    assert ComparisonCache.make_key(["z", "a", "z"], 3) == ComparisonCache.make_key(["a", "z"], 3)
+
+
+def test_compare_response_keeps_request_order(server, api, run_app):
+    run_app(server.db.colleges.insert_many([
+        server._fill_defaults_for_college({"id": cid, "name": name, "city": "Pune", "state": "Maharashtra", "annual_fees": fees})
+        for cid, name, fees in (("cmp-zeta", "Zeta College", 90000), ("cmp-alpha", "Alpha College", 250000))
+    ]))
+    for ids in (["cmp-zeta", "cmp-alpha"], ["cmp-alpha", "cmp-zeta"]):
+        payload = api.post("/api/compare/colleges", json=ids).json()
+        names = [c["name"] for c in payload["colleges"]]
+        fees = next(m for m in payload["comparison"]["metrics"] if m["key"] == "annual_fees")
+        assert payload["comparison"]["college_ids"] == ids
+        assert fees["values"] == [c["annual_fees"] for c in payload["colleges"]]
+        assert names == (["Zeta College", "Alpha College"] if ids[0] == "cmp-zeta" else ["Alpha College", "Zeta College"])
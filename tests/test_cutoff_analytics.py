@@ -0,0 +1,73 @@
+from cutoff_analytics import CutoffRankIndex
+
+
+def row(college_id, closing_rank, category="GEN", branch="CSE", year=2024, round_=1, exam="JEE Main"):
+    return {"college_id": college_id, "exam": exam, "category": category, "branch": branch,
+            "year": year, "round": round_, "closing_rank": closing_rank}
+
+
+ROWS = [
+    row("a", 500), row("a", 900, round_=2),  # round 2 is more lenient
+    row("b", 1500), row("c", 3000), row("d", 200),
+    row("b", 2500, branch="ECE"),
+    row("e", 4000, category="OBC"),
+    row("f", 9000, year=2023),
+    row("g", 9999, exam="NEET"),
+]
+
+
+def make_index(rows=ROWS, college_ids=None):
+    index = CutoffRankIndex()
+    index.load(rows, version=1, college_ids=college_ids, colleges_version=1)
+    return index
+
+
+def summary(prediction):
+    return [(r["college_id"], r["branch"], r["closing_rank"]) for r in prediction["results"]]
+
+
+def test_predict_returns_admitting_colleges_most_selective_first():
+    prediction = make_index().predict(800, "JEE Main", category="GEN")
+    assert prediction["year"] == 2024
+    assert summary(prediction) == [("a", "CSE", 900), ("b", "CSE", 1500), ("b", "ECE", 2500), ("c", "CSE", 3000)]
+    assert prediction["results"][0]["round"] == 2
+    assert prediction["results"][0]["margin"] == 100
+    assert prediction["total"] == 4
+
+
+def test_limit_truncates_results_but_not_total():
+    prediction = make_index().predict(100, "JEE Main", category="GEN", limit=2)
+    assert summary(prediction) == [("d", "CSE", 200), ("a", "CSE", 900)]
+    assert prediction["total"] == 5
+
+
+def test_missing_category_means_any_category():
+    prediction = make_index().predict(2000, "JEE Main")
+    assert summary(prediction) == [("b", "ECE", 2500), ("c", "CSE", 3000), ("e", "CSE", 4000)]
+    assert [r["category"] for r in prediction["results"]] == ["GEN", "GEN", "OBC"]
+
+
+def test_branch_and_year_filters():
+    index = make_index()
+    assert summary(index.predict(100, "JEE Main", category="GEN", branch="ECE")) == [("b", "ECE", 2500)]
+    assert summary(index.predict(100, "JEE Main", year=2023)) == [("f", "CSE", 9000)]
+    assert index.predict(100, "CAT") == {"year": None, "total": 0, "results": []}
+
+
+def test_unknown_colleges_are_not_indexed_or_counted():
+    index = make_index(college_ids={"a", "c"})
+    prediction = index.predict(100, "JEE Main", category="GEN")
+    assert summary(prediction) == [("a", "CSE", 900), ("c", "CSE", 3000)]
+    assert prediction["total"] == 2
+
+
+def test_incremental_add_keeps_one_entry_per_college():
+    index = make_index()
+    # a gets a more lenient round, d a stricter one (ignored), h is new
+    assert index.apply([row("a", 1100, round_=3), row("d", 100, round_=2), row("h", 1200)], 1, 2)
+    prediction = index.predict(150, "JEE Main", category="GEN")
+    assert summary(prediction) == [
+        ("d", "CSE", 200), ("a", "CSE", 1100), ("h", "CSE", 1200), ("b", "CSE", 1500), ("b", "ECE", 2500), ("c", "CSE", 3000),
+    ]
+    assert prediction["results"][1]["round"] == 3
+    assert not index.apply([row("z", 1)], 1, 3)  # stale: another writer got in between
@@ -0,0 +1,25 @@
+import asyncio
+from datetime import datetime
+
+ROW = {"college_id": "trend-c1", "exam": "JEE Main", "category": "General", "branch": "CSE", "round": 1}
+
+
+def test_stale_trend_write_retries_instead_of_overwriting(server):
+    async def scenario():
+        await server.db.cutoff_trends.create_index(
+            [("college_id", 1), ("exam", 1), ("category", 1), ("branch", 1)], unique=True)
+        key = server.trend_key(ROW)
+        await server._update_cutoff_trends([{**ROW, "year": 2015, "closing_rank": 1200}])
+        # Writer A reads the series, then writer B lands 2016 before A writes 2017
+        stale = await server.db.cutoff_trends.find_one({"college_id": "trend-c1"}, {"_id": 0, "series": 1, "rev": 1})
+        await server._update_cutoff_trends([{**ROW, "year": 2016, "closing_rank": 1100}])
+        await server._update_cutoff_trend(key, [{**ROW, "year": 2017, "closing_rank": 1000}], stale, datetime.utcnow())
+        # A first insert that lost the race to another writer merges into its document
+        await server._update_cutoff_trend(key, [{**ROW, "year": 2018, "closing_rank": 900}], None, datetime.utcnow())
+        return await server.db.cutoff_trends.find({"college_id": "trend-c1"}).to_list(length=None)
+
+    docs = asyncio.run(scenario())
+    assert len(docs) == 1
+    assert [p["year"] for p in docs[0]["series"]] == [2015, 2016, 2017, 2018]
+    assert docs[0]["rev"] == 4
+    assert docs[0]["direction"] == "harder"
@@ -0,0 +1,125 @@
+import asyncio
+import json
+import csv
+import gzip
+import io
+import zlib
+
+import pytest
+
+from exports import gzip_stream, stream_csv
+
+ROWS = [
+    {"college_id": "export-c1", "year": 2024, "exam": "JEE Main", "category": "GEN", "branch": "CSE", "round": 1, "closing_rank": 1500},
+    {"college_id": "export-c1", "year": 2023, "exam": "JEE Main", "category": "GEN", "branch": "CSE", "round": 2,
+     "closing_rank": 1800, "closing_percentile": 99.2},
+]
+
+
+class Cursor:
+    """Async cursor stand-in that records how many documents were fetched"""
+
+    def __init__(self, docs):
+        self.docs, self.fetched = docs, 0
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.fetched == len(self.docs):
+            raise StopAsyncIteration
+        self.fetched += 1
+        return self.docs[self.fetched - 1]
+
+
+@pytest.fixture
+def cutoffs(api):
+    assert api.post("/api/cutoffs/bulk", json=ROWS).status_code == 200
+    return api
+
+
+def test_csv_export_streams_every_row(cutoffs):
+    res = cutoffs.get("/api/cutoffs/export", params={"college_id": "export-c1", "gzip": False})
+    assert res.headers["content-type"].startswith("text/csv")
+    assert "content-encoding" not in res.headers
+    rows = list(csv.DictReader(io.StringIO(res.text)))
+    assert [(r["year"], r["round"], r["closing_rank"], r["closing_percentile"]) for r in rows] == [
+        ("2024", "1", "1500", ""), ("2023", "2", "1800", "99.2"),
+    ]
+
+
+def test_gzip_csv_export_round_trips(cutoffs):
+    plain = cutoffs.get("/api/cutoffs/export", params={"college_id": "export-c1", "gzip": False}).content
+    with cutoffs.stream("GET", "/api/cutoffs/export", params={"college_id": "export-c1", "gzip": True}) as res:
+        assert res.headers["content-encoding"] == "gzip"
+        raw = b"".join(res.iter_raw())
+    assert gzip.decompress(raw) == plain
+
+
+def test_csv_export_negotiates_gzip_from_accept_encoding(cutoffs):
+    with cutoffs.stream("GET", "/api/cutoffs/export", params={"college_id": "export-c1"}, headers={"Accept-Encoding": "gzip"}) as res:
+        assert res.headers.get("content-encoding") == "gzip"
+    with cutoffs.stream("GET", "/api/cutoffs/export", params={"college_id": "export-c1"}, headers={"Accept-Encoding": "identity"}) as res:
+        assert "content-encoding" not in res.headers
+
+
+def test_csv_stream_sends_the_header_first_and_one_chunk_per_batch():
+    async def scenario():
+        cursor = Cursor([{"id": str(i), "year": 2024} for i in range(5)])
+        chunks = stream_csv(cursor, ["id", "year"], batch_size=2)
+        header = await chunks.__anext__()
+        fetched_before_header = cursor.fetched
+        rest = [chunk async for chunk in chunks]
+        return header, fetched_before_header, rest
+
+    header, fetched, rest = asyncio.run(scenario())
+    assert header == b"id,year\r\n" and fetched == 0
+    assert [chunk.count(b"\n") for chunk in rest] == [2, 2, 1]
+
+
+def test_gzip_stream_flushes_each_chunk():
+    async def scenario():
+        async def chunks():
+            yield b"a,b\r\n"
+            yield b"1,2\r\n"
+
+        return [part async for part in gzip_stream(chunks())]
+
+    parts = asyncio.run(scenario())
+    decoder = zlib.decompressobj(31)
+    assert decoder.decompress(parts[0]) == b"a,b\r\n"  # readable before the stream ends
+    assert gzip.decompress(b"".join(parts)) == b"a,b\r\n1,2\r\n"
+
+
+def test_ndjson_export_has_typed_values(cutoffs):
+    res = cutoffs.get("/api/cutoffs/export", params={"college_id": "export-c1", "format": "ndjson", "gzip": False})
+    assert res.headers["content-type"].startswith("application/x-ndjson")
+    rows = [json.loads(line) for line in res.text.splitlines()]
+    assert [(r["year"], r["round"], r["closing_rank"], r["closing_percentile"]) for r in rows] == [
+        (2024, 1, 1500, None), (2023, 2, 1800, 99.2),
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["parquet", "arrow"])
+def test_columnar_exports_round_trip_with_typed_columns(cutoffs, fmt):
+    pa = pytest.importorskip("pyarrow")
+    res = cutoffs.get("/api/cutoffs/export", params={"college_id": "export-c1", "format": fmt, "gzip": True})
+    assert "content-encoding" not in res.headers  # already compressed internally
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        table = pq.read_table(io.BytesIO(res.content))
+    else:
+        table = pa.ipc.open_stream(res.content).read_all()
+    assert table.schema.field("year").type == pa.int32()
+    assert table.schema.field("closing_rank").type == pa.int64()
+    assert table.schema.field("closing_percentile").type == pa.float64()
+    assert table.column("closing_rank").to_pylist() == [1500, 1800]
+    assert table.column("closing_percentile").to_pylist() == [None, 99.2]
+
+
+def test_empty_columnar_export_still_has_the_schema(api):
+    pa = pytest.importorskip("pyarrow")
+    res = api.get("/api/seats/export", params={"college_id": "no-such-college", "format": "arrow"})
+    table = pa.ipc.open_stream(res.content).read_all()
+    assert table.num_rows == 0
+    assert table.schema.field("intake").type == pa.int32()
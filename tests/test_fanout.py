@@ -0,0 +1,46 @@
+import asyncio
+
+import pytest
+
+
+def test_gather_bounded_keeps_order_and_caps_concurrency(server):
+    running, peak = 0, 0
+
+    async def call(value, delay):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(delay)
+        running -= 1
+        return value
+
+    async def scenario():
+        return await server._gather_bounded(*(call(i, 0.01 * (5 - i)) for i in range(5)), limit=2)
+
+    assert asyncio.run(scenario()) == [0, 1, 2, 3, 4]
+    assert peak == 2
+
+
+def test_gather_bounded_cancels_the_rest_when_one_call_fails(server):
+    cancelled, finished = [], []
+
+    async def slow(name):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append(name)
+            raise
+        finished.append(name)
+
+    async def fail():
+        await asyncio.sleep(0)
+        raise ValueError("boom")
+
+    async def scenario():
+        with pytest.raises(ValueError, match="boom"):
+            await asyncio.wait_for(server._gather_bounded(slow("running"), fail(), slow("waiting"), limit=2), timeout=1)
+
+    asyncio.run(scenario())
+    # The error surfaces at once (not after 5s), and no sibling call is left to finish
+    assert "running" in cancelled
+    assert finished == []
@@ -0,0 +1,62 @@
+import pytest
+
+from fuzzy_dedupe import FUZZY_THRESHOLD, best_match, city_tokens, college_signature, name_tokens, weighted_jaccard
+
+
+def similarity(a, b, city=""):
+    return weighted_jaccard(name_tokens(a), name_tokens(b), city_tokens(city))
+
+
+@pytest.mark.parametrize("a, b, city", [
+    ("IIT Bombay", "Indian Institute of Technology Bombay", "Mumbai"),
+    ("Govt. Engg. College", "Government Engineering College", "Thrissur"),
+    ("Amity University", "Amity University Noida", "Noida"),
+])
+def test_same_college_variants_match(a, b, city):
+    assert similarity(a, b, city) >= FUZZY_THRESHOLD
+
+
+@pytest.mark.parametrize("a, b, city", [
+    ("IIIT Delhi", "Indian Institute of Technology Delhi", "New Delhi"),
+    ("IIIT Delhi", "IIT Delhi", "New Delhi"),
+    ("National Institute of Technology", "National Institute of Fashion Technology", "Patna"),
+    ("Government Engineering College", "Government Polytechnic College", "Thrissur"),
+])
+def test_distinct_colleges_with_shared_boilerplate_do_not_match(a, b, city):
+    assert similarity(a, b, city) < FUZZY_THRESHOLD
+
+
+def test_best_match_picks_closest_candidate_above_threshold():
+    tokens = name_tokens("IIT Delhi")
+    candidates = [
+        ({"id": "iiit"}, name_tokens("Indraprastha Institute of Information Technology Delhi")),
+        ({"id": "iit"}, name_tokens("Indian Institute of Technology, Delhi")),
+    ]
+    ref, score = best_match(tokens, candidates, common=city_tokens("Delhi"))
+    assert ref["id"] == "iit" and score == 1.0
+    assert best_match(name_tokens("IIIT Delhi"), candidates[1:], common=city_tokens("Delhi")) is None
+
+
+def test_signatures_share_a_band_for_abbreviated_names():
+    a = college_signature({"name": "IIT Bombay", "city": "Bombay", "state": "Maharashtra"})
+    b = college_signature({"name": "Indian Institute of Technology Bombay", "city": "Mumbai", "state": "Maharashtra"})
+    assert set(a["band_keys"]) & set(b["band_keys"])
+
+
+def test_import_counts_exact_and_fuzzy_duplicates_once(api):
+    body = {"colleges": [
+        {"name": "IIT Bombay", "city": "Mumbai", "state": "Maharashtra"},
+        {"name": "IIT Bombay", "city": "Mumbai", "state": "Maharashtra"},
+        {"name": "Indian Institute of Technology Bombay", "city": "Mumbai", "state": "Maharashtra"},
+        {"name": "IIIT Bombay", "city": "Mumbai", "state": "Maharashtra"},
+    ]}
+    report = api.post("/api/colleges/bulk", json=body, params={"fuzzy": "skip"}).json()
+    assert report["inserted"] == 2
+    assert report["skipped"] == 1
+    assert report["possible_duplicates"] == 1
+    assert report["skipped_fuzzy"] == 1
+
+    again = api.post("/api/colleges/bulk", json=body, params={"fuzzy": "skip"}).json()
+    assert again["inserted"] == 0
+    assert again["skipped"] == 3
+    assert again["skipped_fuzzy"] == 1
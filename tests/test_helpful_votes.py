@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+from helpful_votes import HelpfulVoteBuffer
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+class Flaky:
+    """Collection proxy whose `method` raises on its next `failures` calls matching `when`"""
+
+    def __init__(self, collection, method, failures=1, when=lambda *args: True):
+        self.collection, self.method, self.failures, self.when = collection, method, failures, when
+
+    def __getattr__(self, name):
+        attr = getattr(self.collection, name)
+        if name != self.method:
+            return attr
+
+        async def call(*args, **kwargs):
+            if self.failures and self.when(*args):
+                self.failures -= 1
+                raise RuntimeError(f"{name} failed")
+            return await attr(*args, **kwargs)
+        return call
+
+
+async def make_buffer(reviews=None, votes=None, **kwargs):
+    db = mongomock_motor.AsyncMongoMockClient()["helpful_test"]
+    await db.reviews.delete_many({})
+    await db.votes.delete_many({})
+    await db.reviews.insert_many([{"id": "r1", "helpful_count": 0}, {"id": "r2", "helpful_count": 0}])
+    buffer = HelpfulVoteBuffer(reviews(db.reviews) if reviews else db.reviews, votes(db.votes) if votes else db.votes, **kwargs)
+    await buffer.ensure_indexes()
+    return db, buffer
+
+
+async def counts(db):
+    return {r["id"]: r["helpful_count"] async for r in db.reviews.find({})}
+
+
+def test_user_votes_are_counted_once_across_flushes():
+    async def scenario():
+        db, buffer = await make_buffer()
+        assert await buffer.record("r1", "u1")
+        assert not await buffer.record("r1", "u1")
+        await buffer.record("r1")
+        assert await buffer.flush() == 2
+        await buffer.record("r1", "u1")
+        assert await buffer.flush() == 0
+        return await counts(db)
+
+    assert asyncio.run(scenario()) == {"r1": 2, "r2": 0}
+
+
+def test_repeat_vote_after_a_flush_is_not_counted(server, api, run_app):
+    run_app(server.db.reviews.insert_one({"id": "helpful-api", "college_id": "c1", "helpful_count": 0}))
+    first = api.post("/api/reviews/helpful-api/helpful", params={"user_id": "u1"}).json()
+    run_app(server.helpful_votes.flush())
+    repeat = api.post("/api/reviews/helpful-api/helpful", params={"user_id": "u1"}).json()
+    assert (first["counted"], repeat["counted"]) == (True, False)
+
+
+def test_failed_increment_is_retried_without_losing_counts():
+    async def scenario():
+        db, buffer = await make_buffer(reviews=lambda c: Flaky(c, "bulk_write"))
+        await buffer.record("r1", "u1")
+        await buffer.record("r2", "u1")
+        await buffer.record("r2")
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        assert await counts(db) == {"r1": 0, "r2": 0}
+        assert await buffer.flush() == 3
+        return await counts(db)
+
+    assert asyncio.run(scenario()) == {"r1": 1, "r2": 2}
+
+
+def test_interrupted_flush_is_not_applied_twice():
+    # The increment lands but clearing the markers' claim fails, as if the process died in between
+    def clearing(filter_, update):
+        return "$unset" in update
+
+    async def scenario():
+        db, buffer = await make_buffer(votes=lambda c: Flaky(c, "update_many", when=clearing))
+        await buffer.record("r1", "u1")
+        await buffer.record("r1", "u2")
+        with pytest.raises(RuntimeError):
+            await buffer.flush()
+        assert await counts(db) == {"r1": 2, "r2": 0}
+        await buffer.record("r1", "u3")
+        assert await buffer.flush() == 1  # the re-applied claim is a no-op on the review and isn't counted
+        assert await db.votes.count_documents({"state": {"$exists": True}}) == 0
+        return await counts(db)
+
+    assert asyncio.run(scenario()) == {"r1": 3, "r2": 0}
+
+
+def test_full_buffer_starts_a_single_tracked_flush():
+    async def scenario():
+        db, buffer = await make_buffer(max_pending=2)
+        await buffer.record("r1", "u1")
+        await buffer.record("r1", "u2")
+        task = buffer._flush_task
+        await buffer.record("r2", "u3")
+        assert buffer._flush_task is task
+        await buffer.stop()
+        return await counts(db)
+
+    assert asyncio.run(scenario()) == {"r1": 2, "r2": 1}
+
+
+def test_votes_for_a_deleted_review_are_not_reported_as_applied():
+    async def scenario():
+        db, buffer = await make_buffer()
+        await buffer.record("r1", "u1")
+        await buffer.record("gone", "u1")
+        await buffer.record("gone")
+        applied = await buffer.flush()
+        return applied, await db.votes.count_documents({"state": {"$exists": True}})
+
+    assert asyncio.run(scenario()) == (1, 0)
+
+
+def test_helpful_flush_revalidates_only_the_voted_college(server, api, run_app):
+    run_app(server.db.reviews.insert_many([
+        {"id": "etag-a", "college_id": "etag-college-a", "user_id": "w", "helpful_count": 0, "helpful_score": 0},
+        {"id": "etag-b", "college_id": "etag-college-b", "user_id": "w", "helpful_count": 0, "helpful_score": 0},
+    ]))
+    run_app(server.db.colleges.insert_many([{"id": "etag-college-a"}, {"id": "etag-college-b"}]))
+    before = {cid: api.get(f"/api/reviews/{cid}").headers["etag"] for cid in ("etag-college-a", "etag-college-b")}
+
+    api.post("/api/reviews/etag-a/helpful", params={"user_id": "u1"})
+    run_app(server.helpful_votes.flush())
+
+    def status(cid):
+        return api.get(f"/api/reviews/{cid}", headers={"If-None-Match": before[cid]}).status_code
+
+    assert status("etag-college-a") == 200
+    assert status("etag-college-b") == 304
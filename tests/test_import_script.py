@@ -0,0 +1,97 @@
+import argparse
+import io
+
+import pytest
+
+pd = pytest.importorskip("pandas")
+np = pytest.importorskip("numpy")
+
+from scripts import import_colleges  # noqa: E402
+
+
+def columnar_args():
+    return argparse.Namespace(
+        file="in.csv", url=None, delimiter=",", name_col="Name", city_col="City", state_col="State",
+        website_col=None, university_type_col=None, courses_col=None,
+    )
+
+
+def test_columnar_dedupe_keeps_hashes_that_only_differ_past_float_precision(monkeypatch):
+    # Equal as float64, distinct as uint64: the second row is a different college
+    hashes = iter([np.array([2**63 + 1], dtype=np.uint64), np.array([2**63 + 2], dtype=np.uint64)])
+    monkeypatch.setattr(import_colleges, "_dedupe_hashes", lambda frame: next(hashes))
+    monkeypatch.setattr(import_colleges, "COLUMNAR_READ_ROWS", 1)
+    data = "Name,City,State\nFirst College,Pune,Maharashtra\nSecond College,Pune,Maharashtra\n"
+    monkeypatch.setattr(import_colleges, "open_input", lambda args: io.BytesIO(data.encode()))
+
+    records = list(import_colleges.iter_records_columnar(columnar_args()))
+    assert [r["name"] for r in records] == ["First College", "Second College"]
+
+
+def test_columnar_dedupe_drops_repeats_across_chunks(monkeypatch):
+    monkeypatch.setattr(import_colleges, "COLUMNAR_READ_ROWS", 2)
+    data = "Name,City,State\nDup  College,Pune,Maharashtra\nOther,Agra,Uttar Pradesh\ndup college,pune,MAHARASHTRA\n"
+    monkeypatch.setattr(import_colleges, "open_input", lambda args: io.BytesIO(data.encode()))
+
+    assert [r["name"] for r in import_colleges.iter_records_columnar(columnar_args())] == ["Dup  College", "Other"]
+
+
+def upload_args(tmp_path, **overrides):
+    args = dict(
+        file=None, url="http://example.test/colleges.csv", backend="http://backend.test", workers=2, chunk_size=2,
+        retries=2, backoff=0.0, timeout=1.0, checkpoint=str(tmp_path / "import.checkpoint.json"), resume=False,
+    )
+    return argparse.Namespace(**{**args, **overrides})
+
+
+def test_iter_chunks_offsets_are_stable():
+    rows = [{"name": str(i)} for i in range(5)]
+    assert [(offset, len(chunk)) for offset, chunk in import_colleges.iter_chunks(iter(rows), 2)] == [(0, 2), (2, 2), (4, 1)]
+
+
+def test_resume_skips_checkpointed_chunks_and_retries_failed_ones(tmp_path, monkeypatch):
+    rows = [{"name": f"College {i}"} for i in range(5)]
+    sent, fail_once = [], {"College 2"}
+
+    def fake_upload(chunk, args):
+        names = [r["name"] for r in chunk]
+        if fail_once & set(names):
+            fail_once.clear()
+            raise import_colleges.RetryableUploadError("HTTP 503")
+        sent.append(names[0])
+        return {"inserted": len(chunk)}
+
+    monkeypatch.setattr(import_colleges, "upload_chunk", fake_upload)
+    first = import_colleges.upload_parallel(iter(rows), upload_args(tmp_path))
+    assert [c["offset"] for c in first["failed_chunks"]] == [2]
+    assert first["rows_uploaded"] == 3 and first["inserted"] == 3
+
+    sent.clear()
+    second = import_colleges.upload_parallel(iter(rows), upload_args(tmp_path, resume=True))
+    assert sent == ["College 2"]
+    assert second["chunks_resumed"] == 2 and second["failed_chunks"] == []
+    assert second["inserted"] == 5  # totals carry over from the first run
+
+
+def test_checkpoint_refuses_a_different_chunk_size(tmp_path, monkeypatch):
+    monkeypatch.setattr(import_colleges, "upload_chunk", lambda chunk, args: {"inserted": len(chunk)})
+    import_colleges.upload_parallel(iter([{"name": "A"}]), upload_args(tmp_path))
+    with pytest.raises(SystemExit, match="chunk-size"):
+        import_colleges.upload_parallel(iter([{"name": "A"}]), upload_args(tmp_path, chunk_size=3, resume=True))
+
+
+def test_upload_chunk_retries_server_errors(monkeypatch):
+    requests = pytest.importorskip("requests")
+    statuses = iter([503, 429, 200])
+
+    class Session:
+        def post(self, url, data, headers, timeout):
+            res = requests.Response()
+            res.status_code = next(statuses)
+            res._content = b'{"inserted": 1}'
+            return res
+
+    monkeypatch.setattr(import_colleges, "_session", Session)
+    monkeypatch.setattr(import_colleges.time, "sleep", lambda s: None)
+    args = argparse.Namespace(backend="http://backend.test", retries=2, backoff=0.0, timeout=1.0)
+    assert import_colleges.upload_chunk([{"name": "A"}], args) == {"inserted": 1}
@@ -0,0 +1,108 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from jobs import JobRunner
+
+mongomock_motor = pytest.importorskip("mongomock_motor")
+
+
+async def make_collection(name):
+    collection = mongomock_motor.AsyncMongoMockClient()["jobs_test"][name]
+    await collection.delete_many({})
+    return collection
+
+
+def make_runner(collection, owner, calls, rerunnable=True, **kwargs):
+    async def handler(params, job):
+        calls.append(owner)
+        await asyncio.sleep(params.get("sleep", 0))
+        return {"by": owner}
+
+    runner = JobRunner(collection, owner=owner, persist_interval=0.01, **kwargs)
+    runner.register("work", handler, rerunnable=rerunnable)
+    return runner
+
+
+async def running_job(collection, job_id, owner, lease_expires_at):
+    await collection.insert_one({
+        "id": job_id, "kind": "work", "params": {}, "status": "running",
+        "owner": owner, "lease_expires_at": lease_expires_at, "created_at": datetime.utcnow(),
+    })
+
+
+def test_two_runners_claim_a_queued_job_once():
+    async def scenario():
+        collection = await make_collection("claim")
+        calls = []
+        first, second = make_runner(collection, "a", calls), make_runner(collection, "b", calls)
+        doc = await first.submit("work", {})
+        await second.recover()  # sees the same queued job
+        await asyncio.gather(*first._tasks.values(), *second._tasks.values())
+        return calls, await first.get(doc["id"])
+
+    calls, job = asyncio.run(scenario())
+    assert calls == ["a"]
+    assert job["status"] == "completed" and job["owner"] == "a" and job["result"] == {"by": "a"}
+
+
+def test_recover_leaves_a_live_leased_job_alone():
+    async def scenario():
+        collection = await make_collection("live")
+        await running_job(collection, "j1", "other", datetime.utcnow() + timedelta(minutes=5))
+        calls = []
+        runner = make_runner(collection, "restarted", calls)
+        requeued = await runner.recover()
+        return requeued, calls, await runner.get("j1")
+
+    requeued, calls, job = asyncio.run(scenario())
+    assert requeued == 0 and calls == []
+    assert job["status"] == "running" and job["owner"] == "other"
+
+
+def test_recover_takes_over_expired_leases():
+    async def scenario():
+        collection = await make_collection("expired")
+        past = datetime.utcnow() - timedelta(seconds=1)
+        await running_job(collection, "rerun", "dead", past)
+        await running_job(collection, "legacy", "dead", None)  # written before leases existed
+        calls = []
+        runner = make_runner(collection, "new", calls)
+        requeued = await runner.recover()
+        await asyncio.gather(*runner._tasks.values())
+        return requeued, calls, await runner.get("rerun"), await runner.get("legacy")
+
+    requeued, calls, rerun, legacy = asyncio.run(scenario())
+    assert requeued == 2 and calls == ["new", "new"]
+    assert rerun["status"] == "completed" and rerun["owner"] == "new"
+    assert legacy["status"] == "completed"
+
+
+def test_expired_job_that_cannot_rerun_is_interrupted():
+    async def scenario():
+        collection = await make_collection("interrupted")
+        await running_job(collection, "j1", "dead", datetime.utcnow() - timedelta(seconds=1))
+        runner = make_runner(collection, "new", [], rerunnable=False)
+        await runner.recover()
+        return await runner.get("j1")
+
+    job = asyncio.run(scenario())
+    assert job["status"] == "interrupted" and job["owner"] is None
+
+
+def test_runner_stops_a_job_whose_lease_was_taken_over():
+    async def scenario():
+        collection = await make_collection("lost")
+        calls = []
+        runner = make_runner(collection, "a", calls)
+        doc = await runner.submit("work", {"sleep": 5})
+        while not calls:
+            await asyncio.sleep(0.01)
+        # Another worker decided the lease expired and took the job over
+        await collection.update_one({"id": doc["id"]}, {"$set": {"owner": "b"}})
+        await asyncio.wait_for(asyncio.gather(*runner._tasks.values()), timeout=2)
+        return await runner.get(doc["id"])
+
+    job = asyncio.run(scenario())
+    assert job["owner"] == "b" and job["status"] == "running" and job["result"] is None
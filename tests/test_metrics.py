@@ -0,0 +1,50 @@
+from types import SimpleNamespace
+
+from metrics import Histogram, MetricsRegistry, MongoCommandMetrics
+
+
+def test_requests_are_labelled_by_route_template(api):
+    api.get("/api/colleges/metrics-missing-1")
+    api.get("/api/colleges/metrics-missing-2")
+    api.get("/no/such/path")
+    text = api.get("/metrics").text
+
+    assert 'http_requests_total{method="GET",route="/api/colleges/{college_id}",status="404"} 2' in text
+    assert 'route="unmatched",status="404"' in text
+    assert "metrics-missing" not in text
+    assert 'http_request_duration_seconds_count{method="GET",route="/api/colleges/{college_id}"} 2' in text
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("latency", "Latency.", ("route",), (0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(("/a",), value)
+    assert histogram.render()[2:] == [
+        'latency_bucket{route="/a",le="0.1"} 2',
+        'latency_bucket{route="/a",le="1"} 3',
+        'latency_bucket{route="/a",le="+Inf"} 4',
+        'latency_sum{route="/a"} 3.65',
+        'latency_count{route="/a"} 4',
+    ]
+
+
+def test_mongo_listener_attributes_get_more_to_its_collection():
+    registry = MetricsRegistry()
+    listener = MongoCommandMetrics(registry)
+
+    def event(name, command=None, **extra):
+        return SimpleNamespace(command_name=name, command=command or {}, connection_id=("h", 1), request_id=extra.pop("request_id", 1),
+                               duration_micros=1500, **extra)
+
+    listener.started(event("find", {"find": "colleges"}))
+    listener.succeeded(event("find", reply={"cursor": {"firstBatch": [{}, {}]}}))
+    listener.started(event("getMore", {"getMore": 1, "collection": "colleges"}, request_id=2))
+    listener.failed(event("getMore", request_id=2))
+    listener.started(event("ping", {"ping": 1}, request_id=3))
+    listener.succeeded(event("ping", request_id=3, reply={}))
+    text = registry.render()
+
+    assert 'mongodb_commands_total{collection="colleges",command="find",outcome="succeeded"} 1' in text
+    assert 'mongodb_commands_total{collection="colleges",command="getMore",outcome="failed"} 1' in text
+    assert 'mongodb_documents_returned_sum{collection="colleges",command="find"} 2' in text
+    assert "ping" not in text
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+
+from reviews import (
+    accumulate_review_stats, helpful_score, phrase_terms, review_stats_increments, review_term_increments, summarize_review_stats,
+    terms_to_prune, top_terms,
+)
+
+
+def test_review_stats_increments_fold_each_rated_dimension():
+    inc = review_stats_increments({"rating_overall": 4.4, "rating_academics": 0, "rating_infra": None})
+    assert inc == {
+        "review_stats.count": 1,
+        "review_stats.overall.count": 1,
+        "review_stats.overall.sum": 4.4,
+        "review_stats.overall.hist.4": 1,
+        "review_stats.academics.count": 1,
+        "review_stats.academics.sum": 0.0,
+        "review_stats.academics.hist.1": 1,
+    }
+
+
+def test_accumulated_stats_summarize_to_averages_and_histogram():
+    stats = {}
+    for overall, placements in ((5, 4), (4, None), (3.6, 2)):
+        accumulate_review_stats(stats, {"rating_overall": overall, "rating_placements": placements})
+    summary = summarize_review_stats(stats)
+    assert summary["count"] == 3
+    assert summary["averages"]["overall"] == 4.2
+    assert summary["averages"]["placements"] == 3.0
+    assert summary["averages"]["faculty"] is None
+    assert summary["histogram"] == {"1": 0, "2": 0, "3": 0, "4": 2, "5": 1}
+
+
+def test_review_write_changes_detail_etag_but_not_catalog_version(server, api, run_app):
+    api.post("/api/colleges/bulk", json={"colleges": [{"name": "Review Target College", "city": "Surat", "state": "Gujarat"}]})
+    college_id = run_app(server.db.colleges.find_one({"name": "Review Target College"}))["_id"]
+    detail = api.get(f"/api/colleges/{college_id}")
+    search = api.get("/api/colleges/search", params={"q": "Review Target"})
+    catalog_version = run_app(server._get_version("colleges"))
+
+    review = {"college_id": str(college_id), "user_id": "u1", "title": "Solid", "body": "Good labs", "rating_overall": 4}
+    assert api.post("/api/reviews", json=review).status_code == 200
+
+    assert run_app(server._get_version("colleges")) == catalog_version
+    assert api.get(f"/api/colleges/{college_id}", headers={"If-None-Match": detail.headers["etag"]}).status_code == 200
+    updated = api.get(f"/api/colleges/{college_id}").json()
+    assert updated["review_summary"]["count"] == 1
+    assert updated["version"] == detail.json()["version"]
+    # Search cards carry the summary too, so their ETag follows the reviews stamp
+    assert api.get("/api/colleges/search", params={"q": "Review Target"}, headers={"If-None-Match": search.headers["etag"]}).status_code == 200
+    card = api.get("/api/colleges/search", params={"q": "Review Target"}).json()["colleges"][0]
+    assert card["review_summary"]["count"] == 1
+
+
+def test_phrase_terms_drop_stopwords_and_add_pairs():
+    assert phrase_terms("Great hostel food, very good WiFi") == ["hostel", "food", "wifi", "hostel food", "food wifi"]
+
+
+def test_review_term_increments_count_a_term_once_per_review():
+    inc = review_term_increments({"pros": ["Hostel food", "hostel rooms"], "cons": ["Strict attendance"]})
+    assert inc["review_count"] == 1
+    assert inc["pros.hostel"] == 1
+    assert {"pros.food", "pros.rooms", "pros.hostel food", "pros.hostel rooms", "cons.strict attendance"} <= set(inc)
+
+
+def test_top_terms_and_pruning_agree_on_ranking():
+    counts = {"labs": 5, "hostel": 9, "faculty": 5, "canteen": 1, "sports": 2}
+    assert top_terms(counts, 3) == [
+        {"term": "hostel", "count": 9}, {"term": "faculty", "count": 5}, {"term": "labs", "count": 5},
+    ]
+    assert sorted(terms_to_prune(counts, keep=3)) == ["canteen", "sports"]
+    assert terms_to_prune(counts, keep=5) == []
+
+
+def test_term_map_is_pruned_after_enough_writes(server, api, run_app, monkeypatch):
+    monkeypatch.setattr(server, "TERM_PRUNE_EVERY", 3)
+    monkeypatch.setattr(server, "terms_to_prune", lambda counts: terms_to_prune(counts, keep=2))
+    for i, pros in enumerate((["hostel"], ["hostel", "labs"], ["hostel", "labs", "canteen"])):
+        review = {"college_id": "terms-c1", "user_id": f"u{i}", "rating_overall": 4, "pros": pros}
+        assert api.post("/api/reviews", json=review).status_code == 200
+
+    doc = run_app(server.db.review_terms.find_one({"college_id": "terms-c1"}))
+    assert doc["pros"] == {"hostel": 3, "labs": 2}
+    assert doc["writes_since_prune"] == 0
+
+
+def test_rebuild_review_terms_replaces_in_place_and_drops_stale(server, api, run_app):
+    run_app(server.db.review_terms.insert_one({"college_id": "terms-gone", "review_count": 1, "pros": {"x": 1}, "cons": {}}))
+    api.post("/api/reviews", json={"college_id": "terms-c2", "user_id": "u1", "rating_overall": 5, "pros": ["Library"]})
+
+    assert api.post("/api/dev/rebuild-review-terms").status_code == 200
+    assert run_app(server.db.review_terms.find_one({"college_id": "terms-gone"})) is None
+    assert run_app(server.db.review_terms.find_one({"college_id": "terms-c2"}))["pros"] == {"library": 1}
+
+
+def test_helpful_votes_outweigh_a_year_of_recency():
+    old, newer = datetime(2025, 3, 1), datetime(2026, 3, 1)
+    assert helpful_score(9999, old) > helpful_score(0, newer)
+    assert helpful_score(10, old) > helpful_score(0, newer)
+    assert helpful_score(2, old) < helpful_score(2, newer)
+    # A year of recency is worth about 3x (votes + 1)
+    assert helpful_score(1, newer) < helpful_score(7, old)
+
+
+def test_helpful_ordering_of_reviews_with_votes_and_ages():
+    now = datetime(2026, 6, 1)
+    reviews = {
+        "viral_last_year": (500, now - timedelta(days=365)),
+        "useful_last_month": (40, now - timedelta(days=30)),
+        "fresh_unvoted": (0, now),
+        "old_unvoted": (0, now - timedelta(days=700)),
+    }
+    ranked = sorted(reviews, key=lambda name: helpful_score(*reviews[name]), reverse=True)
+    assert ranked == ["viral_last_year", "useful_last_month", "fresh_unvoted", "old_unvoted"]
@@ -0,0 +1,59 @@
+import argparse
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from scripts import generate_synthetic_data as synth  # noqa: E402
+
+
+def synth_args(**overrides):
+    args = dict(
+        seed=7, scale=1.0, colleges=30, cutoffs_per_college=4.0, users=20, reviews=40, favorites=25, events=60,
+        batch_size=16, workers=1, unacknowledged=False, dry_run=True, mongo_url=None, db=None,
+    )
+    return argparse.Namespace(**{**args, **overrides})
+
+
+def test_generated_documents_match_the_api_models(server):
+    gen = synth.Generator(synth_args())
+    batches = list(gen.college_batches())
+    colleges = [doc for batch in batches for doc in batch["colleges"]]
+    assert len(colleges) == 30
+    college_ids = {str(doc["_id"]) for doc in colleges}
+    for doc in colleges:
+        server.College(**doc)
+        assert doc["dedupe_key"] == server.college_dedupe_key(doc["name"], doc["city"], doc["state"])
+
+    for batch in batches:
+        for doc in batch["cutoffs"]:
+            server.CutoffCreate(**doc)
+        for doc in batch["seats"]:
+            server.SeatCreate(**doc)
+        assert {doc["college_id"] for doc in batch["cutoffs"] + batch["seats"]} <= college_ids
+
+    reviews = [doc for docs in gen.review_batches() for doc in docs]
+    assert len(reviews) == 40
+    for doc in reviews:
+        server.ReviewResponse(**doc)
+        assert doc["college_id"] in college_ids
+    for doc in [doc for docs in gen.favorite_batches() for doc in docs]:
+        server.Favorite(**doc)
+
+
+def test_dry_run_counts_every_collection_and_is_reproducible(server):
+    first = synth.run_shard(synth_args(), 0, 1)
+    assert {k: first[k] for k in ("colleges", "reviews", "favorites", "browsing_events")} == {
+        "colleges": 30, "reviews": 40, "favorites": 25, "browsing_events": 60,
+    }
+    assert first["cutoffs"] > 0 and first["seats"] > 0
+
+    a = next(synth.Generator(synth_args()).college_batches())
+    b = next(synth.Generator(synth_args()).college_batches())
+    assert a["colleges"] == b["colleges"] and a["cutoffs"] == b["cutoffs"]
+
+
+def test_shards_split_batches_without_overlap():
+    args = synth_args()
+    ids = [str(doc["_id"]) for shard in range(2) for batch in synth.Generator(args, shard, 2).college_batches() for doc in batch["colleges"]]
+    assert sorted(ids) == sorted(str(oid) for oid in synth.object_ids(1, range(30)))